@@ -0,0 +1,77 @@
+"""
+Track Arrays Module
+Structure-of-arrays mirror of a finalized track's splinePoints for vectorized edits,
+and the compact record used for turns while they are being edited
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Set
+
+import numpy as np
+
+
+@dataclass
+class TrackArrays:
+    """Per-node columns of `finalized_data['splinePoints']`.
+
+    The list of point dicts remains the form shared with the other tabs and written
+    to session files; edits are resolved on these arrays and only the nodes they
+    touch are written back (see TrackViewer.apply_width_patch).
+    """
+    widths: np.ndarray
+    pit_lane_id: np.ndarray  # -1 for main track nodes, otherwise index into pit_lane_names
+    pit_lane_names: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_spline_points(cls, points) -> "TrackArrays":
+        n = len(points)
+        widths = np.fromiter((p.get('width', 12) for p in points), dtype=np.float64, count=n)
+        pit_lane_id = np.full(n, -1, dtype=np.int32)
+        name_ids = {}
+        for i, p in enumerate(points):
+            pit_lane = p.get('pit_lane')
+            if pit_lane is not None:
+                pit_lane_id[i] = name_ids.setdefault(pit_lane, len(name_ids))
+        return cls(widths, pit_lane_id, list(name_ids))
+
+    def __len__(self):
+        return len(self.widths)
+
+    def __getitem__(self, index):
+        """Dict-like view of one node for callers written against splinePoints."""
+        point = {'width': float(self.widths[index])}
+        pit_id = self.pit_lane_id[index]
+        if pit_id >= 0:
+            point['pit_lane'] = self.pit_lane_names[pit_id]
+        return point
+
+    def set_widths(self, indices: np.ndarray, new_width: float):
+        """Set the width of `indices` and of every node in a pit lane they touch.
+
+        A pit lane has a single width (its visual path's widthValue), so touching any
+        of its nodes resizes the whole lane.
+
+        Returns:
+            (names of the pit lanes touched, indices of every node that changed)
+        """
+        pit_ids = self.pit_lane_id[indices]
+        pit_ids = np.unique(pit_ids[pit_ids >= 0])
+        if len(pit_ids):
+            indices = np.union1d(indices, np.flatnonzero(np.isin(self.pit_lane_id, pit_ids)))
+        self.widths[indices] = new_width
+        pit_lanes: Set[str] = {self.pit_lane_names[i] for i in pit_ids.tolist()}
+        return pit_lanes, indices
+
+
+@dataclass(slots=True)
+class TurnRecord:
+    """A turn's node indices and whether it was marked on the inverted (longer) path"""
+    indices: np.ndarray
+    inverted: bool = False
+
+    @classmethod
+    def from_dict(cls, turn_data) -> "TurnRecord":
+        return cls(np.asarray(turn_data['indices'], dtype=np.intp), bool(turn_data.get('inverted', False)))
+
+    def to_dict(self):
+        return {'indices': self.indices.tolist(), 'inverted': self.inverted}
@@ -0,0 +1,70 @@
+"""
+Session Storage Module
+Reads and writes .sark session files.
+
+Current format: a 5-byte magic header followed by a zstd stream of one msgpack
+document. NumPy arrays are stored as raw buffers (dtype + shape + bytes), so bulk
+telemetry columns are copied with memcpy instead of walked value by value.
+Files written before this format (plain pickles) are still readable.
+"""
+import pickle
+from pathlib import Path
+
+import msgpack
+import numpy as np
+import zstandard as zstd
+
+SARK_MAGIC = b"SARK\x02"
+_ND_KEY = "__nd__"
+
+
+def _encode(obj):
+    """msgpack `default` hook for NumPy values."""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == object:
+            # Mixed Python objects (e.g. string columns) have no raw buffer
+            return obj.tolist()
+        arr = np.ascontiguousarray(obj)
+        return {_ND_KEY: 1, "dtype": arr.dtype.str, "shape": list(arr.shape), "data": arr.tobytes()}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+
+def _decode(obj: dict):
+    """msgpack `object_hook` restoring arrays written by `_encode`."""
+    if obj.get(_ND_KEY) == 1:
+        arr = np.frombuffer(obj["data"], dtype=np.dtype(obj["dtype"]))
+        # frombuffer views the immutable msgpack bytes; copy so callers can write
+        return arr.reshape(obj["shape"]).copy()
+    return obj
+
+
+def save_sark(session: dict, file_path: str) -> int:
+    """
+    Write a session dict to a .sark file.
+
+    Returns:
+        Size of the written file in bytes
+    """
+    cctx = zstd.ZstdCompressor(level=3, threads=-1)
+    with open(file_path, "wb") as f:
+        f.write(SARK_MAGIC)
+        with cctx.stream_writer(f, closefd=False) as z:
+            z.write(msgpack.packb(session, use_bin_type=True, default=_encode))
+    return Path(file_path).stat().st_size
+
+
+def load_sark(file_path: str) -> dict:
+    """Read a .sark file written by `save_sark` or by the legacy pickle writer."""
+    with open(file_path, "rb") as f:
+        if f.read(len(SARK_MAGIC)) != SARK_MAGIC:
+            # Legacy .sark files are bare pickles
+            f.seek(0)
+            return pickle.load(f)
+
+        dctx = zstd.ZstdDecompressor()
+        with dctx.stream_reader(f) as reader:
+            unpacker = msgpack.Unpacker(reader, raw=False, object_hook=_decode,
+                                        strict_map_key=False, max_buffer_size=0)
+            return unpacker.unpack()
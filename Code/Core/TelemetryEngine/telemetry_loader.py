@@ -7,9 +7,15 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-import warnings
+import bisect
+import os
+import re
 
-warnings.filterwarnings('ignore')
+try:
+    import pyarrow  # noqa: F401 - enables the multithreaded read_csv engine
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 
 class TelemetryLoader:
@@ -23,9 +29,20 @@ class TelemetryLoader:
         self.vehicles = []
         self.mode = 'raw'  # 'raw' or 'parsed'
         self.parsed_data_cache = {}  # Cache for parsed dataframes
+        self.embedded_columns = {}  # Column arrays restored from a session file, keyed like the cache
         self.parsed_folder = None
         self.parsed_sessions = {} # { 'Race 1': ['Vehicle A', ...], ... }
 
+    @property
+    def parsed_sessions(self) -> Dict[str, List[str]]:
+        return self._parsed_sessions
+
+    @parsed_sessions.setter
+    def parsed_sessions(self, sessions: Dict[str, List[str]]):
+        # Sort race names once per assignment so get_races() is a plain attribute read
+        self._parsed_sessions = sessions
+        self._sorted_races = sorted(sessions.keys())
+
     def load_telemetry_file(self, filepath: str) -> pd.DataFrame:
         """
         Load telemetry CSV file (raw format).
@@ -52,6 +69,7 @@ class TelemetryLoader:
         self.mode = 'parsed'
         self.parsed_folder = Path(folder_path)
         self.parsed_data_cache = {}
+        self.embedded_columns = {}
         self.parsed_sessions = {}
         self.vehicles = []
         
@@ -60,32 +78,39 @@ class TelemetryLoader:
             
         print(f"Scanning parsed folder: {folder_path}")
         
-        # Scan for Race directories
-        for race_dir in self.parsed_folder.iterdir():
-            if race_dir.is_dir():
-                race_name = race_dir.name
-                self.parsed_sessions[race_name] = []
+        # Scan for Race directories; DirEntry caches the type so no extra stat per entry
+        parsed_sessions = {}
+        vehicles = set()
+        with os.scandir(self.parsed_folder) as race_entries:
+            for race_entry in race_entries:
+                if not race_entry.is_dir():
+                    continue
+                race_name = race_entry.name
+                race_vehicles = []
+                parsed_sessions[race_name] = race_vehicles
                 
                 # Scan for Vehicle directories
-                for vehicle_dir in race_dir.iterdir():
-                    if vehicle_dir.is_dir():
-                        # Check if telemetry file exists
-                        if (vehicle_dir / "telemetry.csv").exists() or (vehicle_dir / "telemetry.parquet").exists():
-                            vid = vehicle_dir.name
-                            self.parsed_sessions[race_name].append(vid)
-                            if vid not in self.vehicles:
-                                self.vehicles.append(vid)
+                with os.scandir(race_entry.path) as vehicle_entries:
+                    for vehicle_entry in vehicle_entries:
+                        if not vehicle_entry.is_dir():
+                            continue
+                        # One listing per vehicle instead of an exists() call per format
+                        with os.scandir(vehicle_entry.path) as file_entries:
+                            file_names = {f.name for f in file_entries}
+                        if "telemetry.csv" in file_names or "telemetry.parquet" in file_names:
+                            bisect.insort(race_vehicles, vehicle_entry.name)
+                            vehicles.add(vehicle_entry.name)
                 
-                self.parsed_sessions[race_name].sort()
-                print(f"  {race_name}: {len(self.parsed_sessions[race_name])} vehicles")
+                print(f"  {race_name}: {len(race_vehicles)} vehicles")
             
-        self.vehicles.sort()
+        self.parsed_sessions = parsed_sessions
+        self.vehicles = sorted(vehicles)
         print(f"Total parsed vehicles: {len(self.vehicles)}")
 
     def get_races(self) -> List[str]:
         """Get list of available races (only in parsed mode)."""
         if self.mode == 'parsed':
-            return sorted(list(self.parsed_sessions.keys()))
+            return self._sorted_races
         return []
 
     def get_vehicles(self, race_id: str = None) -> List:
@@ -111,6 +136,13 @@ class TelemetryLoader:
         
         if cache_key in self.parsed_data_cache:
             df = self.parsed_data_cache[cache_key]
+        elif self.embedded_columns:
+            # Session restored from a .sark file: build the frame on first use
+            df = self._frame_from_embedded(vehicle_id, race_id)
+            if df.empty:
+                print(f"No embedded data for vehicle {vehicle_id}")
+                return df
+            self.parsed_data_cache[cache_key] = df
         else:
             filepath = None
             
@@ -129,9 +161,13 @@ class TelemetryLoader:
                 return pd.DataFrame()
                 
             print(f"Loading parsed file: {filepath}")
-            df = pd.read_csv(filepath)
-            # Parse meta_time
-            if 'meta_time' in df.columns:
+            if HAS_PYARROW:
+                # Arrow parser is multithreaded and reads meta_time as a timestamp directly
+                df = pd.read_csv(filepath, engine="pyarrow")
+            else:
+                df = pd.read_csv(filepath, memory_map=True)
+            # Parse meta_time (already a timestamp when Arrow inferred it)
+            if 'meta_time' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['meta_time']):
                 try:
                     df['meta_time'] = pd.to_datetime(df['meta_time'], format='ISO8601')
                 except ValueError:
@@ -146,6 +182,25 @@ class TelemetryLoader:
             
         return df
 
+    def _frame_from_embedded(self, vehicle_id: str, race_id: str = None) -> pd.DataFrame:
+        if race_id is None:
+            race_id = next((r for r, v in self.parsed_sessions.items() if vehicle_id in v), None)
+        columns = self.embedded_columns.pop(f"{race_id}_{vehicle_id}", None)
+        if not columns:
+            return pd.DataFrame()
+        
+        df = pd.DataFrame(columns)
+        if 'meta_time' in df.columns:
+            if not pd.api.types.is_datetime64_any_dtype(df['meta_time']):
+                try:
+                    df['meta_time'] = pd.to_datetime(df['meta_time'])
+                except ValueError:
+                    pass
+            elif df['meta_time'].dt.tz is None:
+                # Column arrays are saved as UTC datetime64 without tz info
+                df['meta_time'] = df['meta_time'].dt.tz_localize('UTC')
+        return df
+
     def _get_raw_vehicle_data(self, vehicle_id: str, lap: Optional[int] = None) -> pd.DataFrame:
         if self.raw_data is None:
             raise ValueError("No telemetry data loaded.")
@@ -237,6 +292,15 @@ class TelemetryLoader:
             return []
 
 
+# Telemetry exports, e.g. R1_barber_telemetry_data.csv or R1_indianapolis_motor_speedway_telemetry.csv.
+# `prefix` is the shared stem of the matching _lap_time/_lap_start/_lap_end files.
+_TELEMETRY_FILE_RE = re.compile(
+    r"^(?P<prefix>(?:.*_)?R(?P<race>\d)(?:_.*?)?)_telemetry(?:_data)?\.csv$", re.IGNORECASE)
+# Section analysis exports, e.g. 23_AnalysisEnduranceWithSections_Race 1_Anonymized.CSV
+_ANALYSIS_FILE_RE = re.compile(r"AnalysisEnduranceWithSections.*\.csv$", re.IGNORECASE)
+_ANALYSIS_RACE_RE = re.compile(r"Race[ _](?P<race>\d)")
+
+
 class SessionManager:
     """
     Manages race session data by automatically detecting and loading race files from a folder.
@@ -263,70 +327,54 @@ class SessionManager:
         
         print(f"Scanning folder: {folder_path}")
         
+        # Single listing of the folder; every pattern below is matched against these names
+        file_names = {f.name for f in self.folder_path.iterdir() if f.is_file()}
+        
         # Find telemetry files - support multiple naming patterns
-        # Pattern 1: *telemetry_data.csv (e.g., R1_barber_telemetry_data.csv)
+        # Pattern 1: *_telemetry_data.csv (e.g., R1_barber_telemetry_data.csv)
         # Pattern 2: *_telemetry.csv (e.g., R1_indianapolis_motor_speedway_telemetry.csv)
-        telemetry_files = list(self.folder_path.glob("*telemetry_data.csv")) + \
-                         list(self.folder_path.glob("*_telemetry.csv"))
+        telemetry_matches = []
+        analysis_matches = []
+        for name in sorted(file_names):
+            m = _TELEMETRY_FILE_RE.match(name)
+            if m:
+                telemetry_matches.append(m)
+            elif _ANALYSIS_FILE_RE.search(name):
+                analysis_matches.append(name)
         
-        # Remove duplicates if any
-        telemetry_files = list(set(telemetry_files))
-        
-        if not telemetry_files:
-            print("No telemetry files found. Looking for patterns:")
-            print(f"  *telemetry_data.csv: {list(self.folder_path.glob('*telemetry_data.csv'))}")
-            print(f"  *_telemetry.csv: {list(self.folder_path.glob('*_telemetry.csv'))}")
-            print(f"Available files in folder: {[f.name for f in self.folder_path.glob('*.csv')]}")
+        if not telemetry_matches:
+            print("No telemetry files found. Looking for patterns: *_telemetry_data.csv, *_telemetry.csv")
+            print(f"Available files in folder: {sorted(n for n in file_names if n.lower().endswith('.csv'))}")
         else:
-            print(f"Found {len(telemetry_files)} telemetry file(s): {[f.name for f in telemetry_files]}")
+            print(f"Found {len(telemetry_matches)} telemetry file(s): {[m.string for m in telemetry_matches]}")
         
-        for telem_file in telemetry_files:
-            # Extract race number from filename (R1_ or R2_)
-            if 'R1_' in telem_file.name or '_R1_' in telem_file.name:
-                race_num = 1
-            elif 'R2_' in telem_file.name or '_R2_' in telem_file.name:
-                race_num = 2
-            else:
-                continue
+        for m in telemetry_matches:
+            # Race number comes from the R<n>_ token in the filename
+            race_num = int(m.group('race'))
             
             if race_num not in self.sessions:
                 self.sessions[race_num] = {}
             
-            self.sessions[race_num]['telemetry'] = str(telem_file)
+            self.sessions[race_num]['telemetry'] = str(self.folder_path / m.string)
             
-            # Look for associated files
-            # Handle both patterns: R1_track_telemetry_data.csv and R1_track_telemetry.csv
-            if '_telemetry_data.csv' in telem_file.name:
-                prefix = telem_file.name.split('_telemetry_data.csv')[0]
-            else:
-                prefix = telem_file.name.split('_telemetry.csv')[0]
-            
-            lap_time_file = self.folder_path / f"{prefix}_lap_time.csv"
-            if lap_time_file.exists():
-                self.sessions[race_num]['lap_time'] = str(lap_time_file)
-            
-            lap_start_file = self.folder_path / f"{prefix}_lap_start.csv"
-            if lap_start_file.exists():
-                self.sessions[race_num]['lap_start'] = str(lap_start_file)
-            
-            lap_end_file = self.folder_path / f"{prefix}_lap_end.csv"
-            if lap_end_file.exists():
-                self.sessions[race_num]['lap_end'] = str(lap_end_file)
+            # Look for associated files sharing the same prefix
+            prefix = m.group('prefix')
+            for key in ('lap_time', 'lap_start', 'lap_end'):
+                associated = f"{prefix}_{key}.csv"
+                if associated in file_names:
+                    self.sessions[race_num][key] = str(self.folder_path / associated)
         
         # Find analysis files
-        analysis_files = list(self.folder_path.glob("*AnalysisEnduranceWithSections*.CSV"))
-        for analysis_file in analysis_files:
-            if 'Race 1' in analysis_file.name or 'Race_1' in analysis_file.name:
-                race_num = 1
-            elif 'Race 2' in analysis_file.name or 'Race_2' in analysis_file.name:
-                race_num = 2
-            else:
+        for name in analysis_matches:
+            race_match = _ANALYSIS_RACE_RE.search(name)
+            if not race_match:
                 continue
+            race_num = int(race_match.group('race'))
             
             if race_num not in self.sessions:
                 self.sessions[race_num] = {}
             
-            self.sessions[race_num]['analysis'] = str(analysis_file)
+            self.sessions[race_num]['analysis'] = str(self.folder_path / name)
         
         print(f"Found {len(self.sessions)} race session(s)")
         for race_num, files in self.sessions.items():
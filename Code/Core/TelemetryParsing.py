@@ -2,10 +2,16 @@
 Telemetry Parsing Module
 Encapsulates logic to parse raw telemetry CSVs into per-vehicle wide-format CSVs.
 """
+import gc
+import hashlib
+import json
 import pandas as pd
 from pathlib import Path
 from typing import Dict, Optional
 
+# Maps a fingerprint of a raw input folder to the output folder it was last parsed into
+PARSE_CACHE_INDEX = Path.home() / ".cache" / "render3d" / "parsed_outputs.json"
+
 class TelemetryParser:
     """
     Parses raw telemetry CSV files into per-vehicle DataFrames and saves them.
@@ -47,24 +53,35 @@ class TelemetryParser:
         df["telemetry_value"] = df["telemetry_value_numeric"].combine_first(df["telemetry_value"])
         df.drop(columns=["telemetry_value_numeric"], inplace=True)
 
-        # Group by vehicle
+        # The name and id columns repeat a few strings on every row; as categoricals they are
+        # small integer codes, which the per-vehicle subsets below also share
+        df["telemetry_name"] = df["telemetry_name"].astype("category")
+        df["vehicle_id"] = df["vehicle_id"].astype("category")
+
+        # Split into per-vehicle subsets (one take per group), then drop the long-format frame
+        # so only the subsets stay resident while vehicles are pivoted
         vehicles = {}
-        unique_vehicles = df["vehicle_id"].dropna().unique()
+        group_rows = df.groupby("vehicle_id", sort=False, observed=True).indices
+        groups = {vid: df.take(rows) for vid, rows in group_rows.items()}
+        del df, group_rows
+        gc.collect()
         
-        print(f"Parsing {len(unique_vehicles)} vehicles from {csv_path.name}...")
+        print(f"Parsing {len(groups)} vehicles from {csv_path.name}...")
 
-        for vid in unique_vehicles:
-            subset = df[df["vehicle_id"] == vid].copy()
-            subset.sort_values("meta_time", inplace=True)
+        for vid in list(groups):
+            # pop so each raw subset is released as soon as its vehicle is written
+            subset = groups.pop(vid)
             if subset.empty:
                 continue
 
-            # Pivot telemetry rows
-            pivot = subset.pivot_table(index="meta_time", columns="telemetry_name", values="telemetry_value", aggfunc="last")
+            # Pivot telemetry rows (pivot_table sorts the meta_time index, so no pre/post sort is needed)
+            pivot = subset.pivot_table(index="meta_time", columns="telemetry_name", values="telemetry_value",
+                                       aggfunc="last", observed=True)
+            # Plain labels, so meta_time/elapsed_seconds/lap can be added next to the categories
+            pivot.columns = pivot.columns.astype(object)
             pivot = pivot.reset_index()
 
             # Compute elapsed seconds
-            pivot = pivot.sort_values("meta_time")
             pivot["elapsed_seconds"] = (pivot["meta_time"] - pivot["meta_time"].iloc[0]).dt.total_seconds()
 
             # bring lap column if present
@@ -137,3 +154,40 @@ class TelemetryParser:
                 print(f"Error processing {telem_file.name}: {e}")
                 
         return total_vehicles
+
+    def source_key(self, input_folder: str) -> str:
+        """Fingerprint of the raw telemetry files in input_folder (path, name, mtime and size)."""
+        input_path = Path(input_folder).resolve()
+        files = []
+        for telem_file in input_path.glob("*telemetry_data.csv"):
+            st = telem_file.stat()
+            files.append((telem_file.name, st.st_mtime_ns, st.st_size))
+        digest = hashlib.blake2b(repr((str(input_path), sorted(files))).encode(), digest_size=16)
+        return digest.hexdigest()
+
+    def cached_output(self, input_folder: str) -> Optional[Path]:
+        """
+        Output folder of an earlier parse of the same, unchanged raw files, or None.
+        An output folder only counts if its session_info.json (written after parsing) is still there.
+        """
+        try:
+            index = json.loads(PARSE_CACHE_INDEX.read_text())
+        except (OSError, ValueError):
+            return None
+        output_folder = index.get(self.source_key(input_folder))
+        if output_folder and (Path(output_folder) / "session_info.json").exists():
+            return Path(output_folder)
+        return None
+
+    def remember_output(self, input_folder: str, output_folder: str):
+        """Record output_folder as the parse result for the current raw files in input_folder."""
+        try:
+            index = json.loads(PARSE_CACHE_INDEX.read_text())
+        except (OSError, ValueError):
+            index = {}
+        index[self.source_key(input_folder)] = str(Path(output_folder).resolve())
+        try:
+            PARSE_CACHE_INDEX.parent.mkdir(parents=True, exist_ok=True)
+            PARSE_CACHE_INDEX.write_text(json.dumps(index, indent=2))
+        except OSError as e:
+            print(f"Could not update parse cache index: {e}")
@@ -1,7 +1,20 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, 
                              QGroupBox, QMessageBox, QFormLayout)
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QTimer
+from contextlib import contextmanager
 from Code.GUI.TrackViewer import TrackViewer
+from Code.Core.MapCreator.track_arrays import TrackArrays, TurnRecord
+
+# Sidebar button styles, applied once to the sidebar and matched by objectName
+_SIDEBAR_QSS = """
+QPushButton#invertBtn { background-color: #6366f1; color: white; font-weight: bold; padding: 6px; }
+QPushButton#createTurnBtn { background-color: #f59e0b; color: white; font-weight: bold; padding: 6px; }
+QPushButton#deleteTurnBtn { background-color: #ef4444; color: white; font-weight: bold; padding: 6px; }
+QPushButton#finalizeBtn { background-color: #10b981; color: white; font-weight: bold; padding: 8px; }
+"""
+
+# Turn numbers are entered as 1..99, so turns are stored in a list indexed by number
+_MAX_TURNS = 100
 
 class FineTuner(QWidget):
     fineTuneFinalized = pyqtSignal(dict)
@@ -9,10 +22,20 @@ class FineTuner(QWidget):
     def __init__(self):
         super().__init__()
         self.current_data = None
+        self.track_arrays = None
+        self._visual_paths_by_id = {}
+        self._turns = [None] * _MAX_TURNS  # TurnRecord per turn number, None if unused
         self.node_a_index = -1
         self.node_b_index = -1
         self.selected_turn_num = None
         self.init_ui()
+        
+        # Node placement can fire in bursts; update the info label at most once per frame
+        self._pending_info = ""
+        self._info_timer = QTimer(self)
+        self._info_timer.setSingleShot(True)
+        self._info_timer.setInterval(16)
+        self._info_timer.timeout.connect(self._apply_info_label)
 
     def init_ui(self):
         layout = QHBoxLayout(self)
@@ -20,6 +43,7 @@ class FineTuner(QWidget):
         # Sidebar
         sidebar = QWidget()
         sidebar.setFixedWidth(250)
+        sidebar.setStyleSheet(_SIDEBAR_QSS)
         sidebar_layout = QVBoxLayout(sidebar)
         
         self.width_input = QLineEdit()
@@ -32,22 +56,17 @@ class FineTuner(QWidget):
         self.invert_btn = QPushButton("⇄ Invert Selection")
         self.invert_btn.clicked.connect(self.invert_selection)
         self.invert_btn.setEnabled(False)
-        self.invert_btn.setStyleSheet("background-color: #6366f1; color: white; font-weight: bold; padding: 6px;")
+        self.invert_btn.setObjectName("invertBtn")
         
         self.create_turn_btn = QPushButton("📍 Create Turn")
         self.create_turn_btn.clicked.connect(self.create_turn)
         self.create_turn_btn.setEnabled(False)
-        self.create_turn_btn.setStyleSheet("background-color: #f59e0b; color: white; font-weight: bold; padding: 6px;")
-        
-        self.create_turn_btn = QPushButton("📍 Create Turn")
-        self.create_turn_btn.clicked.connect(self.create_turn)
-        self.create_turn_btn.setEnabled(False)
-        self.create_turn_btn.setStyleSheet("background-color: #f59e0b; color: white; font-weight: bold; padding: 6px;")
+        self.create_turn_btn.setObjectName("createTurnBtn")
         
         self.delete_turn_btn = QPushButton("🗑️ Delete Turn")
         self.delete_turn_btn.clicked.connect(self.delete_turn)
         self.delete_turn_btn.setEnabled(False)
-        self.delete_turn_btn.setStyleSheet("background-color: #ef4444; color: white; font-weight: bold; padding: 6px;")
+        self.delete_turn_btn.setObjectName("deleteTurnBtn")
         
         # Add to main sidebar layout directly to ensure visibility
         sidebar_layout.addWidget(QLabel("<b>Edit Controls</b>"))
@@ -56,8 +75,6 @@ class FineTuner(QWidget):
         sidebar_layout.addWidget(self.invert_btn)
         sidebar_layout.addWidget(self.create_turn_btn)
         sidebar_layout.addWidget(self.delete_turn_btn)
-        sidebar_layout.addWidget(self.delete_turn_btn)
-        sidebar_layout.addWidget(self.create_turn_btn)
         
         # Remove old groupbox code
         # edit_group = QGroupBox("Edit Node Width")
@@ -72,7 +89,7 @@ class FineTuner(QWidget):
 
         self.finalize_btn = QPushButton("✓ Finalize Fine-Tuning")
         self.finalize_btn.clicked.connect(self.finalize_tuning)
-        self.finalize_btn.setStyleSheet("background-color: #10b981; color: white; font-weight: bold; padding: 8px;")
+        self.finalize_btn.setObjectName("finalizeBtn")
         sidebar_layout.addWidget(self.finalize_btn)
         
         sidebar_layout.addStretch()
@@ -89,19 +106,37 @@ class FineTuner(QWidget):
     def set_data(self, finalized_data):
         self.current_data = finalized_data
         self.viewer.set_finalized_data(finalized_data)
+        # Built after the viewer has merged pit lane nodes into splinePoints
+        self.track_arrays = TrackArrays.from_spline_points(finalized_data.get('splinePoints', []))
+        self._visual_paths_by_id = {p['id']: p for p in finalized_data.get('visualPaths', [])}
+        self._load_turns(finalized_data.get('turns', {}))
         self.viewer.set_fine_tune_mode(True)
         self.width_input.clear()
         self.node_a_index = -1
         self.node_b_index = -1
-        self.info_label.setText("Left-click: Place Node A (Blue)\nCtrl+Click: Place Node B (Orange)\nESC: Clear both nodes")
+        self._set_info("Left-click: Place Node A (Blue)\nCtrl+Click: Place Node B (Orange)\nESC: Clear both nodes")
+
+    def _queue_info(self, text):
+        self._pending_info = text
+        self._info_timer.start()
+
+    def _set_info(self, text):
+        # Immediate messages win over a queued node-placement update
+        self._info_timer.stop()
+        self.info_label.setText(text)
 
+    @pyqtSlot()
+    def _apply_info_label(self):
+        self.info_label.setText(self._pending_info)
+
+    @pyqtSlot(int, int)
     def on_two_nodes_placed(self, node_a_idx, node_b_idx):
         self.node_a_index = node_a_idx
         self.node_b_index = node_b_idx
         
         if node_a_idx == -1 and node_b_idx == -1:
             # Both nodes cleared
-            self.info_label.setText("Left-click: Place Node A (Blue)\nCtrl+Click: Place Node B (Orange)\nESC: Clear both nodes")
+            self._queue_info("Left-click: Place Node A (Blue)\nCtrl+Click: Place Node B (Orange)\nESC: Clear both nodes")
             self.update_btn.setEnabled(False)
             self.invert_btn.setEnabled(False)
             self.create_turn_btn.setEnabled(False)
@@ -110,23 +145,24 @@ class FineTuner(QWidget):
             start = min(node_a_idx, node_b_idx)
             end = max(node_a_idx, node_b_idx)
             count = end - start + 1
-            self.info_label.setText(f"Node A: {node_a_idx}\nNode B: {node_b_idx}\nRange: {count} nodes")
+            self._queue_info(f"Node A: {node_a_idx}\nNode B: {node_b_idx}\nRange: {count} nodes")
             self.update_btn.setEnabled(True)
             self.invert_btn.setEnabled(True)
             self.create_turn_btn.setEnabled(True)
         elif node_a_idx >= 0:
             # Only Node A placed
-            self.info_label.setText(f"Node A: {node_a_idx}\nCtrl+Click to place Node B")
+            self._queue_info(f"Node A: {node_a_idx}\nCtrl+Click to place Node B")
             self.update_btn.setEnabled(False)
             self.invert_btn.setEnabled(False)
             self.create_turn_btn.setEnabled(False)
         elif node_b_idx >= 0:
             # Only Node B placed
-            self.info_label.setText(f"Node B: {node_b_idx}\nLeft-click to place Node A")
+            self._queue_info(f"Node B: {node_b_idx}\nLeft-click to place Node A")
             self.update_btn.setEnabled(False)
             self.invert_btn.setEnabled(False)
             self.create_turn_btn.setEnabled(False)
 
+    @pyqtSlot()
     def update_selected_width(self):
         if self.node_a_index == -1 or self.node_b_index == -1 or not self.current_data:
             return
@@ -138,49 +174,74 @@ class FineTuner(QWidget):
                 return
             
             # Get the actual selected indices from the viewer (which handles inversion)
-            indices_to_update = [self.node_a_index, self.node_b_index] + self.viewer.between_nodes_indices
+            indices_to_update = self.viewer.selected_indices
             
             # All nodes are now in splinePoints (including pit lane nodes)
-            points = self.current_data['splinePoints']
-            pit_lanes_updated = set()
-            
-            # Apply width to selected nodes
-            for idx in indices_to_update:
-                if 0 <= idx < len(points):
-                    points[idx]['width'] = new_width
-                    # Track which pit lanes are affected
-                    if 'pit_lane' in points[idx]:
-                        pit_lanes_updated.add(points[idx]['pit_lane'])
+            idx = indices_to_update[(indices_to_update >= 0) & (indices_to_update < len(self.track_arrays))]
             
-            # Sync updated pit lane widths back to visualPaths
-            if pit_lanes_updated and 'visualPaths' in self.current_data:
-                for path in self.current_data['visualPaths']:
-                    if path['id'] in pit_lanes_updated:
+            with self._batch_update():
+                # Apply width to selected nodes
+                pit_lanes_updated, changed = self.track_arrays.set_widths(idx, new_width)
+                
+                # Sync updated pit lane widths back to visualPaths
+                for pit_id in pit_lanes_updated:
+                    path = self._visual_paths_by_id.get(pit_id)
+                    if path is not None:
                         path['widthValue'] = new_width
                         path['width'] = new_width
+                
+                # Write back only the changed nodes and patch their edges in the viewer
+                self.viewer.apply_width_patch(changed.tolist(), new_width)
             
             count = len(indices_to_update)
-            self.viewer.set_finalized_data(self.current_data)
             
             if pit_lanes_updated:
                 pit_names = ', '.join(pit_lanes_updated)
-                self.info_label.setText(f"Updated {count} nodes to {new_width}m width (pit lanes: {pit_names}).")
+                self._set_info(f"Updated {count} nodes to {new_width}m width (pit lanes: {pit_names}).")
             else:
-                self.info_label.setText(f"Updated {count} track nodes to {new_width}m width.")
+                self._set_info(f"Updated {count} track nodes to {new_width}m width.")
             
         except ValueError:
             QMessageBox.warning(self, "Invalid Input", "Please enter a valid number for width.")
 
+    @contextmanager
+    def _batch_update(self):
+        """Hold back viewer signals while an edit touches several nodes"""
+        was_blocked = self.viewer.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.viewer.blockSignals(was_blocked)
+
+    def _load_turns(self, turns):
+        self._turns = [None] * _MAX_TURNS
+        for turn_num_str, turn_data in turns.items():
+            self._turns[int(turn_num_str)] = TurnRecord.from_dict(turn_data)
+
+    def sync_turns(self):
+        """Write the turns back to current_data['turns'], the form other tabs and saves read"""
+        if not self.current_data:
+            return
+        self.current_data['turns'] = {
+            str(turn_num): turn.to_dict()
+            for turn_num, turn in enumerate(self._turns)
+            if turn is not None
+        }
+
+    @pyqtSlot()
     def finalize_tuning(self):
         if self.current_data:
+            self.sync_turns()
             self.fineTuneFinalized.emit(self.current_data)
             QMessageBox.information(self, "Success", "Fine-tuning finalized!")
     
+    @pyqtSlot()
     def invert_selection(self):
         """Invert the selection between Node A and Node B"""
         if self.node_a_index >= 0 and self.node_b_index >= 0:
             self.viewer.invert_between_nodes_selection()
     
+    @pyqtSlot()
     def create_turn(self):
         """Create a turn marker for the selected nodes"""
         if self.node_a_index == -1 or self.node_b_index == -1 or not self.current_data:
@@ -188,11 +249,6 @@ class FineTuner(QWidget):
         
         from PyQt6.QtWidgets import QInputDialog
         
-        # Get existing turn numbers
-        existing_turns = []
-        if 'turns' in self.current_data:
-            existing_turns = [int(k) for k in self.current_data['turns'].keys()]
-        
         # Get turn number from user
         turn_num, ok = QInputDialog.getInt(
             self, 
@@ -206,33 +262,29 @@ class FineTuner(QWidget):
             return
         
         # Check for duplicate
-        if turn_num in existing_turns:
+        if self._turns[turn_num] is not None:
             QMessageBox.warning(self, "Duplicate Turn", f"Turn {turn_num} already exists. Please choose a different number.")
             return
         
         # Get the selected indices (including in-between nodes)
-        indices_to_mark = [self.node_a_index, self.node_b_index] + self.viewer.between_nodes_indices
+        indices_to_mark = self.viewer.selected_indices.copy()
         
         # Store turn data in the viewer
-        self.viewer.create_turn(turn_num, indices_to_mark)
+        self.viewer.create_turn(turn_num, indices_to_mark.tolist())
         
         # Mark the nodes with turn number
-        if 'turns' not in self.current_data:
-            self.current_data['turns'] = {}
-        
-        self.current_data['turns'][str(turn_num)] = {
-            'indices': indices_to_mark,
-            'inverted': self.viewer.selection_inverted
-        }
+        self._turns[turn_num] = TurnRecord(indices_to_mark, self.viewer.selection_inverted)
         
-        self.info_label.setText(f"Turn {turn_num} created with {len(indices_to_mark)} nodes")
+        self._set_info(f"Turn {turn_num} created with {len(indices_to_mark)} nodes")
     
+    @pyqtSlot(int)
     def on_turn_selected(self, turn_num):
         """Handle turn selection from viewer"""
         self.selected_turn_num = turn_num
         self.delete_turn_btn.setEnabled(True)
-        self.info_label.setText(f"Turn {turn_num} selected\nClick 'Delete Turn' to remove")
+        self._set_info(f"Turn {turn_num} selected\nClick 'Delete Turn' to remove")
     
+    @pyqtSlot()
     def delete_turn(self):
         """Delete the currently selected turn"""
         if self.selected_turn_num is None or not self.current_data:
@@ -255,10 +307,9 @@ class FineTuner(QWidget):
         self.viewer.delete_turn(turn_num)
         
         # Remove from data
-        if 'turns' in self.current_data and str(turn_num) in self.current_data['turns']:
-            del self.current_data['turns'][str(turn_num)]
+        self._turns[turn_num] = None
         
         # Reset selection
         self.selected_turn_num = None
         self.delete_turn_btn.setEnabled(False)
-        self.info_label.setText(f"Turn {turn_num} deleted")
+        self._set_info(f"Turn {turn_num} deleted")
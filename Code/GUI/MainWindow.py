@@ -1,14 +1,57 @@
+import copy
 import json
 import os
-import pickle
-from pathlib import Path
 from PyQt6.QtWidgets import (QMainWindow, QTabWidget, QFileDialog, QMessageBox, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel)
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QAction
 from Code.GUI.TrackScanner import TrackScanner
-from Code.GUI.FineTuner import FineTuner
-from Code.GUI.Render3D import Render3D
-from Code.GUI.RaceTelemetryTab import RaceTelemetryTab
+from Code.Core.SessionStorage import save_sark, load_sark
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+class _SaveSignals(QObject):
+    done = pyqtSignal()  # Outcome is on the task: file_size, or error if the write failed
+
+
+class _SaveTask(QRunnable):
+    """Writes a session snapshot to disk on a pool thread"""
+
+    def __init__(self, session, file_path, is_sark):
+        super().__init__()
+        self.setAutoDelete(False)  # MainWindow holds the task until it reports back
+        self.session = session
+        self.file_path = file_path
+        self.is_sark = is_sark
+        self.file_size = 0
+        self.error = None  # Error message with traceback
+        self.signals = _SaveSignals()
+
+    def run(self):
+        try:
+            if self.is_sark:
+                file_size = save_sark(self.session, self.file_path)
+            elif HAS_ORJSON:
+                # Native encoder; stdlib json drops to its pure-Python path when indenting
+                data = orjson.dumps(self.session, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                                    | orjson.OPT_NON_STR_KEYS)
+                with open(self.file_path, 'wb') as f:
+                    f.write(data)
+                file_size = len(data)
+            else:
+                with open(self.file_path, 'w') as f:
+                    json.dump(self.session, f, indent=2)
+                file_size = os.path.getsize(self.file_path)
+            self.file_size = file_size
+        except Exception as e:
+            import traceback
+            self.error = f"{e}\n\n{traceback.format_exc()}"
+        self.signals.done.emit()
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -19,7 +62,29 @@ class MainWindow(QMainWindow):
         self.init_ui()
         self.track_data = None
         self.finalized_data = None
-        self.unsaved_changes = False
+        self._unsaved_changes = False
+        self._save_task = None
+        # Saves get their own pool so waiting on one never waits on parses or cache builds
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+
+    @property
+    def unsaved_changes(self):
+        return self._unsaved_changes
+
+    @unsaved_changes.setter
+    def unsaved_changes(self, value):
+        # Only touch the window title when the dirty state actually flips
+        if value == self._unsaved_changes:
+            return
+        self._unsaved_changes = value
+        self.setWindowTitle("RaceTrack Studio *" if value else "RaceTrack Studio")
+
+    def _set_tabs_enabled(self, enabled):
+        """Enable or disable the tabs that need a finalized track"""
+        for index in (1, 2, 3):
+            if self.tabs.isTabEnabled(index) != enabled:
+                self.tabs.setTabEnabled(index, enabled)
 
     def init_ui(self):
         # Menu Bar
@@ -46,62 +111,118 @@ class MainWindow(QMainWindow):
         self.scanner_tab.trackFinalized.connect(self.on_track_finalized)
         self.scanner_tab.trackLoaded.connect(self.on_track_loaded)
         
-        self.fine_tuner_tab = FineTuner()
-        self.fine_tuner_tab.fineTuneFinalized.connect(self.on_fine_tune_finalized)
-        
-        self.render_tab = Render3D()
-        
-        self.telemetry_tab = RaceTelemetryTab()
-        
-        # Connect signals from render tab to telemetry tab
-        self.render_tab.telemetryDataLoaded.connect(self.telemetry_tab.set_telemetry_data)
-        self.render_tab.playbackPositionChanged.connect(self.telemetry_tab.update_from_playback)
+        # The other tabs (and their 3D/plotting imports) are built on first use
+        self._tab_factories = {
+            1: self._create_fine_tuner_tab,
+            2: self._create_render_tab,
+            3: self._create_telemetry_tab,
+        }
+        self._tab_widgets = {}
         
         self.tabs.addTab(self.scanner_tab, "1. Scan & Finalize")
-        self.tabs.addTab(self.fine_tuner_tab, "2. Fine-Tune")
-        self.tabs.addTab(self.render_tab, "3. 3D Render")
-        self.tabs.addTab(self.telemetry_tab, "4. Race Telemetry")
+        self.tabs.addTab(QWidget(), "2. Fine-Tune")
+        self.tabs.addTab(QWidget(), "3. 3D Render")
+        self.tabs.addTab(QWidget(), "4. Race Telemetry")
         
         self.tabs.setTabEnabled(1, False)
         self.tabs.setTabEnabled(2, False)
         self.tabs.setTabEnabled(3, False)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _create_fine_tuner_tab(self):
+        from Code.GUI.FineTuner import FineTuner
+        tab = FineTuner()
+        tab.fineTuneFinalized.connect(self.on_fine_tune_finalized)
+        return tab
+
+    def _create_render_tab(self):
+        from Code.GUI.Render3D import Render3D
+        tab = Render3D()
+        
+        # Connect signals from render tab to telemetry tab
+        tab.telemetryDataLoaded.connect(self.telemetry_tab.set_telemetry_data)
+        tab.playbackPositionChanged.connect(self.telemetry_tab.update_from_playback)
+        return tab
+
+    def _create_telemetry_tab(self):
+        from Code.GUI.RaceTelemetryTab import RaceTelemetryTab
+        tab = RaceTelemetryTab()
+        if self.finalized_data:
+            # Built after the track was finalized: pick up the turn data it missed
+            tab.set_turn_data(self.finalized_data)
+        return tab
+
+    def _tab(self, index):
+        """Return the widget for a tab, swapping out its placeholder on first use"""
+        widget = self._tab_widgets.get(index)
+        if widget is None:
+            widget = self._tab_factories[index]()
+            self._tab_widgets[index] = widget
+            
+            placeholder = self.tabs.widget(index)
+            title = self.tabs.tabText(index)
+            enabled = self.tabs.isTabEnabled(index)
+            current = self.tabs.currentIndex()
+            
+            self.tabs.blockSignals(True)
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, title)
+            self.tabs.setTabEnabled(index, enabled)
+            self.tabs.setCurrentIndex(current)
+            self.tabs.blockSignals(False)
+            placeholder.deleteLater()
+        return widget
 
+    @property
+    def fine_tuner_tab(self):
+        return self._tab(1)
+
+    @property
+    def render_tab(self):
+        return self._tab(2)
+
+    @property
+    def telemetry_tab(self):
+        return self._tab(3)
+
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index):
+        if index in self._tab_factories:
+            self._tab(index)
+
+    @pyqtSlot(dict)
     def on_track_loaded(self, data):
         self.track_data = data
         self.unsaved_changes = True
-        self.setWindowTitle("RaceTrack Studio *")
         # Reset other tabs
-        self.tabs.setTabEnabled(1, False)
-        self.tabs.setTabEnabled(2, False)
-        self.tabs.setTabEnabled(3, False)
+        self._set_tabs_enabled(False)
 
+    @pyqtSlot(dict)
     def on_track_finalized(self, data):
         self.finalized_data = data
         self.unsaved_changes = True
-        self.setWindowTitle("RaceTrack Studio *")
-        self.tabs.setTabEnabled(1, True)
-        self.tabs.setTabEnabled(2, True)
-        self.tabs.setTabEnabled(3, True)
+        self._set_tabs_enabled(True)
         
         self.fine_tuner_tab.set_data(data)
         self.render_tab.set_data(data)
         
-        # Pass turn data to telemetry tab if available
-        if hasattr(self, 'telemetry_tab') and self.telemetry_tab is not None:
-            self.telemetry_tab.set_turn_data(data)
+        # Pass turn data to telemetry tab if it has been built (otherwise it is applied on creation)
+        if 3 in self._tab_widgets:
+            self._tab_widgets[3].set_turn_data(data)
 
+    @pyqtSlot(dict)
     def on_fine_tune_finalized(self, data):
         self.finalized_data = data
         self.unsaved_changes = True
-        self.setWindowTitle("RaceTrack Studio *")
         self.render_tab.set_data(data)
         self.render_tab.set_turn_data(data)  # Pass turn data to 3D render
         self.scanner_tab.viewer.set_finalized_data(data)
         
-        # Pass turn data to telemetry tab
-        if hasattr(self, 'telemetry_tab') and self.telemetry_tab is not None:
-            self.telemetry_tab.set_turn_data(data)
+        # Pass turn data to telemetry tab if it has been built (otherwise it is applied on creation)
+        if 3 in self._tab_widgets:
+            self._tab_widgets[3].set_turn_data(data)
 
+    @pyqtSlot()
     def save_session(self):
         file_path, selected_filter = QFileDialog.getSaveFileName(
             self, "Save Session", "", 
@@ -110,62 +231,100 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
         
+        if self._save_task is not None:
+            QMessageBox.information(self, "Saving", "A save is already in progress.")
+            return
+        
         # Determine format based on selection or extension
         is_sark = selected_filter.startswith("SARK") or file_path.endswith('.sark')
         
-        session = {
+        if 1 in self._tab_widgets:
+            # Turns being edited live in the fine tuner until written back
+            self._tab_widgets[1].sync_turns()
+        
+        # Snapshot the editable track data so edits made while the file is written can't race it
+        session = copy.deepcopy({
             'track_data': self.track_data,
             'finalized_data': self.finalized_data,
-            'inputs': self.scanner_tab.get_inputs(),
-            'telemetry_state': self.render_tab.get_session_state()  # Include telemetry data
-        }
+            'inputs': self.scanner_tab.get_inputs()
+        })
         
-        try:
-            if is_sark:
-                # Save as pickle with .sark extension
-                with open(file_path, 'wb') as f:
-                    pickle.dump(session, f, protocol=pickle.HIGHEST_PROTOCOL)
-                
-                file_size = Path(file_path).stat().st_size
-                
-                # Check if telemetry data was embedded
-                telemetry_state = session.get('telemetry_state', {})
-                has_telemetry = 'telemetry_data' in telemetry_state and telemetry_state['telemetry_data']
-                
-                self.unsaved_changes = False
-                self.setWindowTitle("RaceTrack Studio")
-                
-                msg = f"Session saved successfully as SARK file.\n\n"
-                msg += f"File: {file_path}\n"
-                msg += f"Size: {file_size:,} bytes\n"
-                if has_telemetry:
-                    num_races = len(telemetry_state['telemetry_data'])
-                    msg += f"\n✓ Includes all telemetry data ({num_races} race(s))"
-                
-                QMessageBox.information(self, "Saved", msg)
-            else:
-                # Save as JSON (legacy format - without telemetry state)
-                json_session = {
-                    'track_data': self.track_data,
-                    'finalized_data': self.finalized_data,
-                    'inputs': self.scanner_tab.get_inputs()
-                }
-                with open(file_path, 'w') as f:
-                    json.dump(json_session, f, indent=2)
-                self.unsaved_changes = False
-                self.setWindowTitle("RaceTrack Studio")
-                QMessageBox.information(self, "Saved", "Session saved successfully as JSON.\n(Note: Telemetry data not included in JSON format)")
-        except Exception as e:
-            import traceback
-            QMessageBox.critical(self, "Error", f"Failed to save: {e}\n\n{traceback.format_exc()}")
+        if is_sark:
+            # Include telemetry data (nothing to save if the 3D tab was never opened).
+            # get_session_state builds fresh containers, so it is not copied again.
+            session['telemetry_state'] = self._tab_widgets[2].get_session_state() if 2 in self._tab_widgets else None
+        
+        # Serialize and write on a pool thread so the UI keeps painting
+        task = _SaveTask(session, file_path, is_sark)
+        task.signals.done.connect(self.on_save_done)
+        self._save_task = task
+        self.statusBar().showMessage(f"Saving {file_path}...")
+        self._save_pool.start(task)
+
+    @pyqtSlot()
+    def on_save_done(self):
+        task = self._save_task
+        if task is None or self.sender() is not task.signals:
+            return  # Already reported by _finish_pending_save
+        self._report_save(task)
+
+    def _finish_pending_save(self):
+        """
+        Block until a running save is written and report it.
+        
+        Returns:
+            False if the save failed, True if it succeeded or none was running
+        """
+        task = self._save_task
+        if task is None:
+            return True
+        self._save_pool.waitForDone()
+        return self._report_save(task)
 
+    def _report_save(self, task):
+        """Show the outcome of a finished save; returns True if the file was written"""
+        self._save_task = None
+        self.statusBar().clearMessage()
+        
+        if task.error is not None:
+            QMessageBox.critical(self, "Error", f"Failed to save: {task.error}")
+            return False
+        
+        self.unsaved_changes = False
+        file_path, file_size = task.file_path, task.file_size
+        
+        if task.is_sark:
+            # Check if telemetry data was embedded
+            telemetry_state = task.session.get('telemetry_state') or {}
+            has_telemetry = 'telemetry_data' in telemetry_state and telemetry_state['telemetry_data']
+            
+            msg = f"Session saved successfully as SARK file.\n\n"
+            msg += f"File: {file_path}\n"
+            msg += f"Size: {file_size:,} bytes\n"
+            if has_telemetry:
+                num_races = len(telemetry_state['telemetry_data'])
+                msg += f"\n✓ Includes all telemetry data ({num_races} race(s))"
+            
+            QMessageBox.information(self, "Saved", msg)
+        else:
+            # JSON is the legacy format - without telemetry state
+            QMessageBox.information(self, "Saved", "Session saved successfully as JSON.\n(Note: Telemetry data not included in JSON format)")
+        return True
+
+    @pyqtSlot()
     def load_session(self):
+        # Don't offer a file that may still be being written
+        self._finish_pending_save()
+        
         if self.unsaved_changes:
             reply = QMessageBox.question(self, 'Unsaved Changes', 
                                          "You have unsaved changes. Do you want to save before loading?",
                                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel)
             if reply == QMessageBox.StandardButton.Yes:
                 self.save_session()
+                if not self._finish_pending_save():
+                    # Keep the unsaved session rather than replace it with the loaded one
+                    return
             elif reply == QMessageBox.StandardButton.Cancel:
                 return
 
@@ -179,9 +338,8 @@ class MainWindow(QMainWindow):
         try:
             # Detect file format
             if file_path.endswith('.sark'):
-                # Load pickled SARK file
-                with open(file_path, 'rb') as f:
-                    session = pickle.load(f)
+                # Load SARK file (current format or legacy pickle)
+                session = load_sark(file_path)
                 format_name = "SARK"
             else:
                 # Load JSON file
@@ -209,13 +367,15 @@ class MainWindow(QMainWindow):
                 info_msg = f"Session loaded successfully from {format_name} file."
             
             self.unsaved_changes = False
-            self.setWindowTitle("RaceTrack Studio")
             QMessageBox.information(self, "Loaded", info_msg)
         except Exception as e:
             import traceback
             QMessageBox.critical(self, "Error", f"Failed to load: {e}\n\n{traceback.format_exc()}")
 
     def closeEvent(self, event):
+        # Never exit mid-write; a save started earlier may still be running
+        self._finish_pending_save()
+        
         if self.unsaved_changes:
             reply = QMessageBox.question(self, 'Unsaved Changes',
                                          "You have unsaved changes. Do you want to save before exiting?",
@@ -223,7 +383,11 @@ class MainWindow(QMainWindow):
 
             if reply == QMessageBox.StandardButton.Yes:
                 self.save_session()
-                event.accept()
+                # Don't exit while the file is still being written, and stay open if it failed
+                if self._finish_pending_save():
+                    event.accept()
+                else:
+                    event.ignore()
             elif reply == QMessageBox.StandardButton.No:
                 event.accept()
             else:
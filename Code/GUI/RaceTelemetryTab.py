@@ -3,14 +3,181 @@ Race Telemetry Analysis Tab - Real-time telemetry visualization and analysis
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, 
-                             QPushButton, QScrollArea, QFrame, QGridLayout, QSplitter, QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
-from PyQt6.QtGui import QFont
+                             QPushButton, QScrollArea, QFrame, QGridLayout, QSplitter, QSizePolicy,
+                             QGraphicsItem, QGraphicsPathItem)
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot, QTimer, QRectF
+from PyQt6.QtGui import QFont, QPainterPath, QPen
+import traceback
 import pyqtgraph as pg
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 from scipy.ndimage import uniform_filter1d
+from scipy.signal import argrelmax
+
+try:
+    from PyQt6 import QtOpenGLWidgets  # noqa: F401 (backs pyqtgraph's useOpenGL viewport)
+    HAS_OPENGL = True
+except ImportError:
+    HAS_OPENGL = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    # Explicit signature compiles at import (and is cached on disk), so the first
+    # chart update never stalls on JIT compilation
+    @njit('void(float64[:], float64[:], float64[:], float64[:])', cache=True, fastmath=True, boundscheck=False)
+    def _instability_kernel(steer, lat_g, speed, out):
+        """
+        |steer| * |lat_g| * speed/100, smoothed by a 5-point moving average with edge
+        replication (uniform_filter1d(size=5, mode='nearest')). Single pass: raw scores
+        are computed as they enter a running sum and kept in a small ring until they leave.
+        """
+        n = steer.shape[0]
+        if n < 5:
+            for i in range(n):
+                out[i] = abs(steer[i]) * abs(lat_g[i]) * (speed[i] * 0.01)
+            return
+        last = n - 1
+        ring = np.empty(8)  # raw[j] lives at ring[j & 7]
+        for j in range(3):
+            ring[j] = abs(steer[j]) * abs(lat_g[j]) * (speed[j] * 0.01)
+        first = ring[0]
+        total = 3.0 * first + ring[1] + ring[2]
+        out[0] = total * 0.2
+        for i in range(1, n):
+            j = i + 2
+            if j <= last:
+                entering = abs(steer[j]) * abs(lat_g[j]) * (speed[j] * 0.01)
+                ring[j & 7] = entering
+            else:
+                entering = ring[last & 7]
+            leaving = ring[(i - 3) & 7] if i >= 3 else first
+            total += entering - leaving
+            out[i] = total * 0.2
+
+    # No fastmath here: the reductions below rely on NaN checks to match pandas' skipna
+    @njit('float64[:](int64, float64[:], float64[:], float64[:], float64[:], float64[:], float64[:], float64[:])',
+          cache=True)
+    def _lap_stats_kernel(n, speed, lat_g, brake_f, brake_r, throttle, elapsed, lap_dist):
+        """
+        All lap statistics in one pass. A column missing from the lap is passed as an
+        empty array. Returns values in _LAP_STAT_KEYS order.
+        """
+        has_speed = speed.shape[0] == n
+        has_lat = lat_g.shape[0] == n
+        has_brake_f = brake_f.shape[0] == n
+        has_brake_r = brake_r.shape[0] == n
+        has_throttle = throttle.shape[0] == n
+        has_elapsed = elapsed.shape[0] == n
+        has_dist = lap_dist.shape[0] == n
+
+        speed_max = -np.inf
+        speed_sum = 0.0
+        speed_cnt = 0
+        lat_max = -np.inf
+        lat_cnt = 0
+        brake_max = -np.inf
+        brake_cnt = 0
+        coasting = 0
+        bias_sum = 0.0
+        bias_cnt = 0
+        t_min = np.inf
+        t_max = -np.inf
+        d_min = np.inf
+        d_max = -np.inf
+
+        for i in range(n):
+            if has_speed:
+                v = speed[i]
+                if not np.isnan(v):
+                    speed_max = max(speed_max, v)
+                    speed_sum += v
+                    speed_cnt += 1
+            if has_lat:
+                v = abs(lat_g[i])
+                if not np.isnan(v):
+                    lat_max = max(lat_max, v)
+                    lat_cnt += 1
+            if has_brake_f:
+                b = brake_f[i]
+                if not np.isnan(b):
+                    brake_max = max(brake_max, b)
+                    brake_cnt += 1
+                if has_throttle:
+                    t = throttle[i]
+                    if (0.0 if np.isnan(t) else t) < 5 and (0.0 if np.isnan(b) else b) < 1:
+                        coasting += 1
+                # Brake bias only when braking hard
+                if has_brake_r and b > 10:
+                    bias = b / (b + brake_r[i]) * 100
+                    if not np.isnan(bias):
+                        bias_sum += bias
+                        bias_cnt += 1
+            if has_elapsed:
+                v = elapsed[i]
+                if not np.isnan(v):
+                    t_min = min(t_min, v)
+                    t_max = max(t_max, v)
+            if has_dist:
+                v = lap_dist[i]
+                if not np.isnan(v):
+                    d_min = min(d_min, v)
+                    d_max = max(d_max, v)
+
+        out = np.zeros(8)
+        if has_speed:
+            out[0] = speed_max if speed_cnt else np.nan
+            out[3] = speed_sum / speed_cnt if speed_cnt else np.nan
+        if has_lat:
+            out[1] = lat_max if lat_cnt else np.nan
+        if has_brake_f:
+            out[2] = brake_max if brake_cnt else np.nan
+        if has_brake_f and has_throttle and n > 0:
+            out[4] = coasting / n * 100
+        out[5] = bias_sum / bias_cnt if bias_cnt else 50.0
+        if has_elapsed:
+            out[6] = t_max - t_min if t_max >= t_min else np.nan
+        if has_dist:
+            out[7] = d_max - d_min if d_max >= d_min else np.nan
+        return out
+
+    # nogil: runs on the cache task's pool thread (see _CacheTask)
+    @njit('void(float64[:], float64[:], float64[:], float64[:], float64, int64, intp[:], uint8[:], uint16[:])',
+          cache=True, boundscheck=False, nogil=True)
+    def _colour_index_kernel(brake, throttle, speed, long_g, max_speed, levels, track_bin, speed_level, demand_index):
+        """
+        Per-sample colour indices for the whole session in one pass: track map bin (see
+        _track_bin_colors), 8-bit speed level, and demand palette index (long-g level,
+        +256 under acceleration). Missing pedal, speed or long-g columns are passed as
+        empty arrays and their outputs left untouched.
+        """
+        n = track_bin.shape[0]
+        has_pedals = brake.shape[0] == n and throttle.shape[0] == n
+        has_speed = speed.shape[0] == n
+        has_long_g = long_g.shape[0] == n
+        for i in range(n):
+            if has_pedals:
+                b = min(max(brake[i] / 100.0, 0.0), 1.0)
+                t = min(max(throttle[i] / 100.0, 0.0), 1.0)
+                if b > 0.1:
+                    track_bin[i] = 2 + min(int(b * levels), levels - 1)
+                elif t > 0.1:
+                    track_bin[i] = 2 + levels + min(int(t * levels), levels - 1)
+                else:
+                    track_bin[i] = 1
+            else:
+                track_bin[i] = 0
+            if has_speed:
+                speed_level[i] = int(min(max(speed[i] / max_speed * 255, 0.0), 255.0))
+            if has_long_g:
+                g = long_g[i]
+                level = int(255 * min(abs(g), 1.0))
+                demand_index[i] = level + 256 if g > 0 else level
 
 class FocusablePlotWidget(pg.PlotWidget):
     """
@@ -24,15 +191,23 @@ class FocusablePlotWidget(pg.PlotWidget):
         self.setMouseEnabled(x=False, y=False)
         self.setMenuEnabled(False)
         self.is_focused = False
+        self.uses_gl = False
         
         # Crosshair
-        self.vLine = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen('#cbd5e1', width=1, style=Qt.PenStyle.DashLine))
-        self.hLine = pg.InfiniteLine(angle=0, movable=False, pen=pg.mkPen('#cbd5e1', width=1, style=Qt.PenStyle.DashLine))
+        self.vLine = pg.InfiniteLine(angle=90, movable=False, pen=_pen('#cbd5e1', width=1, style=Qt.PenStyle.DashLine))
+        self.hLine = pg.InfiniteLine(angle=0, movable=False, pen=_pen('#cbd5e1', width=1, style=Qt.PenStyle.DashLine))
         self.addItem(self.vLine, ignoreBounds=True)
         self.addItem(self.hLine, ignoreBounds=True)
         self.vLine.hide()
         self.hLine.hide()
         
+        # Pointer moves arrive at the device rate; the crosshair follows the latest one
+        # at most once per frame
+        self._pending_mouse_pos = None
+        self._crosshair_timer = QTimer(self)
+        self._crosshair_timer.setSingleShot(True)
+        self._crosshair_timer.timeout.connect(self._apply_crosshair)
+        
         self.scene().sigMouseMoved.connect(self.mouseMoved)
 
     def mousePressEvent(self, ev):
@@ -48,20 +223,280 @@ class FocusablePlotWidget(pg.PlotWidget):
         self.setMouseEnabled(x=focused, y=focused)
         
         if focused:
-            self.getViewBox().setBorder(pg.mkPen(color='#3b82f6', width=3))
+            self.getViewBox().setBorder(_pen(color='#3b82f6', width=3))
             self.vLine.show()
             self.hLine.show()
         else:
-            self.getViewBox().setBorder(pg.mkPen(None))
+            self.getViewBox().setBorder(_pen(None))
             self.vLine.hide()
             self.hLine.hide()
 
+    def set_gl_viewport(self, enabled: bool):
+        """Paint through an OpenGL viewport (axes and interaction are unchanged)"""
+        enabled = enabled and HAS_OPENGL
+        if enabled != self.uses_gl:
+            self.useOpenGL(enabled)
+            self.uses_gl = enabled
+
     def mouseMoved(self, evt):
         if self.is_focused and self.sceneBoundingRect().contains(evt):
-            mousePoint = self.getViewBox().mapSceneToView(evt)
-            self.vLine.setPos(mousePoint.x())
-            self.hLine.setPos(mousePoint.y())
+            self._pending_mouse_pos = evt
+            if not self._crosshair_timer.isActive():
+                self._crosshair_timer.start(16)
+
+    def _apply_crosshair(self):
+        """Move the crosshair to the last pointer position seen (~60 Hz)"""
+        pos, self._pending_mouse_pos = self._pending_mouse_pos, None
+        if pos is None or not self.is_focused:
+            return
+        mousePoint = self.getViewBox().mapSceneToView(pos)
+        # Nothing listens to these lines; skip the sigPositionChanged emissions
+        for line, value in ((self.vLine, mousePoint.x()), (self.hLine, mousePoint.y())):
+            line.blockSignals(True)
+            line.setPos(value)
+            line.blockSignals(False)
+
+
+
+# Plots switch to an OpenGL viewport when a session has at least this many samples;
+# below it raster painting is fast enough and avoids creating GL contexts
+_GL_VIEWPORT_THRESHOLD = 5000
+
+# Telemetry channels read by this tab; everything else is dropped on arrival
+_TELEMETRY_COLUMNS = ('lap', 'elapsed_seconds', 'Laptrigger_lapdist_dls', 'VBOX_Long_Minutes', 'VBOX_Lat_Min',
+                      'speed', 'accy_can', 'accx_can', 'pbrake_f', 'pbrake_r', 'aps', 'Steering_Angle',
+                      'nmot', 'gear')
+# Sensor channels that fit float32; time, lap distance and GPS minutes keep float64 precision
+_FLOAT32_COLUMNS = ('speed', 'accy_can', 'accx_can', 'pbrake_f', 'pbrake_r', 'aps', 'Steering_Angle', 'nmot')
+# Channels the colour caches read over the whole session, kept as NaN-filled arrays
+_HOT_COLUMNS = ('pbrake_f', 'aps', 'speed', 'accx_can')
+
+# Channels shown by the hover labels (see _hover_row)
+_HOVER_COLUMNS = ('speed', 'pbrake_f', 'pbrake_r', 'accy_can', 'accx_can', 'gear', 'nmot',
+                  'Steering_Angle', 'elapsed_seconds')
+
+# Intensity steps per pedal in the track map trace
+_TRACK_LEVELS = 8
+
+# Parts of the tab redrawn by update_visualizations, each skipped while not dirty
+_CHARTS = ('stats', 'track', 'friction', 'instability', 'brake_speed', 'demand',
+           'g_force', 'brake_bias', 'gear', 'reference', 'sectors')
+
+_LAP_STAT_KEYS = ('top_speed', 'max_lat_g', 'peak_brake', 'avg_speed',
+                  'coasting_pct', 'brake_bias', 'lap_time', 'distance')
+_NO_COLUMN = np.empty(0)
+
+
+def _compact_telemetry(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy of the channels this tab reads, in the smallest dtypes that keep their meaning.
+    The frame from Render3D is shared, so it is never modified in place.
+    """
+    df = df[[c for c in _TELEMETRY_COLUMNS if c in df]].copy()
+    for column in _FLOAT32_COLUMNS:
+        if column in df:
+            df[column] = df[column].astype(np.float32)
+    if 'gear' in df:
+        # Every consumer already treats a missing gear as 0 (neutral)
+        df['gear'] = df['gear'].fillna(0).astype(np.int8)
+    if 'lap' in df:
+        df['lap'] = pd.to_numeric(df['lap'], downcast='integer')
+    return df
+
+
+def _telemetry_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Per-column arrays for whole-session reads: the _HOT_COLUMNS with NaN filled as 0
+    (once, instead of a fillna per cache rebuild) and the lap column as stored.
+    """
+    arrays = {column: _plot_array(df, column, fill=0.0) for column in _HOT_COLUMNS if column in df}
+    if 'lap' in df:
+        arrays['lap'] = df['lap'].to_numpy()
+    return arrays
+
+
+def _view_mask(plot: pg.PlotWidget, x: np.ndarray, y: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Mask of the points inside a manually zoomed/panned view. Returns None while either
+    axis auto-ranges, since then every point is in view by definition.
+    """
+    view_box = plot.getViewBox()
+    if any(view_box.autoRangeEnabled()):
+        return None
+    (x0, x1), (y0, y1) = view_box.viewRange()
+    return (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+
+
+def _plot_array(df: pd.DataFrame, column: str, fill: Optional[float] = None) -> np.ndarray:
+    """
+    Column as a C-contiguous float64 array, ready for setData without pyqtgraph having
+    to convert it again. NaNs are replaced by `fill` when one is given.
+    """
+    if fill is None:
+        values = df[column].to_numpy(dtype=np.float64)
+    else:
+        values = df[column].to_numpy(dtype=np.float64, na_value=fill)
+    return np.ascontiguousarray(values)
+
+
+def _segment_pairs(x: np.ndarray, y: np.ndarray, finite: Optional[np.ndarray], bins: np.ndarray,
+                   n_groups: int) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Track map segments grouped by colour bin. Segment i -> i+1 takes the bin of its end
+    point and is kept when both ends are finite (finite=None: all are). Per bin: the start
+    rows of its segments (ascending) and their (start, end) coordinates interleaved for
+    connect='pairs'.
+    """
+    if finite is None:
+        segments = np.arange(max(len(x) - 1, 0))
+    else:
+        segments = np.flatnonzero(finite[:-1] & finite[1:])
+    segment_bins = bins[segments + 1]
+    order = np.argsort(segment_bins, kind='stable')
+    counts = np.bincount(segment_bins, minlength=n_groups)
+    groups = np.split(segments[order], np.cumsum(counts)[:-1])
+    pairs = []
+    for group in groups:
+        ends = np.column_stack([group, group + 1]).ravel()
+        pairs.append((group, x[ends], y[ends]))
+    return pairs
+
+
+def _nearest_index(values: np.ndarray, target: float, ascending: bool) -> int:
+    """
+    Index of the value closest to target (the first one on a tie). Bisection when values
+    are ascending (lap distance within one lap), otherwise a full scan.
+    """
+    if not ascending:
+        return int(np.abs(values - target).argmin())
+    i = int(np.searchsorted(values, target))
+    if i == len(values) or (i > 0 and target - values[i - 1] <= values[i] - target):
+        i -= 1
+    return i
+
+
+# Hover label text per distance plot: fmt(row, ref_row, x) with the rows from _hover_row
+# (ref_row None without a close enough reference sample)
+def _hover_brake_speed(row: Dict[str, float], ref: Optional[Dict[str, float]], x: float) -> str:
+    text = f"Speed: {row['speed']:.1f}mph"
+    if ref is not None:
+        diff = row['speed'] - ref['speed']
+        sign = "+" if diff > 0 else ""
+        text += f" ({sign}{diff:.1f})"
+    return text + f"\nBrake: {row['pbrake_f']:.1f} bar"
+
+
+def _hover_g_force(row: Dict[str, float], ref: Optional[Dict[str, float]], x: float) -> str:
+    return f"Lat G: {row['accy_can']:.2f}\nLong G: {row['accx_can']:.2f}"
+
+
+def _hover_gear(row: Dict[str, float], ref: Optional[Dict[str, float]], x: float) -> str:
+    gear = 0 if np.isnan(row['gear']) else row['gear']
+    rpm = 0 if np.isnan(row['nmot']) else row['nmot']
+    return f"Gear: {int(gear)}\nRPM: {int(rpm)}"
+
+
+def _hover_steering(row: Dict[str, float], ref: Optional[Dict[str, float]], x: float) -> str:
+    return f"Steer: {row['Steering_Angle']:.1f}°"
+
+
+def _hover_brake_bias(row: Dict[str, float], ref: Optional[Dict[str, float]], x: float) -> str:
+    total = row['pbrake_f'] + row['pbrake_r']
+    bias = (row['pbrake_f'] / total * 100) if total > 5 else 50
+    return f"Bias: {bias:.1f}%"
+
+
+def _hover_time_delta(row: Dict[str, float], ref: Optional[Dict[str, float]], x: float) -> str:
+    text = f"Dist: {x:.0f}m"
+    if ref is not None:
+        delta = (row['elapsed_seconds'] - row['start_seconds']) - (ref['elapsed_seconds'] - ref['start_seconds'])
+        sign = "+" if delta > 0 else ""
+        text += f"\nDelta: {sign}{delta:.2f}s"
+    return text
+
+
+def _smoothed_tail(raw: np.ndarray, first: int) -> np.ndarray:
+    """
+    Values first.. (first >= 2) of the 5-point moving average of raw with its end
+    replicated, i.e. uniform_filter1d(raw, 5, mode='nearest')[first:] for any longer
+    history before raw
+    """
+    rows = np.arange(first, len(raw))
+    total = np.zeros(len(rows))
+    for offset in (-2, -1, 0, 1, 2):
+        total += raw[np.minimum(rows + offset, len(raw) - 1)]
+    return total * 0.2
+
+
+def _held_gears(gear: np.ndarray) -> np.ndarray:
+    """
+    Gear trace with each 0 (neutral/no reading) replaced by the last non-zero gear before
+    it; leading zeros stay 0. NumPy equivalent of replace(0, nan).ffill().fillna(0).
+    """
+    gear = gear.astype(np.float64)
+    last = np.where(gear != 0, np.arange(len(gear)), 0)
+    np.maximum.accumulate(last, out=last)
+    return gear[last]
+
+
+def _track_bin_colors() -> List[Tuple[int, int, int, int]]:
+    """
+    Track map colour per bin: 0 = no pedal data, 1 = coasting, then _TRACK_LEVELS
+    braking shades (red) followed by _TRACK_LEVELS throttle shades (green).
+    """
+    colors = [(59, 130, 246, 180), (100, 100, 255, 180)]
+    shades = [int(255 * (level + 1) / _TRACK_LEVELS) for level in range(_TRACK_LEVELS)]
+    colors += [(shade, 0, 0, 180) for shade in shades]
+    colors += [(0, shade, 0, 180) for shade in shades]
+    return colors
+
+
+# Pens and brushes by their mkPen/mkBrush arguments; see _pen and _brush
+_PEN_CACHE = {}
+_BRUSH_CACHE = {}
+
+
+def _pen(*args, **kwargs):
+    """pg.mkPen(*args, **kwargs), built once per distinct argument set and shared. Do not modify."""
+    key = (args, tuple(sorted(kwargs.items())))
+    pen = _PEN_CACHE.get(key)
+    if pen is None:
+        pen = _PEN_CACHE[key] = pg.mkPen(*args, **kwargs)
+    return pen
+
+
+def _curve_items(plot) -> list:
+    """The PlotDataItems of `plot`, skipping scatters and other data items that have no curve"""
+    return [item for item in plot.listDataItems() if isinstance(item, pg.PlotDataItem)]
+
+
+def _brush(*args):
+    """pg.mkBrush(*args), built once per distinct colour and shared. Do not modify."""
+    brush = _BRUSH_CACHE.get(args)
+    if brush is None:
+        brush = _BRUSH_CACHE[args] = pg.mkBrush(*args)
+    return brush
+
 
+def _brush_palette(rgb: np.ndarray, alpha: int) -> np.ndarray:
+    """Object array with one QBrush per row of an (N, 3) colour array, for indexing by level"""
+    rgb = np.clip(rgb.astype(np.int64), 0, 255)  # astype truncates like int()
+    palette = np.empty(len(rgb), dtype=object)
+    palette[:] = [pg.mkBrush(r, g, b, alpha) for r, g, b in rgb.tolist()]
+    return palette
+
+
+def _speed_ramp(norm: np.ndarray) -> np.ndarray:
+    """Blue -> green -> red colours for speeds normalised to [0, 1], as an (N, 3) array"""
+    rgb = np.empty((len(norm), 3))
+    low = norm < 0.33
+    high = norm >= 0.67
+    mid = ~low & ~high
+    rgb[low] = np.column_stack([np.zeros(low.sum()), norm[low] * 3 * 255, np.full(low.sum(), 255)])
+    ramp = (norm[mid] - 0.33) * 3 * 255
+    rgb[mid] = np.column_stack([ramp, np.full(len(ramp), 255), 255 - ramp])
+    rgb[high] = np.column_stack([np.full(high.sum(), 255), 255 - (norm[high] - 0.67) * 3 * 255, np.zeros(high.sum())])
+    return rgb
 
 
 class TelemetryAnalytics:
@@ -73,6 +508,15 @@ class TelemetryAnalytics:
         if df.empty:
             return {}
         
+        if HAS_NUMBA:
+            def column(name):
+                return df[name].to_numpy(dtype=np.float64) if name in df else _NO_COLUMN
+            
+            values = _lap_stats_kernel(len(df), column('speed'), column('accy_can'), column('pbrake_f'),
+                                       column('pbrake_r'), column('aps'), column('elapsed_seconds'),
+                                       column('Laptrigger_lapdist_dls'))
+            return dict(zip(_LAP_STAT_KEYS, values.tolist()))
+        
         stats = {
             'top_speed': df['speed'].max() if 'speed' in df else 0,
             'max_lat_g': abs(df['accy_can']).max() if 'accy_can' in df else 0,
@@ -82,22 +526,23 @@ class TelemetryAnalytics:
         
         # Coasting percentage
         if 'aps' in df and 'pbrake_f' in df:
-            throttle = df['aps'].fillna(0)
-            brake = df['pbrake_f'].fillna(0)
-            coasting = ((throttle < 5) & (brake < 1)).sum()
+            throttle = df['aps'].to_numpy(dtype=np.float64, na_value=0)
+            brake = df['pbrake_f'].to_numpy(dtype=np.float64, na_value=0)
+            coasting = np.count_nonzero((throttle < 5) & (brake < 1))
             stats['coasting_pct'] = (coasting / len(df)) * 100 if len(df) > 0 else 0
         else:
             stats['coasting_pct'] = 0
         
         # Brake bias (only when braking hard)
         if 'pbrake_f' in df and 'pbrake_r' in df:
-            braking_mask = df['pbrake_f'] > 10
+            front = df['pbrake_f'].to_numpy(dtype=np.float64)
+            braking_mask = front > 10
             if braking_mask.any():
-                front = df.loc[braking_mask, 'pbrake_f']
-                rear = df.loc[braking_mask, 'pbrake_r']
-                total = front + rear
-                bias = (front / total * 100).mean()
-                stats['brake_bias'] = bias if not np.isnan(bias) else 50
+                front = front[braking_mask]
+                rear = df['pbrake_r'].to_numpy(dtype=np.float64)[braking_mask]
+                bias = front / (front + rear) * 100
+                bias = bias[np.isfinite(bias)]
+                stats['brake_bias'] = float(bias.mean()) if len(bias) else 50
             else:
                 stats['brake_bias'] = 50
         else:
@@ -127,20 +572,38 @@ class TelemetryAnalytics:
         if df.empty or 'Steering_Angle' not in df or 'accy_can' not in df or 'speed' not in df:
             return np.array([])
         
-        steering = df['Steering_Angle'].fillna(0).abs()
-        lat_g = df['accy_can'].fillna(0).abs()
-        speed = df['speed'].fillna(0)
+        steering = df['Steering_Angle'].to_numpy(dtype=np.float64, na_value=0)
+        lat_g = df['accy_can'].to_numpy(dtype=np.float64, na_value=0)
+        speed = df['speed'].to_numpy(dtype=np.float64, na_value=0)
+        
+        if HAS_NUMBA:
+            smoothed = np.empty(len(steering))
+            _instability_kernel(steering, lat_g, speed, smoothed)
+            return smoothed
         
-        raw_score = steering * lat_g * (speed / 100)
+        raw_score = np.abs(steering) * np.abs(lat_g) * (speed / 100)
         
         # 5-point moving average
         if len(raw_score) >= 5:
             smoothed = uniform_filter1d(raw_score, size=5, mode='nearest')
         else:
-            smoothed = raw_score.values
+            smoothed = raw_score
         
         return smoothed
     
+    @staticmethod
+    def _event_columns(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Distance, RPM and speed pulled out once as arrays, so per-event records index
+        them directly instead of building a row Series per sample. A missing channel
+        falls back to the sample index (distance) or 0, as the old row.get() calls did.
+        """
+        n = len(df)
+        dist = df['Laptrigger_lapdist_dls'].to_numpy() if 'Laptrigger_lapdist_dls' in df else np.arange(n)
+        rpm = df['nmot'].to_numpy() if 'nmot' in df else np.zeros(n)
+        speed = df['speed'].to_numpy() if 'speed' in df else np.zeros(n)
+        return dist, rpm, speed
+    
     @staticmethod
     def detect_gear_shifts(df: pd.DataFrame) -> Dict[str, List[Dict]]:
         """
@@ -151,44 +614,39 @@ class TelemetryAnalytics:
         if df.empty or 'gear' not in df:
             return {'upshifts': [], 'downshifts': []}
         
-        upshifts = []
-        downshifts = []
-        
-        gear = df['gear'].fillna(0).astype(int)
-        
-        for i in range(1, len(df)):
-            prev_gear = gear.iloc[i-1]
-            curr_gear = gear.iloc[i]
-            
-            if curr_gear > prev_gear:  # Upshift
-                shift = {
-                    'distance': df.iloc[i].get('Laptrigger_lapdist_dls', i),
-                    'rpm_before': df.iloc[i-1].get('nmot', 0),
-                    'speed': df.iloc[i].get('speed', 0),
-                    'from_gear': prev_gear,
-                    'to_gear': curr_gear,
-                    'index': i
-                }
-                upshifts.append(shift)
-                
-            elif curr_gear < prev_gear and curr_gear > 0:  # Downshift (ignore to neutral)
-                shift = {
-                    'distance': df.iloc[i].get('Laptrigger_lapdist_dls', i),
-                    'rpm_after': df.iloc[i].get('nmot', 0),
-                    'speed': df.iloc[i].get('speed', 0),
-                    'from_gear': prev_gear,
-                    'to_gear': curr_gear,
-                    'index': i
-                }
-                downshifts.append(shift)
-        
+        gear = df['gear'].to_numpy(dtype=np.int64, na_value=0)
+        delta = np.diff(gear)
+
+        up_idx = np.flatnonzero(delta > 0) + 1
+        down_idx = np.flatnonzero((delta < 0) & (gear[1:] > 0)) + 1  # Ignore shifts to neutral
+
+        dist, rpm, speed = TelemetryAnalytics._event_columns(df)
+
+        upshifts = [{
+            'distance': dist[i],
+            'rpm_before': rpm[i - 1],
+            'speed': speed[i],
+            'from_gear': int(gear[i - 1]),
+            'to_gear': int(gear[i]),
+            'index': i
+        } for i in up_idx.tolist()]
+
+        downshifts = [{
+            'distance': dist[i],
+            'rpm_after': rpm[i],
+            'speed': speed[i],
+            'from_gear': int(gear[i - 1]),
+            'to_gear': int(gear[i]),
+            'index': i
+        } for i in down_idx.tolist()]
+
         return {'upshifts': upshifts, 'downshifts': downshifts}
     
     @staticmethod
     def calculate_time_delta(active_df: pd.DataFrame, reference_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
         """
         Calculate time delta between two laps, synced by distance.
-        Returns: (distance_array, delta_array)
+        Returns: (distance_array, delta_array), both finite
         Delta is positive when active lap is slower.
         """
         if active_df.empty or reference_df.empty:
@@ -202,27 +660,32 @@ class TelemetryAnalytics:
             return np.array([]), np.array([])
         
         # Normalize time to lap start
-        active_time = active_df['elapsed_seconds'] - active_df['elapsed_seconds'].iloc[0]
-        ref_time = reference_df['elapsed_seconds'] - reference_df['elapsed_seconds'].iloc[0]
-        
-        active_dist = active_df['Laptrigger_lapdist_dls'].values
-        ref_dist = reference_df['Laptrigger_lapdist_dls'].values
-        
-        # For each point in active lap, find closest point in reference lap
-        deltas = []
-        distances = []
-        
-        for i, dist in enumerate(active_dist):
-            # Find closest distance in reference (within 33ft tolerance)
-            diff = np.abs(ref_dist - dist)
-            min_idx = np.argmin(diff)
-            
-            if diff[min_idx] < 33:  # Within tolerance (~10m)
-                delta = active_time.iloc[i] - ref_time.iloc[min_idx]
-                deltas.append(delta)
-                distances.append(dist)
-        
-        return np.array(distances), np.array(deltas)
+        active_time = active_df['elapsed_seconds'].to_numpy(dtype=np.float64)
+        ref_time = reference_df['elapsed_seconds'].to_numpy(dtype=np.float64)
+        active_time = active_time - active_time[0]
+        ref_time = ref_time - ref_time[0]
+
+        active_dist = active_df['Laptrigger_lapdist_dls'].to_numpy(dtype=np.float64)
+        ref_dist = reference_df['Laptrigger_lapdist_dls'].to_numpy(dtype=np.float64)
+
+        # Lap distance is nearly monotonic; sort once (stable, so a no-op in the usual case)
+        # and binary search instead of scanning the whole reference lap per point
+        order = np.argsort(ref_dist, kind='stable')
+        sorted_dist = ref_dist[order]
+
+        # For each point in active lap, pick the closer of the two bracketing reference points
+        right = np.clip(np.searchsorted(sorted_dist, active_dist), 1, max(len(sorted_dist) - 1, 1))
+        left = right - 1
+        right = np.minimum(right, len(sorted_dist) - 1)
+        take_left = np.abs(sorted_dist[left] - active_dist) <= np.abs(sorted_dist[right] - active_dist)
+        nearest = np.where(take_left, left, right)
+
+        # Within tolerance (~10m; false for a NaN distance) and with both times known
+        deltas = active_time - ref_time[order[nearest]]
+        mask = np.abs(sorted_dist[nearest] - active_dist) < 33
+        mask &= np.isfinite(deltas)
+
+        return active_dist[mask], deltas[mask]
     
     @staticmethod
     def identify_apexes(df: pd.DataFrame, min_lat_g: float = 0.6) -> List[Dict]:
@@ -233,22 +696,108 @@ class TelemetryAnalytics:
         if df.empty or 'accy_can' not in df:
             return []
         
-        lat_g = df['accy_can'].fillna(0).abs()
+        lat_g = np.abs(df['accy_can'].to_numpy(dtype=np.float64, na_value=0))
+        
+        # Strict local maxima (endpoints excluded) above the threshold
+        peaks = argrelmax(lat_g, order=1)[0]
+        peaks = peaks[lat_g[peaks] > min_lat_g]
         
-        apexes = []
-        for i in range(1, len(lat_g) - 1):
-            if lat_g.iloc[i] > min_lat_g:
-                # Check if local maximum
-                if lat_g.iloc[i] > lat_g.iloc[i-1] and lat_g.iloc[i] > lat_g.iloc[i+1]:
-                    apex = {
-                        'distance': df.iloc[i].get('Laptrigger_lapdist_dls', i),
-                        'speed': df.iloc[i].get('speed', 0),
-                        'lat_g': lat_g.iloc[i],
-                        'index': i
-                    }
-                    apexes.append(apex)
+        dist, _, speed = TelemetryAnalytics._event_columns(df)
         
-        return apexes
+        return [{
+            'distance': dist[i],
+            'speed': speed[i],
+            'lat_g': lat_g[i],
+            'index': i
+        } for i in peaks.tolist()]
+
+
+def _compute_cache_indices(df: pd.DataFrame, arr: Dict[str, np.ndarray]) -> Dict:
+    """
+    Whole-session lookups of the tab, using only NumPy/pandas so it can run off the GUI
+    thread (see _CacheTask): lap row ranges and durations, and the per-sample colour
+    indices that RaceTelemetryTab._apply_cache_indices turns into brushes.
+    """
+    n = len(df)
+    
+    # 0. Row range and duration of every lap, so per-tick lap lookups don't rescan the lap column
+    lap_start_idx = {}
+    lap_stop_idx = {}
+    lap_durations = pd.Series(dtype=np.float64)
+    if 'lap' in arr:
+        lap_col = arr['lap'].astype(np.float64)
+        rows = np.flatnonzero(np.isfinite(lap_col))
+        laps, first, counts = np.unique(lap_col[rows], return_index=True, return_counts=True)
+        _, last_from_end = np.unique(lap_col[rows][::-1], return_index=True)
+        start = rows[first]
+        stop = rows[len(rows) - 1 - last_from_end] + 1
+        lap_ids = laps.astype(int).tolist()
+        lap_start_idx = dict(zip(lap_ids, start.tolist()))
+        # Only laps stored as one unbroken block can be sliced instead of masked
+        contiguous = (stop - start == counts).tolist()
+        lap_stop_idx = {lap: end for lap, end, ok in zip(lap_ids, stop.tolist(), contiguous) if ok}
+        if 'elapsed_seconds' in df:
+            times = df.groupby('lap')['elapsed_seconds'].agg(['min', 'max'])
+            lap_durations = times['max'] - times['min']
+    
+    # 1-3. Colour indices: track map bins (see _track_bin_colors), speed level for the
+    # friction circle, long-g level for driver demand (+256 selects the green half)
+    has_pedals = 'pbrake_f' in arr and 'aps' in arr
+    speed = arr.get('speed', _NO_COLUMN)
+    long_g = arr.get('accx_can', _NO_COLUMN)
+    max_speed = speed.max() if len(speed) and speed.max() > 0 else 200
+    if HAS_NUMBA:
+        track_bins = np.empty(n, dtype=np.intp)
+        speed_level = np.empty(n, dtype=np.uint8)
+        demand_index = np.empty(n, dtype=np.uint16)
+        _colour_index_kernel(arr['pbrake_f'] if has_pedals else _NO_COLUMN,
+                             arr['aps'] if has_pedals else _NO_COLUMN,
+                             speed, long_g, float(max_speed), _TRACK_LEVELS,
+                             track_bins, speed_level, demand_index)
+    else:
+        track_bins = np.zeros(n, dtype=np.intp)
+        if has_pedals:
+            brake_norm = np.clip(arr['pbrake_f'] / 100, 0, 1)
+            throttle_norm = np.clip(arr['aps'] / 100, 0, 1)
+            
+            # Red when braking, green on throttle, otherwise light blue
+            braking = brake_norm > 0.1
+            on_throttle = ~braking & (throttle_norm > 0.1)
+            levels = _TRACK_LEVELS
+            track_bins[:] = 1
+            track_bins[braking] = 2 + np.minimum((brake_norm[braking] * levels).astype(np.intp), levels - 1)
+            track_bins[on_throttle] = 2 + levels + np.minimum((throttle_norm[on_throttle] * levels).astype(np.intp), levels - 1)
+        speed_level = np.clip(speed / max_speed * 255, 0, 255).astype(np.uint8)
+        demand_level = (255 * np.minimum(np.abs(long_g), 1.0)).astype(np.uint16)
+        demand_index = demand_level + np.where(long_g > 0, 256, 0).astype(np.uint16)
+    
+    return {'lap_start_idx': lap_start_idx, 'lap_stop_idx': lap_stop_idx, 'lap_durations': lap_durations,
+            'track_bins': track_bins, 'speed_level': speed_level, 'demand_index': demand_index,
+            'has_speed': len(speed) > 0, 'has_long_g': len(long_g) > 0}
+
+
+class _CacheSignals(QObject):
+    finished = pyqtSignal(int, object)  # Generation, _compute_cache_indices result (None on failure)
+
+
+class _CacheTask(QRunnable):
+    """Runs _compute_cache_indices for one loaded session on a pool thread"""
+
+    def __init__(self, generation, df, arr):
+        super().__init__()
+        self.setAutoDelete(False)  # The tab holds the task until it reports back
+        self.generation = generation
+        self.df = df
+        self.arr = arr
+        self.signals = _CacheSignals()
+
+    def run(self):
+        try:
+            result = _compute_cache_indices(self.df, self.arr)
+        except Exception:
+            traceback.print_exc()
+            result = None
+        self.signals.finished.emit(self.generation, result)
 
 
 class RaceTelemetryTab(QWidget):
@@ -265,6 +814,12 @@ class RaceTelemetryTab(QWidget):
         
         # Data
         self.current_telemetry_df = pd.DataFrame()  # Full telemetry for current vehicle
+        self._arr = {}  # Column arrays of current_telemetry_df (see _telemetry_arrays)
+        self._range_indexed = False
+        self._column_cache = {}  # (column, fill) -> whole-session plot array (see _column)
+        self._frame_columns = {}  # id(frame) -> (frame, {(column, fill): array}) (see _column)
+        self._finite_cache = {}  # (columns, fill) -> whole-session finite-row mask (see _finite_rows)
+        self._track_pairs = None  # Whole-session _segment_pairs of the track map
         self.active_lap = 'All'  # Current selected lap
         self.compare_lap = None  # Reference lap for comparison
         self.selected_turn = 'All Turns'  # Selected turn for filtering
@@ -278,17 +833,54 @@ class RaceTelemetryTab(QWidget):
         self.lap_start_time = 0
         self.previous_lap_data = pd.DataFrame()
         
-        # Real-time data accumulation
-        self.accumulated_data = pd.DataFrame()
-        
         # Update debouncing with QTimer
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self.update_visualizations)
-        self.update_debounce_ms = 16  # ~60fps max update rate
+        self.update_debounce_ms = 50  # ~20 updates/s; smoother than the eye needs for replay
+        
+        # Turn key -> rows of that turn (see _turn_mask)
+        self._turn_masks = {}
+        
+        # Turn shading per distance plot (see update_sector_markers)
+        self._sector_marker_items = {}
+        
+        # Charts needing a redraw, and the slice they were last drawn from (see update_visualizations)
+        self._dirty = dict.fromkeys(_CHARTS, True)
+        self._painted_key = None
+        self._input_key = None  # Inputs of the last drawn frame
+        # Reference rows the ghost curves show, or 'cleared' (see update_comparison_visualizations)
+        self._ghost_key = None
+        
+        # Coalesced callbacks for _throttled_call: key -> (timer, latest callable)
+        self._throttled = {}
         
         # Analytics helper
         self.analytics = TelemetryAnalytics()
+        # Brush palettes indexed by 8-bit level, built once and shared by every cache rebuild
+        levels = np.arange(256)
+        self._speed_brushes = _brush_palette(_speed_ramp(levels / 255), 200)
+        # Driver demand: red ramp (braking) followed by green ramp (accelerating)
+        self._demand_brushes = np.concatenate([
+            _brush_palette(np.column_stack([levels, 0 * levels, 0 * levels]), 180),
+            _brush_palette(np.column_stack([0 * levels, levels, 0 * levels]), 180)])
+        # Plain blue for scatter points without a cached colour, passed as one scalar brush
+        self._default_point_brush = _brush(59, 130, 246, 180)
+        
+        # Session lookups built by the cache task (see _rebuild_cache)
+        self._cache_ready = False
+        self._cache_generation = 0
+        self._cache_tasks = {}  # generation -> running _CacheTask
+        # Lap number -> row range / duration of that lap
+        self._lap_start_idx = {}
+        self._lap_stop_idx = {}
+        self._lap_durations = pd.Series(dtype=np.float64)
+        self._best_lap_memo = {}  # current lap -> best completed lap before it
+        
+        # Results for completed lap slices: (first index, last index, rows) -> {name: result}
+        self._analytics_cache = {}
+        # Instability of the live lap, grown as playback advances (see _instability)
+        self._live_instability = None  # (generation, first row, rows filled, buffer)
         
         # Focus management
         self.plots = []
@@ -473,25 +1065,28 @@ class RaceTelemetryTab(QWidget):
         
         return bar
     
-    def _format_stat_html(self, key: str, value: str, color: str = None) -> str:
-        """Format stat value with unit using HTML"""
+    def _set_stat(self, key: str, value: str, color: str = None):
+        """Show a stat value as plain text; the style is only touched when its colour changes"""
+        label = self.stat_labels[key]
+        label.setText(value)
         if color is None:
             color = self.stat_colors.get(key, '#ffffff')
-        unit = self.stat_unit_names.get(key, '')
-        return f'<span style="color: {color}; font-size: 18pt; font-weight: bold;">{value}</span> <span style="color: #64748b; font-size: 11pt;">{unit}</span>'
+        if self._stat_value_colors.get(key) != color:
+            label.setStyleSheet(f"color: {color}; font-size: 18pt; font-weight: bold; background: transparent; border: none;")
+            self._stat_value_colors[key] = color
     
     def initialize_default_stats(self):
         """Initialize stats with default values"""
         if hasattr(self, 'stat_labels'):
-            self.stat_labels['lap_number'].setText(self._format_stat_html('lap_number', '1'))
-            self.stat_labels['top_speed'].setText(self._format_stat_html('top_speed', '0.0'))
-            self.stat_labels['max_lat_g'].setText(self._format_stat_html('max_lat_g', '0.00'))
-            self.stat_labels['peak_brake'].setText(self._format_stat_html('peak_brake', '0.0'))
-            self.stat_labels['brake_bias'].setText(self._format_stat_html('brake_bias', '50.0'))
-            self.stat_labels['coasting_pct'].setText(self._format_stat_html('coasting_pct', '0.0'))
-            self.stat_labels['lap_time'].setText(self._format_stat_html('lap_time', '0.00'))
-            self.stat_labels['total_time'].setText(self._format_stat_html('total_time', '0.00'))
-            self.stat_labels['time_delta'].setText(self._format_stat_html('time_delta', '+0.00'))
+            self._set_stat('lap_number', '1')
+            self._set_stat('top_speed', '0.0')
+            self._set_stat('max_lat_g', '0.00')
+            self._set_stat('peak_brake', '0.0')
+            self._set_stat('brake_bias', '50.0')
+            self._set_stat('coasting_pct', '0.0')
+            self._set_stat('lap_time', '0.00')
+            self._set_stat('total_time', '0.00')
+            self._set_stat('time_delta', '+0.00')
             
             # Force all labels and their parents to be visible
             for label in self.stat_labels.values():
@@ -520,6 +1115,7 @@ class RaceTelemetryTab(QWidget):
         
         # Stat labels and units (will be populated dynamically)
         self.stat_labels = {}
+        self._stat_value_colors = {}
         self.stat_colors = {}
         self.stat_unit_names = {}
         
@@ -576,14 +1172,30 @@ class RaceTelemetryTab(QWidget):
             
             stat_layout.addStretch()
             
-            # Value (Right side)
-            value_text = "0.0" if key != 'brake_bias' else "50.0"
-            combined_label = QLabel(f'<span style="color: {color}; font-size: 16pt; font-weight: bold;">{value_text}</span> <span style="color: #64748b; font-size: 10pt;">{unit}</span>')
-            combined_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            combined_label.setStyleSheet("background: transparent; border: none;")
-            stat_layout.addWidget(combined_label)
+            # Value and unit (Right side); plain text, so updates skip rich-text parsing
+            value_layout = QHBoxLayout()
+            value_layout.setSpacing(4)
             
-            self.stat_labels[key] = combined_label
+            value_label = QLabel()
+            value_label.setTextFormat(Qt.TextFormat.PlainText)
+            value_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            value_layout.addWidget(value_label)
+            
+            unit_label = QLabel(unit)
+            unit_label.setTextFormat(Qt.TextFormat.PlainText)
+            unit_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+            unit_label.setStyleSheet("color: #64748b; font-size: 11pt; background: transparent; border: none;")
+            value_layout.addWidget(unit_label)
+            stat_layout.addLayout(value_layout)
+            
+            self.stat_labels[key] = value_label
+            self._set_stat(key, "0.0" if key != 'brake_bias' else "50.0")
+            
+            # Fixed size for the widest value shown: Qt skips the layout request for a
+            # fixed-size widget, so a new value repaints the label without re-laying out the grid
+            value_label.ensurePolished()
+            metrics = value_label.fontMetrics()
+            value_label.setFixedSize(metrics.horizontalAdvance("-0000.00"), metrics.height())
             
             layout.addWidget(stat_container, row, col)
         
@@ -599,7 +1211,9 @@ class RaceTelemetryTab(QWidget):
         """Create all visualization charts with unique designs in a grid layout"""
         
         # Configure PyQtGraph
-        pg.setConfigOptions(antialias=True, background='#0f172a', foreground='#e2e8f0')
+        # Antialiasing is off by default and only switched on for curves whose view has
+        # settled (see _set_curves_idle), so live updates paint without it
+        pg.setConfigOptions(antialias=False, background='#0f172a', foreground='#e2e8f0')
         
         # Helper to add plot to grid
         def add_plot_to_grid(container, row, col, colspan=1):
@@ -630,7 +1244,17 @@ class RaceTelemetryTab(QWidget):
         self.track_map_plot.getAxis('left').setTextPen('#ec4899')
         self.track_map_plot.getAxis('bottom').setTextPen('#ec4899')
         
-        self.track_map_scatter = pg.ScatterPlotItem(size=5, pen=pg.mkPen(None))
+        # The trace is one line item per colour bin; the scatter only holds the car marker
+        self.track_map_curves = []
+        for color in _track_bin_colors():
+            # Copy: the cached pen is shared and mkPen has no cap style argument
+            pen = QPen(_pen(color=color, width=5))
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            curve = pg.PlotCurveItem(pen=pen, connect='pairs')
+            self.track_map_plot.addItem(curve)
+            self.track_map_curves.append(curve)
+        
+        self.track_map_scatter = pg.ScatterPlotItem(size=15, pen=_pen(None), brush=_brush(255, 255, 0, 255))
         self.track_map_plot.addItem(self.track_map_scatter)
         track_map_layout.addWidget(self.track_map_plot)
         
@@ -651,16 +1275,20 @@ class RaceTelemetryTab(QWidget):
         self.friction_circle_plot.getAxis('left').setTextPen('#a78bfa')
         self.friction_circle_plot.getAxis('bottom').setTextPen('#a78bfa')
         
-        # Add reference circles
+        # Add reference circles (static, so plain cached path items rather than data curves)
         for radius, alpha in [(0.5, 0.3), (1.0, 0.4), (1.5, 0.5)]:
-            theta = np.linspace(0, 2*np.pi, 100)
-            circle_x = radius * np.cos(theta)
-            circle_y = radius * np.sin(theta)
-            self.friction_circle_plot.plot(circle_x, circle_y, 
-                pen=pg.mkPen(color=(147, 51, 234, int(alpha * 255)), width=2, style=Qt.PenStyle.DashLine))
-        
-        self.friction_scatter = pg.ScatterPlotItem(size=4, pen=pg.mkPen(None))
+            path = QPainterPath()
+            path.addEllipse(QRectF(-radius, -radius, 2 * radius, 2 * radius))
+            ring = QGraphicsPathItem(path)
+            ring.setPen(_pen(color=(147, 51, 234, int(alpha * 255)), width=2, style=Qt.PenStyle.DashLine))
+            ring.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+            self.friction_circle_plot.addItem(ring)
+        
+        self.friction_scatter = pg.ScatterPlotItem(size=4, pen=_pen(None))
         self.friction_circle_plot.addItem(self.friction_scatter)
+        # Newest sample, drawn on top of the cloud
+        self.friction_marker = pg.ScatterPlotItem(size=20, pen=_pen(None), brush=_brush(255, 255, 255, 255))
+        self.friction_circle_plot.addItem(self.friction_marker)
         friction_layout.addWidget(self.friction_circle_plot)
         
         add_plot_to_grid(friction_container, 0, 1)
@@ -679,17 +1307,17 @@ class RaceTelemetryTab(QWidget):
         self.brake_speed_plot.setLabel('bottom', 'Distance', units='ft', **{'color': '#3b82f6', 'font-size': '11pt'})
         self.brake_speed_plot.showGrid(x=True, y=True, alpha=0.25)
         
-        self.speed_curve = self.brake_speed_plot.plot(pen=pg.mkPen(color=(16, 185, 129), width=3), name='Speed')
-        self.brake_curve = self.brake_speed_plot.plot(pen=pg.mkPen(color=(239, 68, 68), width=3), name='Brake')
+        self.speed_curve = self.brake_speed_plot.plot(pen=_pen(color=(16, 185, 129), width=3), name='Speed')
+        self.brake_curve = self.brake_speed_plot.plot(pen=_pen(color=(239, 68, 68), width=3), name='Brake')
         
         # Ghost curves
         self.speed_ghost_curve = self.brake_speed_plot.plot(
-            pen=pg.mkPen(color=(147, 51, 234), width=3, style=Qt.PenStyle.DashLine), name='Ref Speed')
+            pen=_pen(color=(147, 51, 234), width=3, style=Qt.PenStyle.DashLine), name='Ref Speed')
         self.brake_ghost_curve = self.brake_speed_plot.plot(
-            pen=pg.mkPen(color=(236, 72, 153), width=3, style=Qt.PenStyle.DashLine), name='Ref Brake')
+            pen=_pen(color=(236, 72, 153), width=3, style=Qt.PenStyle.DashLine), name='Ref Brake')
             
         # Real-time line
-        self.brake_speed_line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen('w', width=2))
+        self.brake_speed_line = pg.InfiniteLine(angle=90, movable=False, pen=_pen('w', width=2))
         self.brake_speed_plot.addItem(self.brake_speed_line)
         
         legend = self.brake_speed_plot.addLegend(offset=(10, 10))
@@ -709,13 +1337,16 @@ class RaceTelemetryTab(QWidget):
         self.g_force_plot.setLabel('left', 'G-Force', units='g', **{'color': '#a78bfa', 'font-size': '12pt'})
         self.g_force_plot.setLabel('bottom', 'Distance', units='ft', **{'color': '#3b82f6', 'font-size': '11pt'})
         self.g_force_plot.showGrid(x=True, y=True, alpha=0.25)
-        self.g_force_plot.addLine(y=0, pen=pg.mkPen(color=(128, 128, 128), width=1))
+        self.g_force_plot.addLine(y=0, pen=_pen(color=(128, 128, 128), width=1))
         
-        self.lat_g_curve = self.g_force_plot.plot(pen=pg.mkPen(color=(147, 51, 234), width=3), name='Lateral G')
-        self.long_g_curve = self.g_force_plot.plot(pen=pg.mkPen(color=(59, 130, 246), width=3), name='Longitudinal G')
+        self.lat_g_curve = self.g_force_plot.plot(pen=_pen(color=(147, 51, 234), width=3), name='Lateral G')
+        self.long_g_curve = self.g_force_plot.plot(pen=_pen(color=(59, 130, 246), width=3), name='Longitudinal G')
+        # Reference lap ghosts (see update_comparison_visualizations)
+        self.lat_g_ghost = self.g_force_plot.plot(pen=_pen('#1e3a8a', width=1, style=Qt.PenStyle.DashLine))
+        self.long_g_ghost = self.g_force_plot.plot(pen=_pen('#3f2e10', width=1, style=Qt.PenStyle.DashLine))
         
         # Real-time line
-        self.g_force_line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen('w', width=2))
+        self.g_force_line = pg.InfiniteLine(angle=90, movable=False, pen=_pen('w', width=2))
         self.g_force_plot.addItem(self.g_force_line)
         
         legend = self.g_force_plot.addLegend(offset=(10, 10))
@@ -738,7 +1369,7 @@ class RaceTelemetryTab(QWidget):
         self.driver_demand_plot.setLabel('bottom', 'RPM', **{'color': '#f59e0b', 'font-size': '12pt'})
         self.driver_demand_plot.showGrid(x=True, y=True, alpha=0.2)
         
-        self.driver_demand_scatter = pg.ScatterPlotItem(size=5, pen=pg.mkPen(None))
+        self.driver_demand_scatter = pg.ScatterPlotItem(size=6, pen=_pen(None))
         self.driver_demand_plot.addItem(self.driver_demand_scatter)
         demand_layout.addWidget(self.driver_demand_plot)
         
@@ -757,17 +1388,18 @@ class RaceTelemetryTab(QWidget):
         self.gear_shift_plot.showGrid(x=True, y=True, alpha=0.25)
         
         self.rpm_curve = self.gear_shift_plot.plot(pen=None, brush=(59, 130, 246, 80), fillLevel=0)
-        self.gear_curve = self.gear_shift_plot.plot(pen=pg.mkPen(color=(255, 255, 255), width=4), stepMode='right')
+        self.gear_curve = self.gear_shift_plot.plot(pen=_pen(color=(255, 255, 255), width=4), stepMode='right')
+        self.gear_ghost = self.gear_shift_plot.plot(pen=_pen('#475569', width=1, style=Qt.PenStyle.DashLine))
         
-        self.upshift_scatter = pg.ScatterPlotItem(size=12, brush=pg.mkBrush(16, 185, 129, 255), 
-                                                   symbol='t', pen=pg.mkPen(color=(255, 255, 255), width=2))
-        self.downshift_scatter = pg.ScatterPlotItem(size=12, brush=pg.mkBrush(251, 146, 60, 255),
-                                                     symbol='t1', pen=pg.mkPen(color=(255, 255, 255), width=2))
+        self.upshift_scatter = pg.ScatterPlotItem(size=12, brush=_brush(16, 185, 129, 255), 
+                                                   symbol='t', pen=_pen(color=(255, 255, 255), width=2))
+        self.downshift_scatter = pg.ScatterPlotItem(size=12, brush=_brush(251, 146, 60, 255),
+                                                     symbol='t1', pen=_pen(color=(255, 255, 255), width=2))
         self.gear_shift_plot.addItem(self.upshift_scatter)
         self.gear_shift_plot.addItem(self.downshift_scatter)
         
         # Real-time line
-        self.gear_line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen('w', width=2))
+        self.gear_line = pg.InfiniteLine(angle=90, movable=False, pen=_pen('w', width=2))
         self.gear_shift_plot.addItem(self.gear_line)
         
         gear_layout.addWidget(self.gear_shift_plot)
@@ -791,12 +1423,13 @@ class RaceTelemetryTab(QWidget):
         self.instability_plot.getAxis('bottom').setTextPen('#f59e0b')
         
         self.instability_curve = self.instability_plot.plot(pen=None, brush=(239, 68, 68, 120), fillLevel=0)
-        self.steering_curve = self.instability_plot.plot(pen=pg.mkPen(color=(6, 182, 212), width=3))
+        self.steering_curve = self.instability_plot.plot(pen=_pen(color=(6, 182, 212), width=3))
+        self.instability_ghost = self.instability_plot.plot(pen=_pen('#450a0a', width=1, style=Qt.PenStyle.DashLine))
         
-        self.instability_plot.addLine(y=100, pen=pg.mkPen(color=(255, 255, 255), width=2, style=Qt.PenStyle.DashLine))
+        self.instability_plot.addLine(y=100, pen=_pen(color=(255, 255, 255), width=2, style=Qt.PenStyle.DashLine))
         
         # Real-time line
-        self.instability_line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen('w', width=2))
+        self.instability_line = pg.InfiniteLine(angle=90, movable=False, pen=_pen('w', width=2))
         self.instability_plot.addItem(self.instability_line)
         
         instability_layout.addWidget(self.instability_plot)
@@ -816,13 +1449,13 @@ class RaceTelemetryTab(QWidget):
         self.brake_bias_plot.showGrid(x=True, y=True, alpha=0.25)
         self.brake_bias_plot.setYRange(40, 80)
         
-        self.brake_bias_plot.addLine(y=50, pen=pg.mkPen(color=(100, 100, 100), width=1, style=Qt.PenStyle.DashLine))
-        self.brake_bias_plot.addLine(y=60, pen=pg.mkPen(color=(100, 100, 100), width=1, style=Qt.PenStyle.DotLine))
+        self.brake_bias_plot.addLine(y=50, pen=_pen(color=(100, 100, 100), width=1, style=Qt.PenStyle.DashLine))
+        self.brake_bias_plot.addLine(y=60, pen=_pen(color=(100, 100, 100), width=1, style=Qt.PenStyle.DotLine))
         
-        self.brake_bias_curve = self.brake_bias_plot.plot(pen=pg.mkPen(color=(251, 146, 60), width=3), connect='finite')
+        self.brake_bias_curve = self.brake_bias_plot.plot(pen=_pen(color=(251, 146, 60), width=3), connect='finite')
         
         # Real-time line
-        self.bias_line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen('w', width=2))
+        self.bias_line = pg.InfiniteLine(angle=90, movable=False, pen=_pen('w', width=2))
         self.brake_bias_plot.addItem(self.bias_line)
         
         bias_layout.addWidget(self.brake_bias_plot)
@@ -844,12 +1477,12 @@ class RaceTelemetryTab(QWidget):
         self.time_delta_plot.showGrid(x=True, y=True, alpha=0.25)
         self.time_delta_plot.getAxis('left').setTextPen('#10b981')
         self.time_delta_plot.getAxis('bottom').setTextPen('#3b82f6')
-        self.time_delta_plot.addLine(y=0, pen=pg.mkPen(color=(255, 255, 255), width=2, style=Qt.PenStyle.DashLine))
+        self.time_delta_plot.addLine(y=0, pen=_pen(color=(255, 255, 255), width=2, style=Qt.PenStyle.DashLine))
         
         self.time_delta_curve = self.time_delta_plot.plot(pen=None, brush=(59, 130, 246, 120), fillLevel=0)
         
         # Real-time line
-        self.time_delta_line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen('w', width=2))
+        self.time_delta_line = pg.InfiniteLine(angle=90, movable=False, pen=_pen('w', width=2))
         self.time_delta_plot.addItem(self.time_delta_line)
         
         time_delta_layout.addWidget(self.time_delta_plot)
@@ -858,19 +1491,59 @@ class RaceTelemetryTab(QWidget):
         
         add_plot_to_grid(time_delta_container, 4, 0, 2)  # Span 2 columns
         
+        # Playback position lines of the distance plots, and the x they were last moved to
+        self._rt_lines = (self.brake_speed_line, self.g_force_line, self.gear_line,
+                          self.instability_line, self.bias_line, self.time_delta_line)
+        self._rt_line_x = None
+        
         # Setup hover cursor for all plots
         self.setup_hover_cursor()
+        # Line items only: the gear plot also holds the shift marker scatters
+        self._distance_curves = [item for plot in self.distance_plots for item in _curve_items(plot)]
+        
+        # Reduce long laps to about one point per pixel column when zoomed out. Set per curve:
+        # the PlotItem-wide setting also reaches the gear plot's shift scatters, which lack it
+        for plot in self.distance_plots:
+            # Brake bias is sparse and NaN-gapped; peak decimation would swallow short braking events
+            if plot is not self.brake_bias_plot:
+                for item in _curve_items(plot):
+                    item.setDownsampling(auto=True, method='peak')
+        self._set_clip_to_view(True)
+        
+        # The G-G and demand scatters only receive the points inside a zoomed view (see
+        # _view_mask), so refill them when the user pans/zooms or returns to auto-range
+        for plot in (self.friction_circle_plot, self.driver_demand_plot):
+            plot.getViewBox().sigRangeChangedManually.connect(self.on_scatter_view_changed)
+            plot.getPlotItem().autoBtn.clicked.connect(self.on_scatter_view_changed)
+        
+        # Cache rendered curves so moving the playback/hover lines only blits them. The
+        # cache and antialiasing are dropped while a view's range changes (zoom, pan,
+        # auto-range as live data grows) and restored once it settles.
+        self.curve_idle_timer = QTimer(self)
+        self.curve_idle_timer.setSingleShot(True)
+        self.curve_idle_timer.timeout.connect(lambda: self._set_curves_idle(True))
+        for plot in self.distance_plots:
+            plot.getViewBox().sigRangeChanged.connect(self.on_distance_range_changed)
+        self._set_curves_idle(True)
 
     
     def set_telemetry_data(self, data):
         """Set telemetry data from loaded session"""
         if isinstance(data, list) and len(data) > 0:
             # Use the first dataset for now
-            self.current_telemetry_df = data[0]
+            self.current_telemetry_df = _compact_telemetry(data[0])
         elif isinstance(data, pd.DataFrame):
-            self.current_telemetry_df = data
+            self.current_telemetry_df = _compact_telemetry(data)
         else:
             return
+        self._arr = _telemetry_arrays(self.current_telemetry_df)
+        # Row labels are positions, so row-range slices can share whole-session columns (see _column)
+        index = self.current_telemetry_df.index
+        self._range_indexed = isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1
+        self._column_cache = {}
+        self._frame_columns = {}
+        self._finite_cache = {}
+        self._track_pairs = None
 
         # Store current playback index to maintain position across vehicle switches
         # Don't reset to 0 - let update_from_playback handle the position
@@ -879,18 +1552,21 @@ class RaceTelemetryTab(QWidget):
             self.playback_index = 0
             self.current_lap_number = 1
         
-        self._last_data_id = None  # Invalidate cache
+        self._analytics_cache.clear()
+        self._turn_masks.clear()
+        self._mark_dirty()
         
-        # Reset caches - force recalculation for new vehicle
-        if hasattr(self, '_cache_track_brushes'): del self._cache_track_brushes
-        if hasattr(self, '_cache_friction_brushes'): del self._cache_friction_brushes
-        if hasattr(self, '_cache_demand_brushes'): del self._cache_demand_brushes
+        # Large sessions: let the GPU rasterize the curve and scatter paths of every plot
+        use_gl = len(self.current_telemetry_df) >= _GL_VIEWPORT_THRESHOLD
+        for plot in (self.track_map_plot, self.friction_circle_plot, self.driver_demand_plot, *self.distance_plots):
+            plot.set_gl_viewport(use_gl)
         
         # Update UI with new vehicle data
         self.populate_lap_selectors()
         
-        # Force immediate update of all visualizations with new vehicle data
-        self.update_visualizations()
+        # Recalculate the session caches for the new vehicle; the charts are redrawn
+        # when they arrive
+        self._rebuild_cache()
 
     @pyqtSlot(int)
     def update_from_playback(self, current_index: int):
@@ -902,9 +1578,9 @@ class RaceTelemetryTab(QWidget):
         self.playback_index = current_index
         
         # Update current lap number from the data if available
-        if not self.current_telemetry_df.empty and 'lap' in self.current_telemetry_df:
-            if current_index < len(self.current_telemetry_df):
-                self.current_lap_number = int(self.current_telemetry_df.iat[current_index, self.current_telemetry_df.columns.get_loc('lap')])
+        lap = self._arr.get('lap')
+        if lap is not None and current_index < len(lap):
+            self.current_lap_number = int(lap[current_index])
         
         # Throttle updates - only start timer if not already running
         if hasattr(self, 'update_timer'):
@@ -939,10 +1615,59 @@ class RaceTelemetryTab(QWidget):
         self.active_lap = "Current Lap"
         self.active_lap_combo.setCurrentText("Current Lap")
 
+    def _set_clip_to_view(self, enabled: bool):
+        """Only build paths for the visible x range of the distance plots"""
+        for item in self._distance_curves:
+            item.setClipToView(enabled)
+
+    def _set_curves_idle(self, idle: bool):
+        """Toggle DeviceCoordinateCache and antialiasing on every curve of the distance plots"""
+        mode = (QGraphicsItem.CacheMode.DeviceCoordinateCache if idle
+                else QGraphicsItem.CacheMode.NoCache)
+        for item in self._distance_curves:
+            # The PlotDataItem hands its own flag to the curve on every setData, so set both
+            item.opts['antialias'] = idle
+            item.curve.opts['antialias'] = idle
+            item.curve.setCacheMode(mode)
+            item.curve.update()
+
+    def on_scatter_view_changed(self, *args):
+        """Refill the clipped scatters for the new view range"""
+        self._mark_dirty('friction', 'demand')
+        self._throttled_call('visualizations', self.update_visualizations)
+
+    def on_distance_range_changed(self, *args):
+        """Render directly and aliased while a view is rescaling; restore after 250 ms idle"""
+        if not self.curve_idle_timer.isActive():
+            self._set_curves_idle(False)
+        self.curve_idle_timer.start(250)
+
+    def _mark_dirty(self, *charts: str):
+        """Redraw `charts` (default: all of them) on the next update_visualizations"""
+        for chart in charts or _CHARTS:
+            self._dirty[chart] = True
+
+    def _throttled_call(self, key: str, fn, interval_ms: int = 50):
+        """
+        Run `fn` at most once per `interval_ms` for `key`. Calls arriving while one is
+        pending replace it, so only the latest runs.
+        """
+        entry = self._throttled.get(key)
+        if entry is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self._throttled[key][1]())
+            entry = self._throttled[key] = [timer, fn]
+        entry[1] = fn
+        if not entry[0].isActive():
+            entry[0].start(interval_ms)
+
     def on_active_lap_changed(self, text: str):
         """Handle active lap selection change"""
         self.active_lap = text
-        self.update_visualizations()
+        # Clipping assumes x increases; lap distance wraps back to 0 every lap in 'All Data'
+        self._set_clip_to_view(text != 'All Data')
+        self._throttled_call('visualizations', self.update_visualizations)
     
     def on_compare_lap_changed(self, text: str):
         """Handle compare lap selection change"""
@@ -953,16 +1678,19 @@ class RaceTelemetryTab(QWidget):
             self.compare_lap = text
             self.time_delta_container.setVisible(True)
         
-        self.update_visualizations()
+        self._throttled_call('visualizations', self.update_visualizations)
     
     def on_turn_changed(self, text: str):
         """Handle turn selection change"""
         self.selected_turn = text
-        self.update_visualizations()
+        self._throttled_call('visualizations', self.update_visualizations)
     
     def set_turn_data(self, turn_data: dict):
         """Set turn data from Tab 2 fine-tuning"""
         self.turn_data = turn_data if turn_data else {}
+        self._analytics_cache.clear()  # Turn slices may now cover different rows
+        self._turn_masks.clear()
+        self._mark_dirty()
         
         # Update turn combo box
         self.turn_combo.blockSignals(True)
@@ -1047,10 +1775,14 @@ class RaceTelemetryTab(QWidget):
             return pd.DataFrame()
             
         # Get current lap number from telemetry at playback position
-        # We access the column directly to avoid overhead
-        if 'lap' in self.current_telemetry_df and self.playback_index < len(self.current_telemetry_df):
-            self.current_lap_number = int(self.current_telemetry_df.iat[self.playback_index, self.current_telemetry_df.columns.get_loc('lap')])
+        lap = self._arr.get('lap')
+        if lap is not None and self.playback_index < len(lap):
+            self.current_lap_number = int(lap[self.playback_index])
         
+        # Lap lookups arrive with the cache task (see _rebuild_cache)
+        if not self._cache_ready:
+            return pd.DataFrame()
+
         # Start with the full dataframe (reference, no copy yet)
         df = self.current_telemetry_df
         
@@ -1058,48 +1790,28 @@ class RaceTelemetryTab(QWidget):
         if self.active_lap == 'Current Lap':
             # Show current lap data up to playback position
             if 'lap' in df:
-                # Find the start index of the current lap
-                # We assume data is sorted by time/distance, so laps are contiguous
-                # Optimization: Cache lap start indices if possible, but for now just find it efficiently
-                
-                # Fast search for lap start
-                # We know the current row has self.current_lap_number
-                # We can search backwards or just use boolean indexing (which is fast enough for <100k rows)
-                
-                # Better approach: Use the fact that we are at playback_index
-                # We want [start_of_current_lap : playback_index + 1]
-                
-                # Find start of this lap
-                # We can assume the first occurrence of this lap number is the start
-                # But searching the whole array every frame is slow.
-                # Let's trust the 'lap' column is monotonic increasing usually.
-                
-                # Optimization: Only search if lap changed or first run
-                # But simpler: just use boolean mask on the 'lap' column, it's vectorized
-                
-                # Create a view, not a copy yet
-                lap_mask = df['lap'] == self.current_lap_number
-                if lap_mask.any():
-                    start_pos = np.argmax(lap_mask.values) # First True
+                start_pos = self._lap_start_idx.get(self.current_lap_number)
+                if start_pos is not None:
                     end_pos = min(self.playback_index, len(df) - 1)
                     
                     if end_pos >= start_pos:
-                        # Return a copy only of the slice we need
-                        return df.iloc[start_pos : end_pos + 1].copy()
+                        # The live window is a contiguous row range of the loaded telemetry,
+                        # so hand out a view instead of copying it on every playback tick
+                        return df.iloc[start_pos : end_pos + 1]
                     else:
                         return pd.DataFrame()
                 else:
                     return pd.DataFrame()
                     
         elif self.active_lap == 'All Data':
-            # Show all data up to playback position
-            return df.iloc[:self.playback_index + 1].copy()
+            # Show all data up to playback position (view, see above)
+            return df.iloc[:self.playback_index + 1]
             
         elif self.active_lap.startswith('Lap '):
             # Static view of a specific lap
             lap_num = int(self.active_lap.split()[1])
             if 'lap' in df:
-                return df[df['lap'] == lap_num].copy()
+                return self._lap_rows(lap_num)
         
         # If we are here, we might need turn filtering on the result
         # But wait, the above returns early.
@@ -1110,50 +1822,44 @@ class RaceTelemetryTab(QWidget):
         # 2. Slice by Turn
         
         result_df = pd.DataFrame()
+        turn_key = self._selected_turn_key()
         
         if self.active_lap == 'Current Lap':
              if 'lap' in df:
-                lap_mask = df['lap'] == self.current_lap_number
-                if lap_mask.any():
-                    start_pos = np.argmax(lap_mask.values)
+                start_pos = self._lap_start_idx.get(self.current_lap_number)
+                if start_pos is not None:
                     end_pos = min(self.playback_index, len(df) - 1)
                     if end_pos >= start_pos:
-                        result_df = df.iloc[start_pos : end_pos + 1].copy()
+                        result_df = self._row_range(start_pos, end_pos + 1, turn_key)
         
         elif self.active_lap == 'All Data':
-            result_df = df.iloc[:self.playback_index + 1].copy()
+            result_df = self._row_range(0, self.playback_index + 1, turn_key)
             
         elif self.active_lap.startswith('Lap '):
             lap_num = int(self.active_lap.split()[1])
             if 'lap' in df:
-                result_df = df[df['lap'] == lap_num].copy()
-        
-        # Filter by turn
-        if not result_df.empty and self.selected_turn != 'All Turns' and self.turn_data and 'turns' in self.turn_data:
-            turn_num = int(self.selected_turn.split()[1])
-            turn_key = str(turn_num)
-            
-            if turn_key in self.turn_data['turns']:
-                turn_info = self.turn_data['turns'][turn_key]
-                turn_indices = turn_info.get('indices', [])
-                
-                if turn_indices:
-                    # Filter to only rows whose index is in the turn indices
-                    result_df = result_df[result_df.index.isin(turn_indices)]
+                result_df = self._lap_rows(lap_num, turn_key)
         
         return result_df
 
     def get_reference_lap_data(self) -> pd.DataFrame:
         """Get data for the reference/compare lap"""
+        if not self._cache_ready:
+            return pd.DataFrame()
+        
+        # Apply same turn filter if active
+        turn_key = self._selected_turn_key()
+        
         # If explicit comparison selected
         if self.compare_lap and self.compare_lap != "None":
-            df = self.current_telemetry_df.copy()
-            if 'lap' in df:
-                try:
-                    lap_num = int(self.compare_lap.split()[1])
-                    df = df[df['lap'] == lap_num].copy()
-                except (ValueError, IndexError):
-                    return pd.DataFrame()
+            df = self.current_telemetry_df
+            if 'lap' not in df:
+                return self._row_range(0, len(df), turn_key)
+            try:
+                lap_num = int(self.compare_lap.split()[1])
+            except (ValueError, IndexError):
+                return pd.DataFrame()
+            return self._lap_rows(lap_num, turn_key)
         else:
             # Default to best lap SO FAR (completed laps only)
             if self.current_telemetry_df.empty or 'lap' not in self.current_telemetry_df or 'elapsed_seconds' not in self.current_telemetry_df:
@@ -1162,149 +1868,285 @@ class RaceTelemetryTab(QWidget):
             # Find best lap among COMPLETED laps (less than current lap)
             # If we are in Lap 1, there is no best lap so far.
             current_lap = self.current_lap_number
-            completed_laps = self.current_telemetry_df[self.current_telemetry_df['lap'] < current_lap]['lap'].unique()
-            
-            best_lap = None
-            min_time = float('inf')
-            
-            for lap in completed_laps:
-                lap_data = self.current_telemetry_df[self.current_telemetry_df['lap'] == lap]
-                if not lap_data.empty:
-                    time = lap_data['elapsed_seconds'].max() - lap_data['elapsed_seconds'].min()
-                    if time < min_time and time > 10: # Ignore invalid short laps
-                        min_time = time
-                        best_lap = lap
+            # The completed laps are exactly the laps below the current one, so the current
+            # lap number identifies the set searched; scrubbing back and forth reuses it
+            if current_lap not in self._best_lap_memo:
+                durations = self._lap_durations
+                valid = durations[(durations.index < current_lap) & (durations > 10)] # Ignore invalid short laps
+                self._best_lap_memo[current_lap] = valid.idxmin() if len(valid) else None
+            best_lap = self._best_lap_memo[current_lap]
             
             if best_lap is not None:
-                df = self.current_telemetry_df[self.current_telemetry_df['lap'] == best_lap].copy()
-            else:
-                return pd.DataFrame()
+                return self._lap_rows(best_lap, turn_key)
+            return pd.DataFrame()
 
-        # Apply same turn filter if active
-        if self.selected_turn != 'All Turns' and self.turn_data and 'turns' in self.turn_data:
-            turn_num = int(self.selected_turn.split()[1])
-            turn_key = str(turn_num)
-            
-            if turn_key in self.turn_data['turns']:
-                turn_info = self.turn_data['turns'][turn_key]
-                turn_indices = turn_info.get('indices', [])
-                
-                if turn_indices and not df.empty:
-                    df = df[df.index.isin(turn_indices)].copy()
-        
-        return df
+    def _selected_turn_key(self) -> Optional[str]:
+        """Key into turn_data['turns'] of the turn picked in the selector, None for all turns"""
+        if self.selected_turn == 'All Turns' or not self.turn_data or 'turns' not in self.turn_data:
+            return None
+        turn_key = str(int(self.selected_turn.split()[1]))
+        return turn_key if turn_key in self.turn_data['turns'] else None
 
-    def _check_and_update_cache(self):
-        """Check if main data has changed and update static caches"""
-        if self.current_telemetry_df.empty:
-            return
+    def _turn_mask(self, turn_key: Optional[str]) -> Optional[np.ndarray]:
+        """
+        Boolean array over current_telemetry_df marking the rows of a turn, built once per
+        turn and dataset. None when there is nothing to filter by.
+        """
+        if turn_key is None:
+            return None
+        if turn_key not in self._turn_masks:
+            turn_indices = self.turn_data['turns'][turn_key].get('indices', [])
+            self._turn_masks[turn_key] = (self.current_telemetry_df.index.isin(turn_indices)
+                                          if turn_indices else None)
+        return self._turn_masks[turn_key]
 
-        # Check if data changed by comparing ID or length
-        current_id = id(self.current_telemetry_df)
-        if hasattr(self, '_last_data_id') and self._last_data_id == current_id:
-            return
-            
-        self._last_data_id = current_id
+    def _row_range(self, start: int, stop: int, turn_key: Optional[str] = None) -> pd.DataFrame:
+        """Rows start:stop of the telemetry (a view), optionally only those inside a turn"""
+        rows = self.current_telemetry_df.iloc[start:stop]
+        turn = self._turn_mask(turn_key)
+        return rows if turn is None else rows[turn[start:stop]]
+
+    def _lap_rows(self, lap_num, turn_key: Optional[str] = None) -> pd.DataFrame:
+        """
+        Rows of one lap, sliced by the cached row range when the lap is stored contiguously,
+        optionally only those inside a turn
+        """
+        stop = self._lap_stop_idx.get(lap_num)
+        if stop is not None:
+            return self._row_range(self._lap_start_idx[lap_num], stop, turn_key)
         df = self.current_telemetry_df
+        mask = df['lap'].to_numpy() == lap_num
+        turn = self._turn_mask(turn_key)
+        return df[mask if turn is None else mask & turn]
+
+    def _rebuild_cache(self):
+        """
+        Start computing the session lookups on a pool thread. Until they arrive the tab
+        shows nothing; _apply_cache_indices draws the charts once they do.
+        """
+        self._cache_ready = False
+        self._cache_generation += 1
+        self._lap_start_idx = {}
+        self._lap_stop_idx = {}
+        self._lap_durations = pd.Series(dtype=np.float64)
+        self._best_lap_memo = {}
+        if hasattr(self, '_cache_track_bins'): del self._cache_track_bins
+        if hasattr(self, '_cache_friction_brushes'): del self._cache_friction_brushes
+        if hasattr(self, '_cache_demand_brushes'): del self._cache_demand_brushes
+        if self.current_telemetry_df.empty:
+            return
         
-        # 1. Track Map Brushes
-        self._cache_track_brushes = np.array([pg.mkBrush(59, 130, 246, 180)] * len(df), dtype=object)
-        if 'pbrake_f' in df and 'aps' in df:
-            brake = df['pbrake_f'].fillna(0).values
-            throttle = df['aps'].fillna(0).values
-            brake_norm = np.clip(brake / 100, 0, 1)
-            throttle_norm = np.clip(throttle / 100, 0, 1)
-            
-            brushes = []
-            for b, t in zip(brake_norm, throttle_norm):
-                if b > 0.1: brushes.append(pg.mkBrush(int(255 * b), 0, 0, 180))
-                elif t > 0.1: brushes.append(pg.mkBrush(0, int(255 * t), 0, 180))
-                else: brushes.append(pg.mkBrush(100, 100, 255, 180))
-            self._cache_track_brushes = np.array(brushes, dtype=object)
-            
-        # 2. Friction Circle Brushes
-        self._cache_friction_brushes = np.array([pg.mkBrush(59, 130, 246, 180)] * len(df), dtype=object)
-        if 'speed' in df:
-            speed = df['speed'].fillna(0).values
-            max_speed = speed.max() if speed.max() > 0 else 200
-            brushes = []
-            for s in speed:
-                norm = s / max_speed
-                if norm < 0.33:
-                    brushes.append(pg.mkBrush(0, int(norm * 3 * 255), 255, 200))
-                elif norm < 0.67:
-                    brushes.append(pg.mkBrush(int((norm - 0.33) * 3 * 255), 255, int(255 - (norm - 0.33) * 3 * 255), 200))
-                else:
-                    brushes.append(pg.mkBrush(255, int(255 - (norm - 0.67) * 3 * 255), 0, 200))
-            self._cache_friction_brushes = np.array(brushes, dtype=object)
+        task = _CacheTask(self._cache_generation, self.current_telemetry_df, self._arr)
+        task.signals.finished.connect(self._apply_cache_indices)
+        self._cache_tasks[self._cache_generation] = task
+        QThreadPool.globalInstance().start(task)
 
-        # 3. Driver Demand Brushes
-        self._cache_demand_brushes = np.array([pg.mkBrush(59, 130, 246, 180)] * len(df), dtype=object)
-        if 'accx_can' in df:
-            long_g = df['accx_can'].fillna(0).values
-            brushes = []
-            for g in long_g:
-                intensity = min(abs(g), 1.0)
-                if g > 0: brushes.append(pg.mkBrush(0, int(255 * intensity), 0, 180))
-                else: brushes.append(pg.mkBrush(int(255 * intensity), 0, 0, 180))
-            self._cache_demand_brushes = np.array(brushes, dtype=object)
+    @pyqtSlot(int, object)
+    def _apply_cache_indices(self, generation: int, result):
+        """Install a finished cache task's lookups (GUI thread: brushes come from the palettes)"""
+        self._cache_tasks.pop(generation, None)
+        if generation != self._cache_generation or result is None:
+            return  # Superseded by a newer session, or failed (traceback already printed)
+        
+        self._lap_start_idx = result['lap_start_idx']
+        self._lap_stop_idx = result['lap_stop_idx']
+        self._lap_durations = result['lap_durations']
+        
+        self._cache_track_bins = result['track_bins']
+        self._track_pairs = None
+        # None without speed or long-g data: the scatter falls back to the default brush
+        self._cache_friction_brushes = np.take(self._speed_brushes, result['speed_level']) if result['has_speed'] else None
+        # Green under acceleration, red under braking
+        self._cache_demand_brushes = np.take(self._demand_brushes, result['demand_index']) if result['has_long_g'] else None
+        
+        self._cache_ready = True
+        self._mark_dirty()
+        self.update_visualizations()
+
+    def _column(self, df: pd.DataFrame, column: str, fill: Optional[float] = None) -> np.ndarray:
+        """
+        _plot_array(df, column, fill) for a frame derived from current_telemetry_df. A plain
+        row range of a 0..N-1 indexed session (the live lap grows one such range tick by
+        tick) is served as a view of the whole-session array, converted once per dataset.
+        Other frames (e.g. turn-filtered) keep their arrays while they are among the last
+        two frames seen, so the charts of one update share each column.
+        The result may be shared and must not be modified.
+        """
+        index = df.index
+        if self._range_indexed and isinstance(index, pd.RangeIndex) and index.step == 1:
+            return self._session_column(column, fill)[index.start:index.stop]
+        
+        # Frame id -> (frame, its arrays); holding the frame keeps its id from being reused
+        entry = self._frame_columns.get(id(df))
+        if entry is None or entry[0] is not df:
+            if len(self._frame_columns) >= 2:
+                del self._frame_columns[next(iter(self._frame_columns))]
+            entry = self._frame_columns[id(df)] = (df, {})
+        arrays = entry[1]
+        key = (column, fill)
+        if key not in arrays:
+            if self._range_indexed:
+                # Labels are session positions: gather from the whole-session array
+                arrays[key] = self._session_column(column, fill)[index.to_numpy()]
+            else:
+                arrays[key] = _plot_array(df, column, fill)
+        return arrays[key]
+
+    def _session_column(self, column: str, fill: Optional[float] = None) -> np.ndarray:
+        """Whole-session _plot_array of a column, converted once per dataset"""
+        key = (column, fill)
+        values = self._column_cache.get(key)
+        if values is None:
+            values = self._column_cache[key] = _plot_array(self.current_telemetry_df, column, fill)
+        return values
+
+    def _finite_rows(self, df: pd.DataFrame, columns: Tuple[str, ...], fill: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Mask of the rows of df where every column (read as by _column) is finite, or None
+        when all of them are. For a row range of a 0..N-1 indexed session this slices a
+        whole-session mask computed once per dataset, so the growing live lap is not
+        rescanned every tick. The result may be shared and must not be modified.
+        """
+        index = df.index
+        if not (self._range_indexed and isinstance(index, pd.RangeIndex) and index.step == 1):
+            return np.logical_and.reduce([np.isfinite(self._column(df, c, fill)) for c in columns])
+        key = (columns, fill)
+        if key not in self._finite_cache:
+            full = self.current_telemetry_df
+            mask = np.logical_and.reduce([np.isfinite(self._column(full, c, fill)) for c in columns])
+            self._finite_cache[key] = None if mask.all() else mask
+        mask = self._finite_cache[key]
+        return None if mask is None else mask[index.start:index.stop]
+
+    def _cached_analytics(self, df: pd.DataFrame, name: str, compute):
+        """
+        Return compute(df), memoized when df is a slice of a completed lap. Those slices
+        never change, so flicking the lap/turn selectors back and forth reuses the result.
+        The live lap (still growing during playback) is always recomputed.
+        """
+        if df.empty or 'lap' not in df:
+            return compute(df)
+        lap_col = df.columns.get_loc('lap')
+        first_lap = df.iat[0, lap_col]
+        if first_lap != df.iat[-1, lap_col] or first_lap == self.current_lap_number:
+            return compute(df)
+        
+        entry = self._analytics_cache.setdefault((df.index[0], df.index[-1], len(df)), {})
+        if name not in entry:
+            entry[name] = compute(df)
+        return entry[name]
+
+    def _instability(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        calculate_instability_index(df), extended instead of recomputed while df is a
+        session row range growing at its end (the live lap during playback). Only the new
+        rows and the two before them, whose smoothing window used to be cut by the end of
+        the range, are computed. The result may be shared and must not be modified.
+        """
+        index = df.index
+        columns = ('Steering_Angle', 'accy_can', 'speed')
+        if not (self._range_indexed and isinstance(index, pd.RangeIndex) and index.step == 1
+                and all(c in df for c in columns)):
+            return self._cached_analytics(df, 'instability', self.analytics.calculate_instability_index)
+        
+        start, stop = index.start, index.stop
+        live = self._live_instability
+        if live is not None and live[:3] == (self._cache_generation, start, stop):
+            return live[3][:stop - start]  # Same rows as last time
+        if (live is None or live[0] != self._cache_generation or live[1] != start
+                or not 5 <= live[2] - start < stop - start):
+            values = self._cached_analytics(df, 'instability', self.analytics.calculate_instability_index)
+            buffer = np.empty(max(2 * len(values), 1024))
+            buffer[:len(values)] = values
+            self._live_instability = (self._cache_generation, start, stop, buffer)
+            return buffer[:len(values)]
+        
+        _, _, filled, buffer = live
+        if stop - start > len(buffer):
+            grown = np.empty(max(2 * len(buffer), stop - start))
+            grown[:filled - start] = buffer[:filled - start]
+            buffer = grown
+        steer, lat_g, speed = (self._session_column(c, 0) for c in columns)
+        # Raw score of the rows the recomputed averages reach: rows filled-2.. and the two before
+        lo = filled - 4
+        raw = np.abs(steer[lo:stop]) * np.abs(lat_g[lo:stop]) * (speed[lo:stop] * 0.01)
+        buffer[filled - 2 - start:stop - start] = _smoothed_tail(raw, 2)
+        self._live_instability = (self._cache_generation, start, stop, buffer)
+        return buffer[:stop - start]
 
     def update_visualizations(self):
-        """Update all charts and statistics"""
-        self._check_and_update_cache()
+        """
+        Update all charts and statistics. The frames handed to the update_* methods are
+        views of current_telemetry_df where possible, so they must not be modified.
+        """
+        # The frame follows from the session, playback position and selectors alone: with
+        # those unchanged and nothing marked dirty, e.g. a timer tick while paused, there is
+        # nothing to slice or redraw
+        input_key = (self._cache_generation, self.playback_index, self.active_lap, self.compare_lap,
+                     self.selected_turn)
+        if input_key == self._input_key and not any(self._dirty.values()):
+            return
         
         df = self.get_filtered_data()
         
         if df.empty:
             return
-        
-        self.update_statistics(df)
-        
-        self.update_track_map(df)
-        self.update_friction_circle(df)
-        self.update_instability_chart(df)
-        self.update_brake_speed_chart(df)
-        self.update_driver_demand(df)
-        self.update_g_force_profile(df)
-        self.update_brake_bias_chart(df)
-        self.update_gear_shift_chart(df)
-        
-        # Always try to get reference data (explicit or best lap)
-        ref_df = self.get_reference_lap_data()
-        if not ref_df.empty:
-            self.update_time_delta_chart(df, ref_df)
-            
-            # Only show ghost plots if explicit comparison is selected
-            if self.compare_lap and self.compare_lap != "None":
-                self.update_comparison_visualizations(df, ref_df)
+        self._input_key = input_key
+        
+        # Every data chart draws this slice (and the reference lap it selects). The same
+        # slice as last time, e.g. while playback is paused or a fixed lap is shown,
+        # leaves them clean; sector markers only follow turn/session changes.
+        slice_key = (id(self.current_telemetry_df), self.active_lap, self.compare_lap, self.selected_turn,
+                     self.current_lap_number, len(df), df.index[0], df.index[-1])
+        if slice_key != self._painted_key:
+            self._painted_key = slice_key
+            self._mark_dirty(*(chart for chart in _CHARTS if chart != 'sectors'))
+        dirty = self._dirty
+        
+        if dirty['stats']: self.update_statistics(df)
+        
+        if dirty['track']: self.update_track_map(df)
+        if dirty['friction']: self.update_friction_circle(df)
+        if dirty['instability']: self.update_instability_chart(df)
+        if dirty['brake_speed']: self.update_brake_speed_chart(df)
+        if dirty['demand']: self.update_driver_demand(df)
+        if dirty['g_force']: self.update_g_force_profile(df)
+        if dirty['brake_bias']: self.update_brake_bias_chart(df)
+        if dirty['gear']: self.update_gear_shift_chart(df)
+        
+        if dirty['reference']:
+            # Always try to get reference data (explicit or best lap)
+            ref_df = self.get_reference_lap_data()
+            if not ref_df.empty:
+                self.update_time_delta_chart(df, ref_df)
+                
+                # Only show ghost plots if explicit comparison is selected
+                if self.compare_lap and self.compare_lap != "None":
+                    self.update_comparison_visualizations(df, ref_df)
+                else:
+                    self.clear_ghost_plots()
             else:
+                # Clear ghost plots if no reference
                 self.clear_ghost_plots()
-        else:
-            # Clear ghost plots if no reference
-            self.clear_ghost_plots()
             
-        # Update sector markers for distance plots
-        for plot in self.distance_plots:
-            self.add_sector_markers(plot)
+        if dirty['sectors']:
+            self.update_sector_markers()
+        
+        self._dirty = dict.fromkeys(_CHARTS, False)
             
+        # Real-time line at the last sample shown (a scalar read; val != val for NaN)
         current_x = 0
-        if 'Laptrigger_lapdist_dls' in df and not df.empty:
-            val = df.iloc[-1]['Laptrigger_lapdist_dls']
-            if pd.notna(val):
+        if 'Laptrigger_lapdist_dls' in df:
+            val = df['Laptrigger_lapdist_dls'].iat[-1]
+            if val == val:
                 current_x = val
-        lines = [
-            getattr(self, 'brake_speed_line', None),
-            getattr(self, 'g_force_line', None),
-            getattr(self, 'gear_line', None),
-            getattr(self, 'instability_line', None),
-            getattr(self, 'bias_line', None),
-            getattr(self, 'time_delta_line', None)
-        ]
-        
-        for line in lines:
-            if line:
+        if current_x != self._rt_line_x:
+            self._rt_line_x = current_x
+            # Nothing listens to these lines; skip the sigPositionChanged emissions
+            for line in self._rt_lines:
+                line.blockSignals(True)
                 line.setValue(current_x)
-                line.show()
+                line.blockSignals(False)
     
     def update_statistics(self, df: pd.DataFrame):
         """Update the statistics display with color coding"""
@@ -1316,36 +2158,32 @@ class RaceTelemetryTab(QWidget):
                     val = "0.00"
                 if key == 'time_delta': val = "+0.00"
                 if key == 'lap_number': val = "1"
-                self.stat_labels[key].setText(self._format_stat_html(key, val))
+                self._set_stat(key, val)
             return
         
         # Check for lap change
         if 'lap' in df and not df.empty:
-            new_lap = int(df.iloc[-1]['lap'])
+            new_lap = int(df['lap'].iat[-1])
             if new_lap != self.current_lap_number:
                 # Lap changed - save previous lap data
-                self.previous_lap_data = self.current_telemetry_df[
-                    self.current_telemetry_df['lap'] == self.current_lap_number
-                ].copy()
+                self.previous_lap_data = self._lap_rows(self.current_lap_number)
                 self.current_lap_number = new_lap
         
-        stats = self.analytics.calculate_lap_stats(df)
+        stats = self._cached_analytics(df, 'stats', self.analytics.calculate_lap_stats)
         
-        self.stat_labels['lap_number'].setText(self._format_stat_html('lap_number', str(self.current_lap_number)))
-        self.stat_labels['top_speed'].setText(self._format_stat_html('top_speed', f"{stats.get('top_speed', 0):.1f}"))
-        self.stat_labels['max_lat_g'].setText(self._format_stat_html('max_lat_g', f"{stats.get('max_lat_g', 0):.2f}"))
-        self.stat_labels['peak_brake'].setText(self._format_stat_html('peak_brake', f"{stats.get('peak_brake', 0):.1f}"))
-        self.stat_labels['brake_bias'].setText(self._format_stat_html('brake_bias', f"{stats.get('brake_bias', 50):.1f}"))
-        self.stat_labels['coasting_pct'].setText(self._format_stat_html('coasting_pct', f"{stats.get('coasting_pct', 0):.1f}"))
+        self._set_stat('lap_number', str(self.current_lap_number))
+        self._set_stat('top_speed', f"{stats.get('top_speed', 0):.1f}")
+        self._set_stat('max_lat_g', f"{stats.get('max_lat_g', 0):.2f}")
+        self._set_stat('peak_brake', f"{stats.get('peak_brake', 0):.1f}")
+        self._set_stat('brake_bias', f"{stats.get('brake_bias', 50):.1f}")
+        self._set_stat('coasting_pct', f"{stats.get('coasting_pct', 0):.1f}")
         
         # Lap time
-        current_lap_df = self.current_telemetry_df[
-            self.current_telemetry_df['lap'] == self.current_lap_number
-        ].copy()
+        current_lap_df = self._lap_rows(self.current_lap_number)
         
         if not current_lap_df.empty and 'elapsed_seconds' in current_lap_df:
-            lap_start_time = current_lap_df.iloc[0]['elapsed_seconds']
-            current_time = df.iloc[-1]['elapsed_seconds'] if 'elapsed_seconds' in df else 0
+            lap_start_time = current_lap_df['elapsed_seconds'].iat[0]
+            current_time = df['elapsed_seconds'].iat[-1] if 'elapsed_seconds' in df else 0
             lap_time = current_time - lap_start_time
         else:
             lap_time = stats.get('lap_time', 0)
@@ -1356,32 +2194,32 @@ class RaceTelemetryTab(QWidget):
             lap_time_str = f"{minutes}:{seconds:05.2f}"
         else:
             lap_time_str = f"{lap_time:.2f}"
-        self.stat_labels['lap_time'].setText(self._format_stat_html('lap_time', lap_time_str))
+        self._set_stat('lap_time', lap_time_str)
         
         # Total time
         if 'elapsed_seconds' in df and not df.empty:
-            total_time = df.iloc[-1]['elapsed_seconds']
+            total_time = df['elapsed_seconds'].iat[-1]
             if total_time >= 60:
                 minutes = int(total_time // 60)
                 seconds = total_time % 60
                 total_time_str = f"{minutes}:{seconds:05.2f}"
             else:
                 total_time_str = f"{total_time:.2f}"
-            self.stat_labels['total_time'].setText(self._format_stat_html('total_time', total_time_str))
+            self._set_stat('total_time', total_time_str)
         else:
-            self.stat_labels['total_time'].setText(self._format_stat_html('total_time', '0.00'))
+            self._set_stat('total_time', '0.00')
         
         # Time delta
         delta_str = '+0.00'
         delta_color = self.stat_colors.get('time_delta', '#f97316')
         
         if not self.previous_lap_data.empty and 'elapsed_seconds' in df and not df.empty:
-            current_lap_progress = len(current_lap_df[current_lap_df.index <= df.index[-1]])
+            current_lap_progress = self._lap_progress(current_lap_df, df.index[-1])
             if current_lap_progress <= len(self.previous_lap_data):
                 prev_lap_at_position = self.previous_lap_data.iloc[:current_lap_progress]
                 if not prev_lap_at_position.empty and 'elapsed_seconds' in prev_lap_at_position:
-                    prev_lap_start = self.previous_lap_data.iloc[0]['elapsed_seconds']
-                    prev_time_at_position = prev_lap_at_position.iloc[-1]['elapsed_seconds'] - prev_lap_start
+                    prev_lap_start = self.previous_lap_data['elapsed_seconds'].iat[0]
+                    prev_time_at_position = prev_lap_at_position['elapsed_seconds'].iat[-1] - prev_lap_start
                     time_delta = lap_time - prev_time_at_position
                     
                     if abs(time_delta) < 0.01:
@@ -1393,16 +2231,12 @@ class RaceTelemetryTab(QWidget):
                         delta_str = f'{time_delta:.2f}'
                         delta_color = '#22c55e'
         
-        self.stat_labels['time_delta'].setText(self._format_stat_html('time_delta', delta_str, delta_color))
-        
-        for label in self.stat_labels.values():
-            label.show()
-            label.update()
+        self._set_stat('time_delta', delta_str, delta_color)
         
         # Comparison logic
         if self.compare_lap and self.compare_lap != "None":
             ref_df = self.get_reference_lap_data()
-            ref_stats = self.analytics.calculate_lap_stats(ref_df)
+            ref_stats = self._cached_analytics(ref_df, 'stats', self.analytics.calculate_lap_stats)
             
             better_color = "#22c55e"
             worse_color = "#dc2626"
@@ -1414,47 +2248,86 @@ class RaceTelemetryTab(QWidget):
                 elif value < ref_value: color = worse_color
                 else: color = self.stat_colors[key]
                 formatted_value = f"{value:.1f}" if key == 'top_speed' else f"{value:.2f}"
-                self.stat_labels[key].setText(self._format_stat_html(key, formatted_value, color))
+                self._set_stat(key, formatted_value, color)
             
             lap_time_val = stats.get('lap_time', 999)
             ref_lap_time = ref_stats.get('lap_time', 999)
             if lap_time_val < ref_lap_time: color = better_color
             elif lap_time_val > ref_lap_time: color = worse_color
             else: color = self.stat_colors['lap_time']
-            self.stat_labels['lap_time'].setText(self._format_stat_html('lap_time', lap_time_str, color))
+            self._set_stat('lap_time', lap_time_str, color)
+    
+    def _lap_progress(self, lap_df: pd.DataFrame, last_label) -> int:
+        """
+        Number of rows of lap_df (the current lap) up to and including last_label. A lap
+        sliced from a 0..N-1 indexed session is a step-1 RangeIndex, so this is arithmetic
+        on its bounds instead of a comparison over every row.
+        """
+        index = lap_df.index
+        if self._range_indexed and isinstance(index, pd.RangeIndex) and index.step == 1:
+            return max(0, min(last_label + 1, index.stop) - index.start)
+        return int(np.count_nonzero(index <= last_label))
+    
+    def _point_brushes(self, cache_name: str, index: pd.Index):
+        """
+        Per-point brushes for the rows in index from the named brush cache, or the one
+        shared default brush (a scalar, so pyqtgraph keeps no per-point brush) when there
+        is no cached colour. A session row range gets a view of the cache rather than an
+        object-array copy; the result must not be modified.
+        """
+        cached = getattr(self, cache_name, None)
+        if cached is not None:
+            if self._range_indexed and isinstance(index, pd.RangeIndex) and index.step == 1:
+                if index.stop <= len(cached):
+                    return cached[index.start:index.stop]
+            else:
+                try:
+                    return cached[index]
+                except IndexError:
+                    pass
+        return self._default_point_brush
     
     def update_track_map(self, df: pd.DataFrame):
-        """Update track map with cached brushes"""
+        """Update track map trace from the cached colour bins"""
         if 'VBOX_Long_Minutes' not in df or 'VBOX_Lat_Min' not in df:
             return
         
-        x = df['VBOX_Long_Minutes'].values
-        y = df['VBOX_Lat_Min'].values
-        
-        if hasattr(self, '_cache_track_brushes'):
-            try:
-                brushes = self._cache_track_brushes[df.index]
-            except IndexError:
-                brushes = [pg.mkBrush(59, 130, 246, 180)] * len(x)
+        columns = ('VBOX_Long_Minutes', 'VBOX_Lat_Min')
+        x = self._column(df, columns[0])
+        y = self._column(df, columns[1])
+        finite = self._finite_rows(df, columns)
+        
+        index = df.index
+        if (self._range_indexed and isinstance(index, pd.RangeIndex) and index.step == 1
+                and hasattr(self, '_cache_track_bins')):
+            # A row range takes, per line item, the slice of the whole-session pairs whose
+            # segments start in rows start..stop-2 (views, nothing regrouped per tick)
+            if self._track_pairs is None:
+                full = self.current_telemetry_df
+                self._track_pairs = _segment_pairs(self._column(full, columns[0]), self._column(full, columns[1]),
+                                                   self._finite_rows(full, columns), self._cache_track_bins,
+                                                   len(self.track_map_curves))
+            for curve, (starts, px, py) in zip(self.track_map_curves, self._track_pairs):
+                lo, hi = np.searchsorted(starts, (index.start, index.stop - 1)).tolist()
+                hi = max(hi, lo)
+                curve.setData(x=px[2 * lo:2 * hi], y=py[2 * lo:2 * hi], connect='pairs')
         else:
-            brushes = [pg.mkBrush(59, 130, 246, 180)] * len(x)
-        
-        sizes = np.ones(len(x)) * 5
-        if hasattr(self, 'playback_index') and not df.empty:
-            if df.index[-1] == self.playback_index:
-                 sizes[-1] = 15
-                 brushes = brushes.copy()
-                 brushes[-1] = pg.mkBrush(255, 255, 0, 255)
-        
-        mask = np.isfinite(x) & np.isfinite(y)
-        if not mask.all():
-            x = x[mask]
-            y = y[mask]
-            sizes = sizes[mask]
-            brushes = brushes[mask]
-        
-        if len(x) > 0:
-            self.track_map_scatter.setData(x=x, y=y, brush=brushes, size=sizes)
+            bins = None
+            if hasattr(self, '_cache_track_bins'):
+                try:
+                    bins = self._cache_track_bins[index]
+                except IndexError:
+                    pass
+            if bins is None:
+                bins = np.zeros(len(x), dtype=np.intp)
+            
+            for curve, (_, px, py) in zip(self.track_map_curves,
+                                          _segment_pairs(x, y, finite, bins, len(self.track_map_curves))):
+                curve.setData(x=px, y=py, connect='pairs')
+        
+        # Current car position
+        if len(x) and df.index[-1] == self.playback_index and (finite is None or finite[-1]):
+            self.track_map_scatter.setData(x=x[-1:], y=y[-1:])
         else:
             self.track_map_scatter.setData(x=[], y=[])
     
@@ -1463,132 +2336,107 @@ class RaceTelemetryTab(QWidget):
         if 'accy_can' not in df or 'accx_can' not in df:
             return
         
-        lat_g = df['accy_can'].fillna(0).values
-        long_g = df['accx_can'].fillna(0).values
+        lat_g = self._column(df, 'accy_can', 0)
+        long_g = self._column(df, 'accx_can', 0)
         
-        if hasattr(self, '_cache_friction_brushes'):
-            try:
-                brushes = self._cache_friction_brushes[df.index]
-            except IndexError:
-                brushes = [pg.mkBrush(59, 130, 246, 180)] * len(lat_g)
+        brushes = self._point_brushes('_cache_friction_brushes', df.index)
+        
+        # The highlight lives in its own item, so every spot of the cloud keeps the same
+        # size and a brush straight from the shared palette (one symbol atlas entry per level)
+        if not df.empty and df.index[-1] == self.playback_index and np.isfinite(lat_g[-1]) and np.isfinite(long_g[-1]):
+            self.friction_marker.setData(x=lat_g[-1:], y=long_g[-1:])
         else:
-            brushes = [pg.mkBrush(59, 130, 246, 180)] * len(lat_g)
-        
-        sizes = np.ones(len(lat_g)) * 4
-        if hasattr(self, 'playback_index') and not df.empty:
-            if df.index[-1] == self.playback_index:
-                sizes[-1] = 20
-                brushes = brushes.copy()
-                brushes[-1] = pg.mkBrush(255, 255, 255, 255)
-        
-        mask = np.isfinite(lat_g) & np.isfinite(long_g)
-        if not mask.all():
-            lat_g = lat_g[mask]
-            long_g = long_g[mask]
-            sizes = sizes[mask]
-            brushes = brushes[mask]
+            self.friction_marker.setData(x=[], y=[])
+        
+        mask = self._finite_rows(df, ('accy_can', 'accx_can'), 0)
+        in_view = _view_mask(self.friction_circle_plot, lat_g, long_g)
+        if in_view is not None:
+            mask = in_view if mask is None else mask & in_view
+        if mask is not None and not mask.all():
+            # One index list for the coordinates and the (object) brush array
+            keep = np.flatnonzero(mask)
+            lat_g = lat_g[keep]
+            long_g = long_g[keep]
+            if isinstance(brushes, np.ndarray):
+                brushes = brushes[keep]
                 
         if len(lat_g) > 0:
-            self.friction_scatter.setData(x=lat_g, y=long_g, brush=brushes, size=sizes)
+            self.friction_scatter.setData(x=lat_g, y=long_g, brush=brushes)
         else:
             self.friction_scatter.setData(x=[], y=[])
     
     def update_instability_chart(self, df: pd.DataFrame):
         """Update dynamic instability chart"""
-        instability = self.analytics.calculate_instability_index(df)
+        instability = self._instability(df)
         
         if len(instability) == 0:
             return
         
         if 'Laptrigger_lapdist_dls' in df:
-            x = df['Laptrigger_lapdist_dls'].values[:len(instability)]
+            x = self._column(df, 'Laptrigger_lapdist_dls')[:len(instability)]
         else:
             x = np.arange(len(instability))
         
         self.instability_curve.setData(x=x, y=instability)
         
         if 'Steering_Angle' in df:
-            steering = df['Steering_Angle'].fillna(0).abs().values[:len(x)]
-            steering_scaled = steering * (instability.max() / steering.max()) if steering.max() > 0 else steering
+            steering = np.abs(self._column(df, 'Steering_Angle', 0)[:len(x)])
+            steering_max = steering.max() if len(steering) else 0
+            steering_scaled = steering * (instability.max() / steering_max) if steering_max > 0 else steering
             self.steering_curve.setData(x=x, y=steering_scaled)
     
     def update_brake_speed_chart(self, df: pd.DataFrame):
         """Update braking and speed chart"""
         if 'Laptrigger_lapdist_dls' in df:
-            x = df['Laptrigger_lapdist_dls'].values
+            x = self._column(df, 'Laptrigger_lapdist_dls')
         else:
             x = np.arange(len(df))
         
         if 'speed' in df:
-            self.speed_curve.setData(x=x, y=df['speed'].fillna(0).values)
+            self.speed_curve.setData(x=x, y=self._column(df, 'speed', 0))
         
         if 'pbrake_f' in df:
-            self.brake_curve.setData(x=x, y=df['pbrake_f'].fillna(0).values)
-    
-    def update_brake_speed_comparison(self, active_df: pd.DataFrame, ref_df: pd.DataFrame):
-        """Update ghost curves for comparison"""
-        if ref_df.empty:
-            self.speed_ghost_curve.setData(x=[], y=[])
-            self.brake_ghost_curve.setData(x=[], y=[])
-            return
-        
-        if 'Laptrigger_lapdist_dls' in ref_df:
-            x = ref_df['Laptrigger_lapdist_dls'].values
-        else:
-            x = np.arange(len(ref_df))
-        
-        if 'speed' in ref_df:
-            y_speed = ref_df['speed'].fillna(0).values
-            if len(x) == len(y_speed):
-                self.speed_ghost_curve.setData(x=x, y=y_speed)
-        
-        if 'pbrake_f' in ref_df:
-            y_brake = ref_df['pbrake_f'].fillna(0).values
-            if len(x) == len(y_brake):
-                self.brake_ghost_curve.setData(x=x, y=y_brake)
+            self.brake_curve.setData(x=x, y=self._column(df, 'pbrake_f', 0))
     
     def update_driver_demand(self, df: pd.DataFrame):
         """Update driver demand scatter plot with cached brushes"""
         if 'nmot' not in df or 'aps' not in df:
             return
         
-        rpm = df['nmot'].fillna(0).values
-        throttle = df['aps'].fillna(0).values
-        
-        if hasattr(self, '_cache_demand_brushes'):
-            try:
-                brushes = self._cache_demand_brushes[df.index]
-            except IndexError:
-                brushes = [pg.mkBrush(59, 130, 246, 180)] * len(rpm)
-        else:
-            brushes = [pg.mkBrush(59, 130, 246, 180)] * len(rpm)
-            
-        sizes = np.ones(len(rpm)) * 6
-        
-        mask = np.isfinite(rpm) & np.isfinite(throttle)
-        if not mask.all():
-            rpm = rpm[mask]
-            throttle = throttle[mask]
-            sizes = sizes[mask]
-            brushes = brushes[mask]
+        rpm = self._column(df, 'nmot', 0)
+        throttle = self._column(df, 'aps', 0)
+        
+        brushes = self._point_brushes('_cache_demand_brushes', df.index)
+        
+        mask = self._finite_rows(df, ('nmot', 'aps'), 0)
+        in_view = _view_mask(self.driver_demand_plot, rpm, throttle)
+        if in_view is not None:
+            mask = in_view if mask is None else mask & in_view
+        if mask is not None and not mask.all():
+            # One index list for the coordinates and the (object) brush array
+            keep = np.flatnonzero(mask)
+            rpm = rpm[keep]
+            throttle = throttle[keep]
+            if isinstance(brushes, np.ndarray):
+                brushes = brushes[keep]
                 
         if len(rpm) > 0:
-            self.driver_demand_scatter.setData(x=rpm, y=throttle, brush=brushes, size=sizes)
+            self.driver_demand_scatter.setData(x=rpm, y=throttle, brush=brushes)
         else:
             self.driver_demand_scatter.setData(x=[], y=[])
     
     def update_g_force_profile(self, df: pd.DataFrame):
         """Update G-force profile over distance"""
         if 'Laptrigger_lapdist_dls' in df:
-            x = df['Laptrigger_lapdist_dls'].values
+            x = self._column(df, 'Laptrigger_lapdist_dls')
         else:
             x = np.arange(len(df))
         
         if 'accy_can' in df:
-            self.lat_g_curve.setData(x=x, y=df['accy_can'].fillna(0).values)
+            self.lat_g_curve.setData(x=x, y=self._column(df, 'accy_can', 0))
         
         if 'accx_can' in df:
-            self.long_g_curve.setData(x=x, y=df['accx_can'].fillna(0).values)
+            self.long_g_curve.setData(x=x, y=self._column(df, 'accx_can', 0))
     
     def update_brake_bias_chart(self, df: pd.DataFrame):
         """Update brake bias trend (only when braking > 5 bar)"""
@@ -1596,15 +2444,18 @@ class RaceTelemetryTab(QWidget):
             return
         
         if 'Laptrigger_lapdist_dls' in df:
-            x = df['Laptrigger_lapdist_dls'].values
+            x = self._column(df, 'Laptrigger_lapdist_dls')
         else:
             x = np.arange(len(df))
         
-        front = df['pbrake_f'].fillna(0).values
-        rear = df['pbrake_r'].fillna(0).values
-        total = front + rear
+        front = self._column(df, 'pbrake_f', 0)
+        rear = self._column(df, 'pbrake_r', 0)
         
-        bias = np.where(front > 5, (front / (total + 1e-6)) * 100, np.nan)
+        # Only samples braking harder than 5 bar get a value; front > 5 keeps the total positive
+        braking = front > 5
+        bias = np.full(len(front), np.nan)
+        front_braking = front[braking]
+        bias[braking] = front_braking / (front_braking + rear[braking]) * 100
         
         self.brake_bias_curve.setData(x=x, y=bias)
     
@@ -1614,44 +2465,44 @@ class RaceTelemetryTab(QWidget):
             return
         
         if 'Laptrigger_lapdist_dls' in df:
-            x = df['Laptrigger_lapdist_dls'].values
+            x = self._column(df, 'Laptrigger_lapdist_dls')
         else:
             x = np.arange(len(df))
         
         # Fix: Replace 0s with previous known gear (forward fill)
-        gear_series = df['gear'].replace(0, np.nan).ffill().fillna(0)
-        gears = gear_series.values
+        gears = _held_gears(self._column(df, 'gear', 0))
         
         self.gear_curve.setData(x=x, y=gears)
         
         if 'nmot' in df:
-            rpm = df['nmot'].fillna(0).values / 1000.0
+            rpm = self._column(df, 'nmot', 0) / 1000.0
             self.rpm_curve.setData(x=x, y=rpm, fillLevel=0)
             
-        upshifts_x, upshifts_y = [], []
-        downshifts_x, downshifts_y = [], []
-        
-        for i in range(1, len(gears)):
-            diff = gears[i] - gears[i-1]
-            if diff > 0 and diff < 3: 
-                upshifts_x.append(x[i])
-                upshifts_y.append(gears[i])
-            elif diff < 0 and diff > -3:
-                downshifts_x.append(x[i])
-                downshifts_y.append(gears[i])
-                
-        self.upshift_scatter.setData(x=upshifts_x, y=upshifts_y)
-        self.downshift_scatter.setData(x=downshifts_x, y=downshifts_y)
+        # Shifts of one or two gears, marked at the sample after the change
+        diff = np.diff(gears)
+        up = np.flatnonzero((diff > 0) & (diff < 3)) + 1
+        down = np.flatnonzero((diff < 0) & (diff > -3)) + 1
+        
+        self.upshift_scatter.setData(x=x[up], y=gears[up])
+        self.downshift_scatter.setData(x=x[down], y=gears[down])
 
     def update_comparison_visualizations(self, active_df: pd.DataFrame, ref_df: pd.DataFrame):
-        """Update ghost curves for all plots"""
+        """
+        Update ghost curves for all plots. They only depend on the reference rows, which
+        stay the same tick after tick while the active lap plays, so an unchanged reference
+        is not redrawn.
+        """
         if ref_df.empty:
             return
+        ghost_key = (self._cache_generation, len(ref_df), ref_df.index[0], ref_df.index[-1])
+        if ghost_key == self._ghost_key:
+            return
+        self._ghost_key = ghost_key
 
         # Helper to get X and Y for ghost plots
         def get_xy(df, col):
             if 'Laptrigger_lapdist_dls' in df and col in df:
-                return df['Laptrigger_lapdist_dls'].values, df[col].fillna(0).values
+                return self._column(df, 'Laptrigger_lapdist_dls'), self._column(df, col, 0)
             return [], []
 
         # 1. Brake/Speed
@@ -1661,64 +2512,44 @@ class RaceTelemetryTab(QWidget):
         if len(x) > 0: self.brake_ghost_curve.setData(x=x, y=y)
 
         # 2. G-Force
-        # Need to add ghost curves to g_force_plot first if they don't exist
-        if not hasattr(self, 'lat_g_ghost'):
-            self.lat_g_ghost = self.g_force_plot.plot(pen=pg.mkPen('#1e3a8a', width=1, style=Qt.PenStyle.DashLine))
-            self.long_g_ghost = self.g_force_plot.plot(pen=pg.mkPen('#3f2e10', width=1, style=Qt.PenStyle.DashLine))
-        
         x, y = get_xy(ref_df, 'accy_can')
         if len(x) > 0: self.lat_g_ghost.setData(x=x, y=y)
         x, y = get_xy(ref_df, 'accx_can')
         if len(x) > 0: self.long_g_ghost.setData(x=x, y=y)
 
         # 3. Gear
-        if not hasattr(self, 'gear_ghost'):
-            self.gear_ghost = self.gear_shift_plot.plot(pen=pg.mkPen('#475569', width=1, style=Qt.PenStyle.DashLine))
-        
         # Fix gear 0 for ghost
         if 'gear' in ref_df:
-            gear_series = ref_df['gear'].replace(0, np.nan).ffill().fillna(0)
             if 'Laptrigger_lapdist_dls' in ref_df:
-                self.gear_ghost.setData(x=ref_df['Laptrigger_lapdist_dls'].values, y=gear_series.values)
+                self.gear_ghost.setData(x=self._column(ref_df, 'Laptrigger_lapdist_dls'),
+                                        y=_held_gears(self._column(ref_df, 'gear', 0)))
 
         # 4. Instability
-        if not hasattr(self, 'instability_ghost'):
-            self.instability_ghost = self.instability_plot.plot(pen=pg.mkPen('#450a0a', width=1, style=Qt.PenStyle.DashLine))
-        
-        instability = self.analytics.calculate_instability_index(ref_df)
+        instability = self._cached_analytics(ref_df, 'instability', self.analytics.calculate_instability_index)
         if len(instability) > 0 and 'Laptrigger_lapdist_dls' in ref_df:
-            self.instability_ghost.setData(x=ref_df['Laptrigger_lapdist_dls'].values[:len(instability)], y=instability)
+            self.instability_ghost.setData(x=self._column(ref_df, 'Laptrigger_lapdist_dls')[:len(instability)], y=instability)
 
     def clear_ghost_plots(self):
         """Clear all ghost plots"""
+        if self._ghost_key == 'cleared':
+            return
+        self._ghost_key = 'cleared'
         self.speed_ghost_curve.setData(x=[], y=[])
         self.brake_ghost_curve.setData(x=[], y=[])
-        if hasattr(self, 'lat_g_ghost'): self.lat_g_ghost.setData(x=[], y=[])
-        if hasattr(self, 'long_g_ghost'): self.long_g_ghost.setData(x=[], y=[])
-        if hasattr(self, 'gear_ghost'): self.gear_ghost.setData(x=[], y=[])
-        if hasattr(self, 'instability_ghost'): self.instability_ghost.setData(x=[], y=[])
+        self.lat_g_ghost.setData(x=[], y=[])
+        self.long_g_ghost.setData(x=[], y=[])
+        self.gear_ghost.setData(x=[], y=[])
+        self.instability_ghost.setData(x=[], y=[])
 
     def update_time_delta_chart(self, active_df: pd.DataFrame, ref_df: pd.DataFrame):
         """Update time delta chart (comparison mode)"""
         distances, deltas = self.analytics.calculate_time_delta(active_df, ref_df)
         
-        if len(distances) == 0:
-            self.time_delta_curve.setData(x=[], y=[])
-            return
-        
-        # Create gradient fill based on delta sign
-        # Green where negative (faster), red where positive (slower)
-        # For area chart, use fillLevel=0
         # Create gradient fill based on delta sign
         # Green where negative (faster), red where positive (slower)
         # For area chart, use fillLevel=0
         
-        # Sanitize data
-        mask = np.isfinite(distances) & np.isfinite(deltas)
-        if not mask.all():
-            distances = distances[mask]
-            deltas = deltas[mask]
-            
+        # calculate_time_delta only returns finite samples
         if len(distances) > 0:
             self.time_delta_curve.setData(x=distances, y=deltas, fillLevel=0)
         else:
@@ -1730,6 +2561,8 @@ class RaceTelemetryTab(QWidget):
         """Setup shared hover cursor for all distance-based plots"""
         self.hover_lines = {}
         self.hover_labels = {}
+        self._hover_distances_memo = {}  # 'active'/'ref' -> (frame key, distances, ascending)
+        self._plot_top_y = {}  # plot -> top of its y view range, where the hover label sits
         
         # Plots that share the distance X-axis
         self.distance_plots = [
@@ -1747,34 +2580,78 @@ class RaceTelemetryTab(QWidget):
         
         for plot in self.distance_plots:
             # Vertical line
-            v_line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen('#cbd5e1', width=1, style=Qt.PenStyle.DashLine))
+            v_line = pg.InfiniteLine(angle=90, movable=False, pen=_pen('#cbd5e1', width=1, style=Qt.PenStyle.DashLine))
             plot.addItem(v_line)
             v_line.hide()
             self.hover_lines[plot] = v_line
             
-            # Connect hover event
-            plot.scene().sigMouseMoved.connect(self.on_mouse_hover)
+            # Connect hover event (every plot widget has a scene of its own)
+            plot.scene().sigMouseMoved.connect(lambda pos, p=plot: self._queue_hover(p, pos))
             
             # Add label for value display (TextItem with ignoreBounds to prevent expansion)
-            label = pg.TextItem(anchor=(0, 1), color='#cbd5e1', fill=pg.mkBrush(15, 23, 42, 200))
+            label = pg.TextItem(anchor=(0, 1), color='#cbd5e1', fill=_brush(15, 23, 42, 200))
             plot.addItem(label, ignoreBounds=True)
+            label.setZValue(100)  # Ensure on top
             label.hide()
             self.hover_labels[plot] = label
+            
+            # Track the top of the view here rather than asking the axis on every move
+            view_box = plot.getViewBox()
+            self._plot_top_y[plot] = view_box.viewRange()[1][1]
+            view_box.sigRangeChanged.connect(
+                lambda _, ranges, *__, p=plot: self._plot_top_y.__setitem__(p, ranges[1][1]))
+        
+        self._hover_formatters = {
+            self.brake_speed_plot: _hover_brake_speed,
+            self.g_force_plot: _hover_g_force,
+            self.gear_shift_plot: _hover_gear,
+            self.instability_plot: _hover_steering,
+            self.brake_bias_plot: _hover_brake_bias,
+            self.time_delta_plot: _hover_time_delta,
+        }
 
-    def on_mouse_hover(self, pos):
-        """Handle mouse hover to update cursor across all plots"""
-        sender_scene = self.sender()
-        
-        # Find which plot triggered the event
-        active_plot = None
-        for plot in self.distance_plots:
-            if plot.scene() == sender_scene:
-                active_plot = plot
-                break
-        
-        if not active_plot:
-            return
+    def _hover_distances(self, df: pd.DataFrame, role: str) -> Tuple[np.ndarray, bool]:
+        """
+        Lap distance of df and whether it is ascending. Mouse moves over the same frame
+        reuse the result, so the monotonic check runs once per frame rather than per event.
+        """
+        key = (self._cache_generation, len(df), df.index[0], df.index[-1])
+        memo = self._hover_distances_memo.get(role)
+        if memo is None or memo[0] != key:
+            distances = self._column(df, 'Laptrigger_lapdist_dls')
+            ascending = bool(np.all(distances[1:] >= distances[:-1]))
+            memo = self._hover_distances_memo[role] = (key, distances, ascending)
+        return memo[1], memo[2]
+
+    def _queue_hover(self, plot: pg.PlotWidget, pos):
+        """Mouse moves arrive faster than the screen refreshes; handle the latest once per frame"""
+        self._throttled_call('hover', lambda: self.on_mouse_hover(plot, pos), 16)
+
+    def _hover_row(self, df: pd.DataFrame, idx: int) -> Dict[str, float]:
+        """
+        _HOVER_COLUMNS at row idx of df (0 for a missing channel), plus 'start_seconds',
+        the elapsed time at the first row. Read from the cached session columns when
+        row labels are positions, instead of building a row Series.
+        """
+        row = {}
+        first, label = df.index[0], df.index[idx]
+        for column in _HOVER_COLUMNS:
+            if column not in df:
+                row[column] = 0.0
+            elif self._range_indexed:
+                row[column] = float(self._session_column(column)[label])
+            else:
+                row[column] = float(df[column].iat[idx])
+        if 'elapsed_seconds' not in df:
+            row['start_seconds'] = 0.0
+        elif self._range_indexed:
+            row['start_seconds'] = float(self._session_column('elapsed_seconds')[first])
+        else:
+            row['start_seconds'] = float(df['elapsed_seconds'].iat[0])
+        return row
 
+    def on_mouse_hover(self, active_plot: pg.PlotWidget, pos):
+        """Handle mouse hover over active_plot to update cursor across all plots"""
         if active_plot.sceneBoundingRect().contains(pos):
             mouse_point = active_plot.plotItem.vb.mapSceneToView(pos)
             x_val = mouse_point.x()
@@ -1785,20 +2662,20 @@ class RaceTelemetryTab(QWidget):
                 return
                 
             # Find index of nearest distance
-            distances = df['Laptrigger_lapdist_dls'].values
-            idx = (np.abs(distances - x_val)).argmin()
+            distances, ascending = self._hover_distances(df, 'active')
+            idx = _nearest_index(distances, x_val, ascending)
             
             # Get values at this index
-            row = df.iloc[idx]
+            row = self._hover_row(df, idx)
             
             # Get reference values if available
             ref_row = None
             ref_df = self.get_reference_lap_data()
             if not ref_df.empty and 'Laptrigger_lapdist_dls' in ref_df:
-                ref_distances = ref_df['Laptrigger_lapdist_dls'].values
-                ref_idx = (np.abs(ref_distances - x_val)).argmin()
+                ref_distances, ascending = self._hover_distances(ref_df, 'ref')
+                ref_idx = _nearest_index(ref_distances, x_val, ascending)
                 if abs(ref_distances[ref_idx] - x_val) < 20: # Only if close enough
-                    ref_row = ref_df.iloc[ref_idx]
+                    ref_row = self._hover_row(ref_df, ref_idx)
 
             # Update all lines and labels
             for p in self.distance_plots:
@@ -1808,111 +2685,48 @@ class RaceTelemetryTab(QWidget):
                 
                 if p in self.hover_labels:
                     label = self.hover_labels[p]
-                    label.setPos(x_val, p.getAxis('left').range[1]) # Top of plot
-                    label.setZValue(100) # Ensure on top
-                    
-                    # Determine what text to show based on plot type
-                    text = ""
-                    
-                    def fmt_val(name, val, unit, ref_val=None):
-                        s = f"{name}: {val}{unit}"
-                        if ref_val is not None:
-                            diff = val - ref_val
-                            sign = "+" if diff > 0 else ""
-                            s += f" ({sign}{diff:.1f})"
-                        return s
-
-                    if p == self.brake_speed_plot:
-                        speed = row.get('speed', 0)
-                        brake = row.get('pbrake_f', 0)
-                        ref_speed = ref_row.get('speed', 0) if ref_row is not None else None
-                        text = fmt_val("Speed", f"{speed:.1f}", "mph", ref_speed) + "\n"
-                        text += f"Brake: {brake:.1f} bar"
-                    elif p == self.g_force_plot:
-                        lat = row.get('accy_can', 0)
-                        long = row.get('accx_can', 0)
-                        text = f"Lat G: {lat:.2f}\nLong G: {long:.2f}"
-                    elif p == self.gear_shift_plot:
-                        gear = row.get('gear', 0)
-                        rpm = row.get('nmot', 0)
-                        # Handle NaN values
-                        if pd.isna(gear): gear = 0
-                        if pd.isna(rpm): rpm = 0
-                        text = f"Gear: {int(gear)}\nRPM: {int(rpm)}"
-                    elif p == self.instability_plot:
-                        steer = row.get('Steering_Angle', 0)
-                        text = f"Steer: {steer:.1f}°"
-                    elif p == self.brake_bias_plot:
-                        front = row.get('pbrake_f', 0)
-                        rear = row.get('pbrake_r', 0)
-                        total = front + rear
-                        bias = (front / total * 100) if total > 5 else 50
-                        text = f"Bias: {bias:.1f}%"
-                    elif p == self.time_delta_plot:
-                        text = f"Dist: {x_val:.0f}m"
-                        if ref_row is not None:
-                             t1 = row.get('elapsed_seconds', 0)
-                             t2 = ref_row.get('elapsed_seconds', 0)
-                             t1 -= df.iloc[0].get('elapsed_seconds', 0)
-                             t2 -= ref_df.iloc[0].get('elapsed_seconds', 0)
-                             delta = t1 - t2
-                             sign = "+" if delta > 0 else ""
-                             text += f"\nDelta: {sign}{delta:.2f}s"
-                        
+                    label.setPos(x_val, self._plot_top_y[p]) # Top of plot
+                    text = self._hover_formatters[p](row, ref_row, x_val)
                     label.setText(text)
                     label.show()
 
-    def add_sector_markers(self, plot_widget):
-        """Add vertical lines/regions for turns/sectors"""
-        # Check if we have turn data
+    def _sector_bounds(self) -> List[Tuple[float, float]]:
+        """Lap distance at the first and last sample of every turn"""
         if not self.turn_data or 'turns' not in self.turn_data:
-            return
+            return []
+        df = self.current_telemetry_df
+        if df.empty or 'Laptrigger_lapdist_dls' not in df:
+            return []
+        
+        bounds = []
+        for turn_info in self.turn_data['turns'].values():
+            indices = turn_info.get('indices')
+            if not indices:
+                continue
+            start_idx = min(indices)
+            end_idx = max(indices)
+            # Ensure indices are valid
+            if start_idx in df.index and end_idx in df.index:
+                bounds.append((df.at[start_idx, 'Laptrigger_lapdist_dls'],
+                               df.at[end_idx, 'Laptrigger_lapdist_dls']))
+        return bounds
 
-        # We need a way to track items to remove them later
-        if not hasattr(plot_widget, '_sector_items'):
-            plot_widget._sector_items = []
-        
-        # Remove old items
-        for item in plot_widget._sector_items:
-            plot_widget.removeItem(item)
-        plot_widget._sector_items = []
-        
-        # Add new markers
-        for turn_id, turn_info in self.turn_data['turns'].items():
-            # We need distance for start/end of turn
-            if 'indices' in turn_info and not self.current_telemetry_df.empty:
-                indices = turn_info['indices']
-                if not indices: continue
-                
-                # Get min/max index
-                start_idx = min(indices)
-                end_idx = max(indices)
-                
-                # Get distance at these indices
-                if 'Laptrigger_lapdist_dls' in self.current_telemetry_df:
-                    try:
-                        # Ensure indices are valid
-                        if start_idx in self.current_telemetry_df.index and end_idx in self.current_telemetry_df.index:
-                            start_dist = self.current_telemetry_df.at[start_idx, 'Laptrigger_lapdist_dls']
-                            end_dist = self.current_telemetry_df.at[end_idx, 'Laptrigger_lapdist_dls']
-                            
-                            # Add region
-                            region = pg.LinearRegionItem([start_dist, end_dist], brush=pg.mkBrush(59, 130, 246, 20), movable=False)
-                            # Set pen for the boundary lines
-                            for line in region.lines:
-                                line.setPen(pg.mkPen(59, 130, 246, 50))
-                            plot_widget.addItem(region)
-                            plot_widget._sector_items.append(region)
-                            
-                            # Add label (text item)
-                            # Note: TextItem position is x, y. Y needs to be within view range.
-                            # We'll place it at the top.
-                            text = pg.TextItem(f"T{turn_id}", color='#64748b', anchor=(0.5, 0))
-                            # Use a fixed Y or try to get view range. 
-                            # Since view range changes, maybe just put it at 0 if we can't determine.
-                            # Better: Use viewbox limits if available, or just don't add text for now if it's tricky.
-                            # Let's try adding it and setting a reasonable Y or using view coordinates.
-                            # Actually, let's just stick to the region for now to avoid clutter/positioning issues.
-                            
-                    except (KeyError, IndexError):
-                        pass
+    def update_sector_markers(self):
+        """
+        Shade every turn on the distance plots. Regions already in a plot are moved with
+        setRegion; only a change in the number of turns adds or removes scene items.
+        """
+        bounds = self._sector_bounds()
+        for plot_widget in self.distance_plots:
+            regions = self._sector_marker_items.setdefault(plot_widget, [])
+            while len(regions) > len(bounds):
+                plot_widget.removeItem(regions.pop())
+            while len(regions) < len(bounds):
+                region = pg.LinearRegionItem(brush=_brush(59, 130, 246, 20), movable=False)
+                # Set pen for the boundary lines
+                for line in region.lines:
+                    line.setPen(_pen(59, 130, 246, 50))
+                plot_widget.addItem(region)
+                regions.append(region)
+            for region, bound in zip(regions, bounds):
+                region.setRegion(bound)
@@ -3,7 +3,7 @@ Complete Render3D implementation with Telemetry Data Visualization
 """
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QMessageBox, QPushButton, QFileDialog, QComboBox, QSlider, QFrame, QApplication
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, QElapsedTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QVector3D, QFont, QColor, QPalette
 import numpy as np
 import math
@@ -14,7 +14,7 @@ from pathlib import Path
 
 from Code.Core.TelemetryEngine import TelemetryLoader, SessionManager, StateProcessor
 from Code.Core.TelemetryParsing import TelemetryParser
-from scipy.spatial import KDTree
+from scipy.spatial import cKDTree
 import numpy as np
 
 try:
@@ -23,6 +23,34 @@ try:
 except ImportError:
     HAS_3D = False
 
+# Telemetry columns update_hud reads every frame, copied to arrays at vehicle load
+_HUD_COLUMNS = ('Laptrigger_lapdist_dls', 'distance', 'timestamp', 'elapsed_seconds', 'meta_time', 'lap')
+
+
+class _ParseSignals(QObject):
+    finished = pyqtSignal(int)  # Number of vehicles parsed
+    failed = pyqtSignal(str)  # Error message
+
+
+class _ParseTask(QRunnable):
+    """Parses a folder of raw telemetry CSVs on a pool thread"""
+
+    def __init__(self, input_folder, output_folder):
+        super().__init__()
+        self.setAutoDelete(False)  # Render3D holds the task until it reports back
+        self.input_folder = input_folder
+        self.output_folder = output_folder
+        self.parser = TelemetryParser()
+        self.signals = _ParseSignals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit(self.parser.parse_folder(self.input_folder, self.output_folder))
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+
+
 class Render3D(QWidget):
     # Signals for telemetry tab
     telemetryDataLoaded = pyqtSignal(object)  # Emits full telemetry DataFrame
@@ -32,20 +60,26 @@ class Render3D(QWidget):
         super().__init__()
         self.track_data = None
         self.current_telemetry_df = None  # Store current vehicle's telemetry
+        self._tele = {}  # _HUD_COLUMNS of current_telemetry_df as float arrays
+        self._tele_rows = 0
         self.session_manager = SessionManager()
         self.telemetry_loader = TelemetryLoader()
         self.state_processor = StateProcessor()
         self.current_state_history = []
+        self._state_timestamps = np.empty(0)  # Per-state timestamps, searched by update_playback
+        self._lap_sizes = {}  # Number of states in each lap
+        self._trail_points = np.empty((0, 3), dtype=np.float32)  # State positions lifted for the trail
         self.car_pos = {'index': 0, 'x': 0, 'y': 0, 'z': 0, 'angle': 0}
         self.playback_index = 0
         self.playback_speed = 1.0
         self.is_playing = False
-        self.playback_start_time = None  # Track when playback started
+        self.playback_clock = QElapsedTimer()  # Monotonic wall clock since playback started (invalid = not started)
         self.playback_start_index = 0    # Track which frame we started from
         self.current_lap = 1             # Track current lap for trail reset
         self.lap_start_index = 0         # Index where current lap started
         self.camera_mode = 'third_person'
         self.loaded_folder = None
+        self._parse_task = None  # _ParseTask while a raw folder is being parsed
         self.slider_is_dragging = False  # Track if user is dragging slider
         self.was_playing_before_drag = False  # Track playback state before drag
         self.turn_data = {}  # Store turn information
@@ -74,7 +108,7 @@ class Render3D(QWidget):
         
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_playback)
-        self.timer.setInterval(16)  # Base interval in ms
+        self.timer.setInterval(16)  # Base interval in ms; update_playback stretches it between sparse samples
 
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -632,7 +666,12 @@ class Render3D(QWidget):
             else:
                 # Check for raw telemetry files
                 raw_files = list(self.loaded_folder.glob("*telemetry_data.csv"))
-                if raw_files:
+                cached_output = TelemetryParser().cached_output(folder_path) if raw_files else None
+                if cached_output is not None:
+                    # Same raw files were parsed before; reuse that output instead of re-parsing
+                    print(f"Raw telemetry unchanged since last parse. Loading {cached_output}...")
+                    self.load_parsed_data(cached_output)
+                elif raw_files:
                     print("Found raw telemetry files. Asking for output location...")
                     
                     # Ask for output directory first
@@ -658,38 +697,55 @@ class Render3D(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to load folder: {e}\n{traceback.format_exc()}")
 
     def parse_and_load(self, input_folder, output_folder):
+        if self._parse_task is not None:
+            QMessageBox.information(self, "Parsing", "A telemetry folder is already being parsed.")
+            return
+        
+        # Parse on a pool thread so the 3D view and controls keep responding
+        task = _ParseTask(input_folder, output_folder)
+        task.signals.finished.connect(self.on_parse_finished)
+        task.signals.failed.connect(self.on_parse_failed)
+        self._parse_task = task
+        self.load_btn.setEnabled(False)
+        self.load_btn.setText("⏳ Parsing...")
+        QThreadPool.globalInstance().start(task)
+
+    def _end_parse(self):
+        task, self._parse_task = self._parse_task, None
+        self.load_btn.setText("📁 Folder")
+        self.load_btn.setEnabled(True)
+        return task
+
+    @pyqtSlot(int)
+    def on_parse_finished(self, count):
+        task = self._end_parse()
         try:
-            parser = TelemetryParser()
-            
-            self.setCursor(Qt.CursorShape.WaitCursor)
-            QApplication.processEvents()
-            
-            count = parser.parse_folder(input_folder, output_folder)
-            
-            self.setCursor(Qt.CursorShape.ArrowCursor)
-            
             if count > 0:
                 QMessageBox.information(self, "Success", f"Successfully parsed {count} vehicles.")
                 
                 session_info = {
-                    "input_folder": str(input_folder),
-                    "output_folder": str(output_folder),
+                    "input_folder": str(task.input_folder),
+                    "output_folder": str(task.output_folder),
                     "parsed_count": count
                 }
                 import json
-                with open(Path(output_folder) / "session_info.json", "w") as f:
+                with open(Path(task.output_folder) / "session_info.json", "w") as f:
                     json.dump(session_info, f, indent=2)
+                task.parser.remember_output(task.input_folder, task.output_folder)
                 
-                self.load_parsed_data(output_folder)
+                self.load_parsed_data(task.output_folder)
             else:
                 QMessageBox.warning(self, "Warning", "No vehicles were parsed.")
                 
         except Exception as e:
-            self.setCursor(Qt.CursorShape.ArrowCursor)
             QMessageBox.critical(self, "Error", f"Parsing failed: {e}")
-            import traceback
             traceback.print_exc()
 
+    @pyqtSlot(str)
+    def on_parse_failed(self, error):
+        self._end_parse()
+        QMessageBox.critical(self, "Error", f"Parsing failed: {error}")
+
     def load_parsed_data(self, folder_path):
         try:
             self.telemetry_loader.load_from_parsed_folder(folder_path)
@@ -815,6 +871,9 @@ class Render3D(QWidget):
             # Store full telemetry DataFrame and emit signal
             self.current_telemetry_df = vehicle_telemetry.copy()
             self.telemetryDataLoaded.emit(self.current_telemetry_df)
+            self._tele = {column: pd.to_numeric(self.current_telemetry_df[column], errors='coerce').to_numpy(np.float64)
+                          for column in _HUD_COLUMNS if column in self.current_telemetry_df.columns}
+            self._tele_rows = len(self.current_telemetry_df)
             print(f"Loaded telemetry DataFrame with {len(self.current_telemetry_df)} rows, columns: {list(self.current_telemetry_df.columns)[:10]}")
             
             # Process telemetry (this is now vectorized and much faster)
@@ -834,6 +893,20 @@ class Render3D(QWidget):
             # Align states to track elevation
             self.align_states_to_track()
             
+            # StateProcessor sorts by time, so playback can binary-search this array
+            self._state_timestamps = np.fromiter(
+                (s.get('timestamp', 0) for s in self.current_state_history),
+                dtype=np.float64, count=len(self.current_state_history))
+            laps, counts = np.unique(
+                np.fromiter((s.get('lap', 1) for s in self.current_state_history),
+                            dtype=np.int64, count=len(self.current_state_history)),
+                return_counts=True)
+            self._lap_sizes = dict(zip(laps.tolist(), counts.tolist()))
+            if self.current_state_history:
+                # Lift trail higher above track to ensure visibility
+                self._trail_points = np.array([s['position'] for s in self.current_state_history], dtype=np.float32)
+                self._trail_points[:, 2] += 0.2
+            
             if len(self.current_state_history) > 0:
                 self.playback_slider.setMaximum(len(self.current_state_history) - 1)
                 
@@ -892,10 +965,7 @@ class Render3D(QWidget):
                 # Resume playback if it was playing
                 if was_playing:
                     self.is_playing = True
-                    import time
-                    self.playback_start_time = time.time()
-                    self.playback_start_index = self.playback_index
-                    self.timer.start()
+                    self._start_playback_timer()
                     self.play_btn.setText("⏸")
                 
                 # Restore cursor
@@ -1193,14 +1263,14 @@ class Render3D(QWidget):
         
         if spline_points and len(spline_points) > 0:
             # Build KD-tree for fast nearest neighbor lookup
-            spline_coords = np.array([[p['x'], p['y']] for p in spline_points])
+            spline_coords = np.array([[p['x'], p['y']] for p in spline_points], dtype=np.float64)
             spline_elevations = np.array([p.get('z', 0) for p in spline_points])
             
-            from scipy.spatial import KDTree
-            tree = KDTree(spline_coords)
+            tree = cKDTree(spline_coords, balanced_tree=True, compact_nodes=True)
             
-            # Find nearest spline point for each optimal line point
-            line_coords = np.array([[x, y] for x, y in zip(x_coords, y_coords)])
+            # Find nearest spline point for each optimal line point (one batched query)
+            line_coords = np.column_stack([np.asarray(x_coords, dtype=np.float64),
+                                           np.asarray(y_coords, dtype=np.float64)])
             distances, indices = tree.query(line_coords)
             
             # Get elevations from matched spline points and add small offset
@@ -1448,7 +1518,8 @@ class Render3D(QWidget):
                 return
                 
             # Build KDTree for 2D lookup (x, y)
-            tree = KDTree(track_points[:, :2])
+            tree = cKDTree(np.ascontiguousarray(track_points[:, :2], dtype=np.float64),
+                           balanced_tree=True, compact_nodes=True)
             
             # Extract state positions
             state_positions = np.array([s['position'] for s in self.current_state_history])
@@ -1457,9 +1528,9 @@ class Render3D(QWidget):
             dists, idxs = tree.query(state_positions[:, :2])
             
             # Update Z coordinates
-            for i, state in enumerate(self.current_state_history):
-                track_z = track_points[idxs[i], 2]
-                state['position'][2] = track_z
+            track_z = track_points[idxs, 2].tolist()
+            for state, z in zip(self.current_state_history, track_z):
+                state['position'][2] = z
                 
             print("Aligned vehicle states to track elevation.")
             
@@ -1604,40 +1675,40 @@ class Render3D(QWidget):
         
         # Get distance from telemetry dataframe (same as Tab 4)
         distance = 0
-        if hasattr(self, 'current_telemetry_df') and self.current_telemetry_df is not None:
-            if not self.current_telemetry_df.empty and index < len(self.current_telemetry_df):
-                if 'Laptrigger_lapdist_dls' in self.current_telemetry_df.columns:
-                    distance = self.current_telemetry_df.iloc[index]['Laptrigger_lapdist_dls']
-                elif 'distance' in self.current_telemetry_df.columns:
-                    distance = self.current_telemetry_df.iloc[index]['distance']
-                
-                # If distance is NaN, use the last valid distance
-                import math
-                if math.isnan(distance) or distance is None:
-                    if hasattr(self, '_last_valid_distance'):
-                        distance = self._last_valid_distance
-                    else:
-                        distance = 0
+        tele = self._tele
+        if index < self._tele_rows:
+            if 'Laptrigger_lapdist_dls' in tele:
+                distance = tele['Laptrigger_lapdist_dls'][index]
+            elif 'distance' in tele:
+                distance = tele['distance'][index]
+            
+            # If distance is NaN, use the last valid distance
+            import math
+            if math.isnan(distance) or distance is None:
+                if hasattr(self, '_last_valid_distance'):
+                    distance = self._last_valid_distance
                 else:
-                    # Detect SF line crossing (distance wraps around from end to start)
-                    # This happens when distance drops significantly (> 1000m)
-                    if hasattr(self, '_last_valid_distance') and self._last_valid_distance is not None:
-                        distance_drop = self._last_valid_distance - distance
-                        # If we wrapped around (e.g., 3900m -> 50m), reset sector times
-                        if distance_drop > 1000:
-                            print(f"🏁 SF line crossed - sector times reset (distance: {self._last_valid_distance:.1f}m → {distance:.1f}m)")
-                            self.sector_times = {'S1': None, 'S2': None, 'S3': None}
-                            # Get current timestamp to initialize sector start time
-                            if 'elapsed_seconds' in self.current_telemetry_df.columns:
-                                current_ts = self.current_telemetry_df.iloc[index]['elapsed_seconds']
-                                self.sector_start_time = current_ts
-                            else:
-                                self.sector_start_time = None
-                            self.current_sector = 0
-                            self.sector_crossed = False
-                    
-                    # Store this as the last valid distance
-                    self._last_valid_distance = distance
+                    distance = 0
+            else:
+                # Detect SF line crossing (distance wraps around from end to start)
+                # This happens when distance drops significantly (> 1000m)
+                if hasattr(self, '_last_valid_distance') and self._last_valid_distance is not None:
+                    distance_drop = self._last_valid_distance - distance
+                    # If we wrapped around (e.g., 3900m -> 50m), reset sector times
+                    if distance_drop > 1000:
+                        print(f"🏁 SF line crossed - sector times reset (distance: {self._last_valid_distance:.1f}m → {distance:.1f}m)")
+                        self.sector_times = {'S1': None, 'S2': None, 'S3': None}
+                        # Get current timestamp to initialize sector start time
+                        if 'elapsed_seconds' in tele:
+                            current_ts = tele['elapsed_seconds'][index]
+                            self.sector_start_time = current_ts
+                        else:
+                            self.sector_start_time = None
+                        self.current_sector = 0
+                        self.sector_crossed = False
+                
+                # Store this as the last valid distance
+                self._last_valid_distance = distance
         
         # Update distance (convert meters to feet)
         if hasattr(self, 'distance_label'):
@@ -1646,9 +1717,9 @@ class Render3D(QWidget):
         
         # Update lap progress
         if hasattr(self, 'lap_progress_label') and len(self.current_state_history) > 0:
-            lap_data = [s for s in self.current_state_history if s.get('lap', 1) == lap]
-            if lap_data:
-                progress = (index - self.lap_start_index) / max(1, len(lap_data)) * 100
+            lap_size = self._lap_sizes.get(lap, 0)
+            if lap_size:
+                progress = (index - self.lap_start_index) / max(1, lap_size) * 100
                 self.lap_progress_label.setText(f"Lap Progress: {progress:.1f}%")
         
         # Get sector boundaries based on distance, not index
@@ -1675,20 +1746,18 @@ class Render3D(QWidget):
         
         # Get current timestamp
         current_time = None
-        if hasattr(self, 'current_telemetry_df') and self.current_telemetry_df is not None:
-            if not self.current_telemetry_df.empty:
-                if index < len(self.current_telemetry_df):
-                    # Try different timestamp column names
-                    if 'timestamp' in self.current_telemetry_df.columns:
-                        current_time = self.current_telemetry_df.iloc[index]['timestamp']
-                    elif 'elapsed_seconds' in self.current_telemetry_df.columns:
-                        current_time = self.current_telemetry_df.iloc[index]['elapsed_seconds']
-                    elif 'meta_time' in self.current_telemetry_df.columns:
-                        current_time = self.current_telemetry_df.iloc[index]['meta_time']
-                    
-                    # Debug output once
-                    if index == 100:
-                        print(f"Timestamp at index {index}: {current_time:.2f}s (column: {'timestamp' if 'timestamp' in self.current_telemetry_df.columns else 'elapsed_seconds' if 'elapsed_seconds' in self.current_telemetry_df.columns else 'meta_time'})")
+        if index < self._tele_rows:
+            # Try different timestamp column names
+            if 'timestamp' in tele:
+                current_time = tele['timestamp'][index]
+            elif 'elapsed_seconds' in tele:
+                current_time = tele['elapsed_seconds'][index]
+            elif 'meta_time' in tele:
+                current_time = tele['meta_time'][index]
+            
+            # Debug output once
+            if index == 100:
+                print(f"Timestamp at index {index}: {current_time:.2f}s (column: {'timestamp' if 'timestamp' in tele else 'elapsed_seconds' if 'elapsed_seconds' in tele else 'meta_time'})")
         
         # Determine which sector we're in based on distance with hysteresis
         # Add 10-meter buffer zones to prevent flickering at boundaries
@@ -1720,16 +1789,17 @@ class Render3D(QWidget):
             # Initialize on first run
             if self.lap_start_time is None:
                 # Find the actual start time of this lap from telemetry data
-                if hasattr(self, 'current_telemetry_df') and self.current_telemetry_df is not None:
-                    lap_data = self.current_telemetry_df[self.current_telemetry_df['lap'] == lap]
-                    if not lap_data.empty:
+                if 'lap' in tele:
+                    lap_rows = np.flatnonzero(tele['lap'] == lap)
+                    if len(lap_rows):
                         # Use the first timestamp of this lap as the lap start time
-                        if 'elapsed_seconds' in lap_data.columns:
-                            self.lap_start_time = lap_data.iloc[0]['elapsed_seconds']
-                        elif 'timestamp' in lap_data.columns:
-                            self.lap_start_time = lap_data.iloc[0]['timestamp']
-                        elif 'meta_time' in lap_data.columns:
-                            self.lap_start_time = lap_data.iloc[0]['meta_time']
+                        first = lap_rows[0]
+                        if 'elapsed_seconds' in tele:
+                            self.lap_start_time = tele['elapsed_seconds'][first]
+                        elif 'timestamp' in tele:
+                            self.lap_start_time = tele['timestamp'][first]
+                        elif 'meta_time' in tele:
+                            self.lap_start_time = tele['meta_time'][first]
                 
                 # Reset sector timing for new lap
                 if self.lap_start_time is None:
@@ -1921,13 +1991,8 @@ class Render3D(QWidget):
         if not self.current_state_history or current_index < self.lap_start_index:
             return
         
-        # Extract positions from lap start to current position
-        trail_points = []
-        for i in range(self.lap_start_index, current_index + 1):
-            if i < len(self.current_state_history):
-                pos = self.current_state_history[i]['position']
-                # Lift trail higher above track to ensure visibility
-                trail_points.append([pos[0], pos[1], pos[2] + 0.2])
+        # Positions from lap start to current position (a view, nothing is copied)
+        trail_points = self._trail_points[self.lap_start_index:current_index + 1]
         
         if len(trail_points) < 2:
             # Not enough points for a trail yet
@@ -1936,13 +2001,14 @@ class Render3D(QWidget):
                 self.trail_mesh = None
             return
         
-        # Remove old trail
+        # Extend the existing trail in place; the item is only rebuilt after a lap reset
         if hasattr(self, 'trail_mesh') and self.trail_mesh:
-            self.view.removeItem(self.trail_mesh)
+            self.trail_mesh.setData(pos=trail_points)
+            return
         
         # Create new trail with blue highlight (instead of cyan)
         self.trail_mesh = gl.GLLinePlotItem(
-            pos=np.array(trail_points), 
+            pos=trail_points, 
             color=(0.23, 0.51, 0.96, 0.9),  # Blue with high opacity
             width=4, 
             antialias=True,
@@ -1958,14 +2024,16 @@ class Render3D(QWidget):
         if self.is_playing:
             self.play_btn.setText("⏸")
             # Record start time and index for timestamp-based playback
-            import time
-            self.playback_start_time = time.time()
-            self.playback_start_index = self.playback_index
-            self.timer.start()
+            self._start_playback_timer()
         else:
             self.play_btn.setText("▶")
             self.timer.stop()
-            # Keep playback_start_time so we can resume from same position
+    
+    def _start_playback_timer(self):
+        """Anchor playback time at the current frame and start ticking at the base rate"""
+        self.playback_clock.start()
+        self.playback_start_index = self.playback_index
+        self.timer.start(16)
     
     def reset_playback(self):
         self.playback_index = 0
@@ -1973,7 +2041,7 @@ class Render3D(QWidget):
         self.is_playing = False
         self.play_btn.setText("▶")
         self.timer.stop()
-        self.playback_start_time = None
+        self.playback_clock.invalidate()
         self.playback_start_index = 0
         # Reset lap tracking
         self.current_lap = 1
@@ -1982,6 +2050,9 @@ class Render3D(QWidget):
     
     def set_speed(self, speed):
         self.playback_speed = speed
+        if self.is_playing:
+            # Re-anchor so the new speed applies from here instead of rescaling time already played
+            self._start_playback_timer()
         
         # Active style (gradient blue)
         active_style = """
@@ -2063,11 +2134,8 @@ class Render3D(QWidget):
         
         # Resume playback if it was playing before drag
         if self.was_playing_before_drag:
-            import time
             self.is_playing = True
-            self.playback_start_time = time.time()
-            self.playback_start_index = self.playback_index
-            self.timer.start()
+            self._start_playback_timer()
             self.play_btn.setText("⏸")
             self.was_playing_before_drag = False
     
@@ -2078,36 +2146,31 @@ class Render3D(QWidget):
         # Time-based playback: find the frame that matches the current simulation time
         # Never skip frames - display every frame as we pass through time
         
-        if self.playback_start_time is None:
-            import time
-            self.playback_start_time = time.time()
+        if not self.playback_clock.isValid():
+            self.playback_clock.start()
             self.playback_start_index = self.playback_index
         
-        import time
         # Calculate elapsed real time since playback started
-        elapsed_real_time = time.time() - self.playback_start_time
+        elapsed_real_time = self.playback_clock.elapsed() / 1000.0
         
         # Convert to simulation time based on playback speed
         elapsed_sim_time = elapsed_real_time * self.playback_speed
         
         # Get the timestamp where we started playback
-        start_timestamp = self.current_state_history[self.playback_start_index].get('timestamp', 0)
+        start_timestamp = self._state_timestamps[self.playback_start_index]
         
         # Calculate the target timestamp we should be at now
         target_timestamp = start_timestamp + elapsed_sim_time
         
         # Find the frame that matches this timestamp (or just passed it)
-        # Start searching from current position to avoid going backwards
-        found_frame = self.playback_index
+        # Start searching from current position to avoid going backwards; one binary
+        # search covers however many frames this tick skips at 100x/1000x
+        found_frame = self.playback_index + int(np.searchsorted(
+            self._state_timestamps[self.playback_index:], target_timestamp, side='left'))
         
-        for i in range(self.playback_index, len(self.current_state_history)):
-            frame_timestamp = self.current_state_history[i].get('timestamp', 0)
-            if frame_timestamp >= target_timestamp:
-                found_frame = i
-                break
-        else:
+        if found_frame >= len(self.current_state_history):
             # Reached end of data, loop back to start
-            self.playback_start_time = time.time()
+            self.playback_clock.start()
             self.playback_start_index = 0
             self.playback_index = 0
             self.playback_slider.setValue(0)
@@ -2121,6 +2184,12 @@ class Render3D(QWidget):
             self.playback_slider.setValue(self.playback_index)
             self.update_car_from_state(self.playback_index)
             self.playbackPositionChanged.emit(self.playback_index)  # Emit signal
+        
+        # Sleep until the next frame is due instead of polling at 60 Hz between sparse samples
+        # (low speeds); at high speeds frames are due every tick and the base rate applies.
+        # NaN timestamps fall back to the base rate rather than reaching int()
+        wait_ms = (self._state_timestamps[self.playback_index] - target_timestamp) / self.playback_speed * 1000
+        self.timer.setInterval(int(np.clip(np.nan_to_num(wait_ms, nan=16.0), 16, 250)))
 
     def set_turn_data(self, turn_data):
         """Receive turn data from fine-tuning tab"""
@@ -2248,15 +2317,11 @@ class Render3D(QWidget):
             return
         
         if self.camera_mode == 'third_person':
-            # Follow car from behind and above
+            # Follow car from behind and above; the view orbits its center, so
+            # distance/elevation/azimuth place the camera without computing its position
             distance = 50
             elevation_angle = 20
             
-            # Calculate camera position behind the car
-            cam_x = self.car_pos['x'] - math.cos(self.car_pos['angle']) * distance * math.cos(math.radians(elevation_angle))
-            cam_y = self.car_pos['y'] - math.sin(self.car_pos['angle']) * distance * math.cos(math.radians(elevation_angle))
-            cam_z = self.car_pos['z'] + distance * math.sin(math.radians(elevation_angle))
-            
             # Look at the car
             self.view.opts['center'] = QVector3D(self.car_pos['x'], self.car_pos['y'], self.car_pos['z'])
             self.view.opts['distance'] = distance
@@ -2346,11 +2411,24 @@ class Render3D(QWidget):
                     state['telemetry_data'][race_name] = {}
                     
                     for vehicle_id in vehicles:
+                        # Vehicles restored from a session and never viewed are still column arrays
+                        columns = self.telemetry_loader.embedded_columns.get(f"{race_name}_{vehicle_id}")
+                        if columns:
+                            state['telemetry_data'][race_name][vehicle_id] = columns
+                            continue
+                        
                         # Load the telemetry data for this vehicle
                         df = self.telemetry_loader.get_vehicle_data(vehicle_id, race_id=race_name)
                         if not df.empty:
-                            # Convert to dict for pickling (more efficient than DataFrame)
-                            state['telemetry_data'][race_name][vehicle_id] = df.to_dict('list')
+                            # Store one array per column so the session writer copies raw buffers
+                            columns = {}
+                            for col in df.columns:
+                                series = df[col]
+                                if isinstance(series.dtype, pd.DatetimeTZDtype):
+                                    # tz-aware values would become object arrays; keep UTC datetime64
+                                    series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+                                columns[col] = series.to_numpy()
+                            state['telemetry_data'][race_name][vehicle_id] = columns
                             
                 print(f"Saved telemetry data for {len(state['telemetry_data'])} races")
             except Exception as e:
@@ -2383,21 +2461,13 @@ class Render3D(QWidget):
                     self.telemetry_loader.parsed_folder = None  # Data is embedded, no folder needed
                     self.telemetry_loader.parsed_data_cache = {}
                     
-                    # Restore cached data from embedded telemetry
-                    for race_name, vehicles_data in telemetry_data.items():
-                        for vehicle_id, df_dict in vehicles_data.items():
-                            # Convert back to DataFrame
-                            df = pd.DataFrame(df_dict)
-                            
-                            # Parse datetime if needed
-                            if 'meta_time' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['meta_time']):
-                                try:
-                                    df['meta_time'] = pd.to_datetime(df['meta_time'])
-                                except:
-                                    pass
-                            
-                            cache_key = f"{race_name}_{vehicle_id}"
-                            self.telemetry_loader.parsed_data_cache[cache_key] = df
+                    # Hand the embedded column arrays to the loader; each vehicle becomes a
+                    # DataFrame only when it is first viewed
+                    self.telemetry_loader.embedded_columns = {
+                        f"{race_name}_{vehicle_id}": columns
+                        for race_name, vehicles_data in telemetry_data.items()
+                        for vehicle_id, columns in vehicles_data.items()
+                    }
                     
                     # Populate race selector
                     self.race_selector.clear()
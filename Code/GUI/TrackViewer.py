@@ -2,6 +2,8 @@ from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPathItem, QG
 from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QRectF, QTimer
 from PyQt6.QtGui import QPen, QColor, QPainter, QPainterPath, QBrush, QTransform, QPainterPathStroker
 import math
+import bisect
+import numpy as np
 
 class TrackSegmentItem(QGraphicsPathItem):
     def __init__(self, path, color, width, seg_id, data):
@@ -73,6 +75,7 @@ class TrackViewer(QGraphicsView):
         self.setBackgroundBrush(QBrush(QColor("#0f172a")))  # Slate 900
         
         self.track_items = {}
+        self.edge_groups = []  # [(range of splinePoints indices, left item, right item)]
         self.selected_segment_id = None
         self.finalized = False
         self.fine_tune_mode = False
@@ -88,8 +91,9 @@ class TrackViewer(QGraphicsView):
         self.node_b_marker = None
         
         # In-between nodes selection
-        self.between_nodes_indices = []
+        self.between_nodes_indices = np.empty(0, dtype=np.intp)
         self.between_nodes_markers = []
+        self.selected_indices = np.empty(0, dtype=np.intp)  # Node A, Node B, then in-between nodes
         self.selection_inverted = False  # Track if we're showing the inverted (longer) path
         
         # Turn markers and labels
@@ -159,6 +163,7 @@ class TrackViewer(QGraphicsView):
     def clear(self):
         self.scene.clear()
         self.track_items = {}
+        self.edge_groups = []
         self.selected_segment_id = None
         self.finalized = False
         self.finalized_data = None
@@ -593,10 +598,9 @@ class TrackViewer(QGraphicsView):
             return
         
         spline_points = finalized_data['splinePoints']
-        # Remember where the original track ends before adding pit lanes
-        self.original_track_node_count = len(spline_points)
-        # Remember where the original track ends before adding pit lanes
-        self.original_track_node_count = len(spline_points)
+        # Drop pit nodes from an earlier call so redraws don't append them again
+        track_count = next((i for i, p in enumerate(spline_points) if 'pit_lane' in p), len(spline_points))
+        del spline_points[track_count:]
         # Remember where the original track ends before adding pit lanes
         self.original_track_node_count = len(spline_points)
         
@@ -604,77 +608,83 @@ class TrackViewer(QGraphicsView):
             # Skip main track paths
             if path['id'] in ['s1', 's2', 's3', 'track_full']:
                 continue
-            
-            # Get centerline points (with z-coordinates if available)
-            if 'points' in path and path['points']:
-                # Points already have x, y, z from OSM data
-                centerline = path['points']
+            spline_points.extend(self._pit_lane_boundary_points(path))
+    
+    def _pit_lane_boundary_points(self, path):
+        """Left/right boundary nodes of a pit lane path, tagged with pit_lane"""
+        boundary_points = []
+        # Get centerline points (with z-coordinates if available)
+        if 'points' in path and path['points']:
+            # Points already have x, y, z from OSM data
+            centerline = path['points']
+        else:
+            d_str = path['d']
+            parts = d_str.split(' ')
+            centerline = []
+            if len(parts) >= 3:
+                centerline.append({'x': float(parts[1]), 'y': float(parts[2]), 'z': 0})
+                i = 3
+                while i < len(parts):
+                    if parts[i] == 'L':
+                        centerline.append({'x': float(parts[i+1]), 'y': float(parts[i+2]), 'z': 0})
+                        i += 3
+                    else:
+                        i += 1
+        
+        if len(centerline) < 2:
+            return boundary_points
+        
+        # Resample centerline to 1-meter spacing like the main track
+        resampled_centerline = self._resample_path(centerline, spacing=1.0)
+        
+        width = path.get('widthValue', path.get('width', 12)) / 2
+        
+        # Add left and right boundary points
+        for i, p in enumerate(resampled_centerline):
+            # Calculate perpendicular direction
+            if i < len(resampled_centerline) - 1:
+                dx = resampled_centerline[i+1]['x'] - p['x']
+                dy = resampled_centerline[i+1]['y'] - p['y']
+            elif i > 0:
+                dx = p['x'] - resampled_centerline[i-1]['x']
+                dy = p['y'] - resampled_centerline[i-1]['y']
             else:
-                d_str = path['d']
-                parts = d_str.split(' ')
-                centerline = []
-                if len(parts) >= 3:
-                    centerline.append({'x': float(parts[1]), 'y': float(parts[2]), 'z': 0})
-                    i = 3
-                    while i < len(parts):
-                        if parts[i] == 'L':
-                            centerline.append({'x': float(parts[i+1]), 'y': float(parts[i+2]), 'z': 0})
-                            i += 3
-                        else:
-                            i += 1
+                continue
             
-            if len(centerline) < 2:
+            length = math.sqrt(dx*dx + dy*dy)
+            if length == 0:
                 continue
+            dx /= length
+            dy /= length
             
-            # Resample centerline to 1-meter spacing like the main track
-            resampled_centerline = self._resample_path(centerline, spacing=1.0)
+            # Perpendicular
+            perp_x = -dy
+            perp_y = dx
             
-            width = path.get('widthValue', path.get('width', 12)) / 2
+            # Get elevation from centerline point
+            z = p.get('z', 0)
             
-            # Add left and right boundary points to splinePoints
-            for i, p in enumerate(resampled_centerline):
-                # Calculate perpendicular direction
-                if i < len(resampled_centerline) - 1:
-                    dx = resampled_centerline[i+1]['x'] - p['x']
-                    dy = resampled_centerline[i+1]['y'] - p['y']
-                elif i > 0:
-                    dx = p['x'] - resampled_centerline[i-1]['x']
-                    dy = p['y'] - resampled_centerline[i-1]['y']
-                else:
-                    continue
-                
-                length = math.sqrt(dx*dx + dy*dy)
-                if length == 0:
-                    continue
-                dx /= length
-                dy /= length
-                
-                # Perpendicular
-                perp_x = -dy
-                perp_y = dx
-                
-                # Get elevation from centerline point
-                z = p.get('z', 0)
-                
-                # Add left boundary point
-                spline_points.append({
-                    'x': p['x'] + perp_x * width,
-                    'y': p['y'] + perp_y * width,
-                    'z': z,
-                    'width': path.get('widthValue', path.get('width', 12)),
-                    'pit_lane': path['id'],
-                    'pit_side': 'left'
-                })
-                
-                # Add right boundary point
-                spline_points.append({
-                    'x': p['x'] - perp_x * width,
-                    'y': p['y'] - perp_y * width,
-                    'z': z,
-                    'width': path.get('widthValue', path.get('width', 12)),
-                    'pit_lane': path['id'],
-                    'pit_side': 'right'
-                })
+            # Add left boundary point
+            boundary_points.append({
+                'x': p['x'] + perp_x * width,
+                'y': p['y'] + perp_y * width,
+                'z': z,
+                'width': path.get('widthValue', path.get('width', 12)),
+                'pit_lane': path['id'],
+                'pit_side': 'left'
+            })
+            
+            # Add right boundary point
+            boundary_points.append({
+                'x': p['x'] - perp_x * width,
+                'y': p['y'] - perp_y * width,
+                'z': z,
+                'width': path.get('widthValue', path.get('width', 12)),
+                'pit_lane': path['id'],
+                'pit_side': 'right'
+            })
+        
+        return boundary_points
     
     def _resample_path(self, points, spacing=1.0):
         """Resample a path to have evenly spaced points"""
@@ -773,39 +783,107 @@ class TrackViewer(QGraphicsView):
         groups = []
         if not track_points: return
         
-        current_group = {'points': [], 'color': get_color(0)}
-        
-        for i, p in enumerate(track_points):
-            color = get_color(i)
-            if color != current_group['color']:
-                current_group['points'].append(p) # Connect to next
-                groups.append(current_group)
-                current_group = {'points': [p], 'color': color}
-            else:
-                current_group['points'].append(p)
-        groups.append(current_group)
+        # Groups are contiguous index ranges, kept so edits can redraw just their group
+        start = 0
+        color = get_color(0)
+        for i in range(1, len(track_points)):
+            if get_color(i) != color:
+                groups.append((range(start, i + 1), color)) # Connect to next
+                start = i
+                color = get_color(i)
+        groups.append((range(start, len(track_points)), color))
         
-        for g in groups:
-            self._draw_poly_edges(g['points'], g['color'])
+        for indices, color in groups:
+            self._add_edge_group(indices, color)
         
         # Draw pit lanes as separate segments grouped by pit_lane ID
         if self.fine_tune_mode and pit_points:
             pit_groups = {}
-            for p in pit_points:
+            for i, p in enumerate(pit_points, start=self.original_track_node_count):
                 pit_id = p.get('pit_lane')
                 if pit_id:
                     if pit_id not in pit_groups:
-                        pit_groups[pit_id] = []
-                    pit_groups[pit_id].append(p)
+                        pit_groups[pit_id] = [i, i]
+                    pit_groups[pit_id][1] = i
             
-            # Draw each pit lane segment
-            for pit_id, pit_pts in pit_groups.items():
-                if len(pit_pts) >= 2:
-                    self._draw_poly_edges(pit_pts, "#ff6600")  # Orange for pit lanes
+            # Draw each pit lane segment (each lane's nodes were appended contiguously)
+            for pit_id, (first, last) in pit_groups.items():
+                if last > first:
+                    self._add_edge_group(range(first, last + 1), "#ff6600")  # Orange for pit lanes
+
+    def _add_edge_group(self, indices, color_hex):
+        points = self.finalized_data['splinePoints']
+        items = self._draw_poly_edges([points[i] for i in indices], color_hex)
+        if items:
+            self.edge_groups.append((indices, *items))
+
+    def invalidate_segments(self, indices):
+        """Redraw only the edge groups containing `indices` after their widths changed"""
+        if not self.finalized_data or len(indices) == 0:
+            return
+        
+        points = self.finalized_data['splinePoints']
+        changed = sorted(indices)
+        dirty = QRectF()
+        for group, l_item, r_item in self.edge_groups:
+            pos = bisect.bisect_left(changed, group.start)
+            if pos == len(changed) or changed[pos] >= group.stop:
+                continue
+            dirty = dirty.united(l_item.sceneBoundingRect()).united(r_item.sceneBoundingRect())
+            left_edge, right_edge = self._build_edge_paths([points[i] for i in group])
+            l_item.setPath(left_edge)
+            r_item.setPath(right_edge)
+            dirty = dirty.united(l_item.sceneBoundingRect()).united(r_item.sceneBoundingRect())
+        
+        if not dirty.isEmpty():
+            self.viewport().update(self.mapFromScene(dirty).boundingRect())
+
+    def apply_width_patch(self, indices, new_width):
+        """Set `new_width` on the nodes at `indices` and redraw only the edges they touch"""
+        if not self.finalized_data or len(indices) == 0:
+            return
+        
+        points = self.finalized_data['splinePoints']
+        for i in indices:
+            points[i]['width'] = new_width
+        
+        # Pit boundary nodes sit half the lane width off its centreline, so re-offset
+        # every node of a touched lane (its visualPath width must already be updated)
+        pit_lanes = {points[i]['pit_lane'] for i in indices if 'pit_lane' in points[i]}
+        if pit_lanes:
+            paths = {p['id']: p for p in self.finalized_data.get('visualPaths', []) if p['id'] in pit_lanes}
+            for group, _, _ in self.edge_groups:
+                path = paths.get(points[group.start].get('pit_lane'))
+                if path is None:
+                    continue
+                boundary_points = self._pit_lane_boundary_points(path)
+                if len(boundary_points) == len(group):
+                    points[group.start:group.stop] = boundary_points
+            self._update_node_a_marker()
+            self._update_node_b_marker()
+        
+        self.invalidate_segments(indices)
 
     def _draw_poly_edges(self, points, color_hex):
         if len(points) < 2: return
         
+        left_edge, right_edge = self._build_edge_paths(points)
+        pen = QPen(QColor(color_hex), 2)
+        l_item = QGraphicsPathItem(left_edge)
+        l_item.setPen(pen)
+        self.scene.addItem(l_item)
+        
+        r_item = QGraphicsPathItem(right_edge)
+        r_item.setPen(pen)
+        self.scene.addItem(r_item)
+        
+        # Edges are long antialiased polylines that only change on width edits; keep them
+        # rasterized so marker/turn/pulse repaints on top blit the cache instead of re-stroking
+        for item in (l_item, r_item):
+            item.setCacheMode(QGraphicsPathItem.CacheMode.DeviceCoordinateCache)
+        return l_item, r_item
+
+    def _build_edge_paths(self, points):
         left_edge = QPainterPath()
         right_edge = QPainterPath()
         
@@ -838,15 +916,8 @@ class TrackViewer(QGraphicsView):
             else:
                 left_edge.lineTo(lx, ly)
                 right_edge.lineTo(rx, ry)
-                
-        pen = QPen(QColor(color_hex), 2)
-        l_item = QGraphicsPathItem(left_edge)
-        l_item.setPen(pen)
-        self.scene.addItem(l_item)
         
-        r_item = QGraphicsPathItem(right_edge)
-        r_item.setPen(pen)
-        self.scene.addItem(r_item)
+        return left_edge, right_edge
 
     def _add_finalized_path(self, path_data):
         # Legacy/Pit path drawer using constant width
@@ -895,10 +966,10 @@ class TrackViewer(QGraphicsView):
         
         if same_pit_lane:
             # Pit lanes are linear - just select all nodes between start and end
-            self.between_nodes_indices = list(range(start + 1, end))
+            self.between_nodes_indices = np.arange(start + 1, end)
         elif both_in_pit and not same_pit_lane:
             # Different pit lanes - no in-between nodes
-            self.between_nodes_indices = []
+            self.between_nodes_indices = np.empty(0, dtype=np.intp)
         else:
             # At least one node is on the main track - use circular logic
             # Constrain the circular logic to only the original track nodes
@@ -906,7 +977,7 @@ class TrackViewer(QGraphicsView):
             
             # If one node is in pit and one is on track, no sensible path
             if (start >= track_N) != (end >= track_N):
-                self.between_nodes_indices = []
+                self.between_nodes_indices = np.empty(0, dtype=np.intp)
             else:
                 # Both on main track - use circular path logic
                 direct_distance = end - start
@@ -914,19 +985,21 @@ class TrackViewer(QGraphicsView):
                 if not self.selection_inverted:
                     # Default: use shorter path
                     if direct_distance <= track_N / 2:
-                        self.between_nodes_indices = list(range(start + 1, end))
+                        self.between_nodes_indices = np.arange(start + 1, end)
                     else:
                         # Wrap-around path is shorter
-                        self.between_nodes_indices = list(range(end + 1, track_N)) + list(range(0, start))
+                        self.between_nodes_indices = np.r_[end + 1:track_N, 0:start]
                 else:
                     # Inverted: use longer path
                     if direct_distance <= track_N / 2:
-                        self.between_nodes_indices = list(range(end + 1, track_N)) + list(range(0, start))
+                        self.between_nodes_indices = np.r_[end + 1:track_N, 0:start]
                     else:
-                        self.between_nodes_indices = list(range(start + 1, end))
+                        self.between_nodes_indices = np.arange(start + 1, end)
+        
+        self.selected_indices = np.r_[self.node_a_index, self.node_b_index, self.between_nodes_indices]
         
         # Create markers for in-between nodes
-        for idx in self.between_nodes_indices:
+        for idx in self.between_nodes_indices.tolist():
             if 0 <= idx < len(points):
                 p = points[idx]
                 marker = QGraphicsEllipseItem(p['x'] - 2.5, p['y'] - 2.5, 5, 5)
@@ -947,7 +1020,8 @@ class TrackViewer(QGraphicsView):
         for marker in self.between_nodes_markers:
             self.scene.removeItem(marker)
         self.between_nodes_markers = []
-        self.between_nodes_indices = []
+        self.between_nodes_indices = np.empty(0, dtype=np.intp)
+        self.selected_indices = np.empty(0, dtype=np.intp)
         self.pulse_timer.stop()
     
     def _pulse_animation_step(self):
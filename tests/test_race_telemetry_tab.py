@@ -0,0 +1,44 @@
+"""Smoke tests for the race telemetry tab (run offscreen)"""
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt6")
+pg = pytest.importorskip("pyqtgraph")
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def test_tab_constructs(qapp, monkeypatch):
+    import sys
+    from Code.GUI.RaceTelemetryTab import RaceTelemetryTab
+
+    # Exceptions raised in Qt slots are only reported through the hook
+    errors = []
+    monkeypatch.setattr(sys, "excepthook", lambda *exc_info: errors.append(exc_info))
+
+    tab = RaceTelemetryTab()
+
+    assert not errors
+    assert tab.distance_plots
+    # The gear plot's shift markers are scatters and must not be treated as curves
+    assert tab._distance_curves
+    assert all(isinstance(item, pg.PlotDataItem) for item in tab._distance_curves)
+    assert tab.upshift_scatter not in tab._distance_curves
+    assert tab.speed_curve.opts['autoDownsample']
+    assert tab.speed_curve.opts['clipToView']
+
+
+def test_idle_antialias_survives_new_data(qapp):
+    from Code.GUI.RaceTelemetryTab import RaceTelemetryTab
+
+    tab = RaceTelemetryTab()
+    tab._set_curves_idle(True)
+    tab.speed_curve.setData([0.0, 1.0, 2.0], [10.0, 20.0, 15.0])
+
+    assert tab.speed_curve.curve.opts['antialias']